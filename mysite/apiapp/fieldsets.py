@@ -0,0 +1,215 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+FIELDS_PARAM = 'fields'
+EXCLUDE_PARAM = 'exclude'
+INCLUDE_PARAM = 'include'
+
+
+def parse_field_list(value: str):
+    """
+    Parses a comma separated query parameter into a set of names.
+
+    Args:
+        value (str): The raw parameter value.
+
+    Returns:
+        set: The names, or None if the parameter is missing or empty.
+    """
+    if not value:
+        return None
+    names = {name.strip() for name in value.split(',') if name.strip()}
+    return names or None
+
+
+def check_field_names(param: str, names: set, available):
+    """
+    Rejects names of a sparse fieldset parameter that are not available.
+
+    Args:
+        param (str): The query parameter the names come from.
+        names (set): The requested names.
+        available (Iterable[str]): The names that may be requested.
+
+    Raises:
+        ValidationError: If some names are unknown.
+    """
+    unknown = names - set(available)
+    if unknown:
+        raise ValidationError({param: [f'Unknown fields: {", ".join(sorted(unknown))}.']})
+
+
+class SparseFieldsetsSerializerMixin:
+    """
+    Serializer mixin trimming and expanding fields from the request.
+
+    The `fields` context entry restricts the output to the given field names and
+    the `exclude` context entry removes the given field names. The `include` context entry replaces the related fields listed in
+    `expandable_fields` with nested serializers. Only the top level serializer
+    is affected, nested serializers keep all of their fields. Unknown names are
+    rejected with a 400 response listing them.
+
+    Attributes:
+        expandable_fields (dict): Mapping of field name to the serializer class used to expand it.
+    """
+    expandable_fields = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_sparse_root():
+            return fields
+
+        include = self.context.get(INCLUDE_PARAM) or set()
+        check_field_names(INCLUDE_PARAM, include, set(self.expandable_fields) & set(fields))
+        for name in include & set(self.expandable_fields) & set(fields):
+            field = fields[name]
+            many = isinstance(field, ListSerializer) or hasattr(field, 'child_relation')
+            fields[name] = self.expandable_fields[name](many=many, read_only=True, source=field.source)
+
+        requested = self.context.get(FIELDS_PARAM)
+        if requested:
+            check_field_names(FIELDS_PARAM, requested, fields)
+            fields = {name: field for name, field in fields.items() if name in requested}
+        excluded = self.context.get(EXCLUDE_PARAM)
+        if excluded:
+            check_field_names(EXCLUDE_PARAM, excluded, fields)
+            fields = {name: field for name, field in fields.items() if name not in excluded}
+        return fields
+
+    def _is_sparse_root(self) -> bool:
+        if self.root is self:
+            return True
+        return isinstance(self.parent, ListSerializer) and self.parent is self.root
+
+
+class SparseFieldsetsViewMixin:
+    """
+    View set mixin building the queryset from the requested fields.
+
+    Safe requests read `?fields=`, `?exclude=` and `?include=`, pass them to the serializer and
+    push the projection into SQL: plain columns are loaded with `only()`, expanded
+    foreign keys with `select_related()`, and to-many relations are prefetched only
+    when they are part of the response. Requests without these parameters and write
+    requests use the view's queryset as it is, which should prefetch what the full
+    serializer renders.
+
+    Attributes:
+        always_fetch_fields (tuple): Model fields loaded regardless of the requested ones,
+            e.g. fields needed by the pagination cursor.
+    """
+    always_fetch_fields = ()
+
+    def get_sparse_params(self) -> dict:
+        if self.request is None or self.request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            return {}
+        params = self.request.query_params
+        sparse_params = {
+            FIELDS_PARAM: parse_field_list(params.get(FIELDS_PARAM)),
+            EXCLUDE_PARAM: parse_field_list(params.get(EXCLUDE_PARAM)),
+            INCLUDE_PARAM: parse_field_list(params.get(INCLUDE_PARAM)),
+        }
+        if not any(sparse_params.values()):
+            return {}
+        return sparse_params
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(self.get_sparse_params())
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.get_sparse_params():
+            return queryset
+        return project_queryset(queryset, self.get_serializer().fields.values(), self.always_fetch_fields)
+
+
+def project_queryset(queryset, serializer_fields, always_fetch_fields=()):
+    """
+    Restricts a queryset to the data needed by the given serializer fields.
+
+    Prefetches of the base queryset are replaced by the ones the fields need.
+
+    Args:
+        queryset (QuerySet): The base queryset.
+        serializer_fields (Iterable[Field]): The fields that will be rendered.
+        always_fetch_fields (Iterable[str]): Model fields to load in any case.
+
+    Returns:
+        QuerySet: The projected queryset.
+    """
+    model = queryset.model
+    only = {model._meta.pk.name, *always_fetch_fields}
+    select_related = []
+    prefetches = []
+    can_project = True
+
+    for field in serializer_fields:
+        source = field.source
+        if source == 'pk':
+            continue
+        if source == '*' or '.' in source:
+            can_project = False
+            continue
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            can_project = False
+            continue
+
+        expanded = isinstance(field, BaseSerializer)
+        if model_field.many_to_many or model_field.one_to_many:
+            if expanded:
+                prefetches.append(source)
+            else:
+                related_model = model_field.related_model
+                prefetches.append(Prefetch(source, queryset=related_model.objects.only('pk')))
+        elif model_field.many_to_one or model_field.one_to_one:
+            only.add(source)
+            if expanded:
+                select_related.append(source)
+        else:
+            only.add(source)
+
+    queryset = queryset.prefetch_related(None)
+    if can_project:
+        queryset = queryset.only(*only)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset
+
+
+def sparse_fieldsets_schema(expandable=()):
+    """
+    Documents the sparse fieldset query parameters of a view set in the OpenAPI schema.
+
+    Args:
+        expandable (Iterable[str]): The names of the fields accepted by `?include=`.
+
+    Returns:
+        Callable: The class decorator for the view set.
+    """
+    parameters = [
+        OpenApiParameter(
+            FIELDS_PARAM, str,
+            description='Comma separated list of fields to return, e.g. `pk,name,price`.',
+        ),
+        OpenApiParameter(
+            EXCLUDE_PARAM, str,
+            description='Comma separated list of fields to leave out of the response.',
+        ),
+    ]
+    if expandable:
+        parameters.append(OpenApiParameter(
+            INCLUDE_PARAM, str,
+            description=f'Comma separated list of related objects to expand: {", ".join(expandable)}.',
+        ))
+    return extend_schema_view(
+        list=extend_schema(parameters=parameters),
+        retrieve=extend_schema(parameters=parameters),
+    )
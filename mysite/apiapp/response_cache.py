@@ -0,0 +1,192 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from core.versions import get_version, model_namespace, object_namespace
+
+CACHE_HEADER = 'X-Response-Cache'
+
+
+class LocalResponseCache:
+    """
+    Bounded in-process LRU of rendered responses.
+
+    Attributes:
+        max_entries (int): The number of entries kept before the least recently used is dropped.
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry['expires_at'] <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: dict):
+        if self.max_entries <= 0:
+            return
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+_local = None
+
+
+def get_local_cache() -> LocalResponseCache:
+    global _local
+    if _local is None:
+        _local = LocalResponseCache(getattr(settings, 'RESPONSE_CACHE_LOCAL_ENTRIES', 1000))
+    return _local
+
+
+def get_shared_cache():
+    alias = getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')
+    return caches[alias] if alias else None
+
+
+def response_key(namespace: str, version: str, request) -> str:
+    """
+    Builds the cache key of a rendered response.
+
+    Args:
+        namespace (str): The version namespace the response depends on.
+        version (str): The current version token of the namespace.
+        request (Request): The negotiated request.
+
+    Returns:
+        str: The key, covering the scheme, host, path, sorted query parameters and media type.
+            Scheme and host are part of it as paginated bodies contain absolute URLs.
+    """
+    query = sorted((name, value) for name, values in request.query_params.lists() for value in values)
+    raw = f'{request.scheme}://{request.get_host()}{request.path}|{query}|{request.accepted_media_type}'
+    return f'response:{namespace}:{version}:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def load_response(key: str):
+    """
+    Looks a response up in the in-process cache, then in the shared cache.
+
+    Entries found in the shared cache are copied into the in-process cache.
+
+    Returns:
+        dict: The cached entry, or None.
+    """
+    local = get_local_cache()
+    entry = local.get(key)
+    if entry is not None:
+        return entry
+    shared = get_shared_cache()
+    entry = shared.get(key) if shared is not None else None
+    if entry is not None and entry['expires_at'] > time.time():
+        local.set(key, entry)
+        return entry
+    return None
+
+
+def store_response(key: str, response):
+    """
+    Stores the rendered bytes, status and headers of a response in both tiers.
+    """
+    timeout = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60 * 5)
+    entry = {
+        'expires_at': time.time() + timeout,
+        'status': response.status_code,
+        'content': response.content,
+        'headers': [(header, value) for header, value in response.items() if header != CACHE_HEADER],
+    }
+    get_local_cache().set(key, entry)
+    shared = get_shared_cache()
+    if shared is not None:
+        shared.set(key, entry, timeout)
+
+
+def entry_to_response(entry: dict) -> HttpResponse:
+    response = HttpResponse(entry['content'], status=entry['status'])
+    for header, value in entry['headers']:
+        response[header] = value
+    return response
+
+
+class CachedResponseMixin:
+    """
+    View set mixin serving `list` and `retrieve` GETs from a cache of rendered bytes.
+
+    The lookup runs inside the action, i.e. after authentication, throttling and
+    content negotiation, and a hit is returned without touching the database, the
+    serializer or the renderer. Entries are keyed by scheme, host, path, query
+    parameters and negotiated media type, and by the version of the model (lists) or
+    of the object (details), so saving an instance of a model listed in VERSIONED_MODELS
+    makes the affected entries unreachable. They are kept in a bounded in-process LRU in front
+    of the `RESPONSE_CACHE_ALIAS` cache shared by the workers.
+
+    Attributes:
+        cached_actions (tuple): The actions whose responses are cached.
+        cached_formats (tuple): The renderer formats that are cached; the browsable API
+            embeds per-user data and is never cached.
+    """
+    cached_actions = ('list', 'retrieve')
+    cached_formats = ('json',)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_action(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_action(super().retrieve, request, *args, **kwargs)
+
+    def get_response_cache_namespace(self) -> str:
+        model = self.queryset.model
+        if self.action == 'retrieve':
+            lookup = self.lookup_url_kwarg or self.lookup_field
+            return object_namespace(model, self.kwargs[lookup])
+        return model_namespace(model)
+
+    def get_response_cache_key(self, request):
+        if not getattr(settings, 'RESPONSE_CACHE_ENABLED', True):
+            return None
+        if self.action not in self.cached_actions or request.method not in ('GET', 'HEAD'):
+            return None
+        if request.accepted_renderer.format not in self.cached_formats:
+            return None
+        namespace = self.get_response_cache_namespace()
+        return response_key(namespace, get_version(namespace), request)
+
+    def cached_action(self, handler, request, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+        entry = load_response(key)
+        if entry is not None:
+            response = entry_to_response(entry)
+            response[CACHE_HEADER] = 'HIT'
+            return response
+        self.response_cache_key = key
+        return handler(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, 'response_cache_key', None)
+        if key is not None and response.status_code == 200 and not response.cookies:
+            response.render()
+            store_response(key, response)
+            response[CACHE_HEADER] = 'MISS'
+        return response
@@ -0,0 +1,198 @@
+import logging
+import random
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS throttle_bucket (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    allowed INTEGER NOT NULL,
+    updated REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# Refills the bucket for the elapsed time and takes one token if there is one.
+# The right hand sides see the old row, so `allowed` and `tokens` agree.
+TAKE_SQL = """
+INSERT INTO throttle_bucket (key, tokens, allowed, updated) VALUES (:key, :capacity - 1, 1, :now)
+ON CONFLICT (key) DO UPDATE SET
+    tokens = CASE
+        WHEN min(:capacity, tokens + max(:now - updated, 0) * :rate) >= 1
+        THEN min(:capacity, tokens + max(:now - updated, 0) * :rate) - 1
+        ELSE min(:capacity, tokens + max(:now - updated, 0) * :rate)
+    END,
+    allowed = min(:capacity, tokens + max(:now - updated, 0) * :rate) >= 1,
+    updated = :now
+RETURNING tokens, allowed
+"""
+
+
+def parse_rate(rate: str):
+    """
+    Parses a DRF style rate such as '100/min' into a bucket capacity and refill rate.
+
+    Args:
+        rate (str): The number of requests and the period (s, m, h or d prefixed).
+
+    Returns:
+        tuple: The capacity in tokens and the refill rate in tokens per second.
+    """
+    number, period = rate.split('/')
+    capacity = int(number)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class TokenBucketStore:
+    """
+    Token buckets kept in a small SQLite file shared by all worker processes.
+
+    Every check is a single UPSERT ... RETURNING on a primary key, so it costs one
+    local write without a network round trip. Connections are kept per thread.
+
+    Attributes:
+        path (str): The path of the SQLite file.
+    """
+    purge_probability = 0.001
+    purge_after = 86400
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=0.1, isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = OFF')
+            connection.execute(SCHEMA)
+            self.local.connection = connection
+        return connection
+
+    def take(self, key: str, capacity: int, rate: float):
+        """
+        Takes one token from a bucket.
+
+        Args:
+            key (str): The bucket key.
+            capacity (int): The maximum number of tokens.
+            rate (float): The tokens added per second.
+
+        Returns:
+            tuple: Whether a token was taken and the seconds until the next one is available.
+        """
+        now = time.time()
+        tokens, allowed = self.connection.execute(
+            TAKE_SQL, {'key': key, 'capacity': capacity, 'rate': rate, 'now': now},
+        ).fetchone()
+        if random.random() < self.purge_probability:
+            self.purge(now - self.purge_after)
+        return bool(allowed), 0.0 if allowed else (1 - tokens) / rate
+
+    def purge(self, before: float):
+        self.connection.execute('DELETE FROM throttle_bucket WHERE updated < ?', (before,))
+
+
+_store = None
+
+
+def get_store() -> TokenBucketStore:
+    global _store
+    if _store is None:
+        _store = TokenBucketStore(settings.THROTTLE_DB_PATH)
+    return _store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Base class of the token bucket throttles.
+
+    The rate of the `scope` is read from DEFAULT_THROTTLE_RATES, e.g. '100/min' allows
+    bursts of 100 requests and refills 100 tokens per minute. Subclasses implement
+    `get_cache_key()`; returning None skips the throttle. When the store is not
+    available requests are let through.
+
+    Attributes:
+        scope (str): The key of the rate in DEFAULT_THROTTLE_RATES.
+    """
+    scope = None
+
+    def __init__(self):
+        self._wait = None
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError('.get_cache_key() must be overridden')
+
+    def get_rate(self, view):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def allow_request(self, request, view):
+        rate = self.get_rate(view)
+        key = self.get_cache_key(request, view) if rate else None
+        if key is None:
+            return True
+
+        capacity, refill = parse_rate(rate)
+        try:
+            allowed, self._wait = get_store().take(f'{self.scope}:{key}', capacity, refill)
+        except sqlite3.Error:
+            logger.warning('Throttle store unavailable, letting the request through', exc_info=True)
+            return True
+        return allowed
+
+    def wait(self):
+        return self._wait
+
+
+class AnonTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limits anonymous requests per client IP, scope `anon`.
+    """
+    scope = 'anon'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.get_ident(request)
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limits authenticated requests per user, scope `user`.
+    """
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return request.user.pk
+        return None
+
+
+class ScopedTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limits requests per route class, using the `throttle_scope` of the view.
+
+    Each user, or each IP for anonymous clients, gets its own bucket per scope.
+    """
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, 'throttle_scope', None)
+        if not self.scope:
+            return True
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return f'ip:{self.get_ident(request)}'
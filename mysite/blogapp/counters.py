@@ -0,0 +1,45 @@
+from django.apps import apps as global_apps
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+
+def recount_counters(apps=global_apps):
+    """
+    Recomputes the article counters of every tag and category in two UPDATE statements.
+
+    Args:
+        apps: The app registry to take the models from, so migrations can pass their historical one.
+    """
+    Article = apps.get_model('blogapp', 'Article')
+    Category = apps.get_model('blogapp', 'Category')
+    Tag = apps.get_model('blogapp', 'Tag')
+    ArticleTag = Article.tags.through
+
+    tag_counts = (
+        ArticleTag.objects
+        .filter(tag_id=OuterRef('pk'))
+        .values('tag_id')
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    category_counts = (
+        Article.objects
+        .filter(category_id=OuterRef('pk'))
+        .values('category_id')
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    Tag.objects.update(article_count=Coalesce(Subquery(tag_counts), 0))
+    Category.objects.update(article_count=Coalesce(Subquery(category_counts), 0))
+
+
+def change_count(queryset, delta: int):
+    """
+    Atomically adds delta to the article counter of every object in the queryset.
+
+    Args:
+        queryset (QuerySet): The tags or categories to update.
+        delta (int): The change of the counter, may be negative.
+    """
+    if delta:
+        queryset.update(article_count=Greatest(F('article_count') + delta, Value(0)))
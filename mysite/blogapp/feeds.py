@@ -0,0 +1,145 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date, parse_http_date_safe
+from django.utils.translation import gettext_lazy as _
+
+from core.versions import get_version
+from .models import Article, Category, Tag
+from .signals import BLOG_VERSION
+
+FEED_SIZE = getattr(settings, 'BLOG_FEED_SIZE', 20)
+FEED_CACHE_TIMEOUT = getattr(settings, 'BLOG_FEED_CACHE_TIMEOUT', 60 * 60)
+
+
+class LatestArticlesFeed(Feed):
+    """
+    RSS feed of the latest blog articles.
+
+    Items only load the excerpt and the author/category names, never the full content.
+    """
+    title = _('Blog')
+    description = _('Latest blog articles')
+
+    def link(self):
+        return reverse('blog')
+
+    def get_articles(self, obj):
+        return (
+            Article.objects
+            .select_related('author', 'category')
+            .defer('content')
+            .order_by('-pub_date', '-pk')
+        )
+
+    def items(self, obj):
+        return self.get_articles(obj)[:FEED_SIZE]
+
+    def item_title(self, item: Article):
+        return item.title
+
+    def item_description(self, item: Article):
+        return item.excerpt
+
+    def item_link(self, item: Article):
+        return item.get_absolute_url()
+
+    def item_pubdate(self, item: Article):
+        return item.pub_date
+
+    def item_author_name(self, item: Article):
+        return item.author.name
+
+    def item_categories(self, item: Article):
+        return [item.category.name]
+
+
+class LatestArticlesAtomFeed(LatestArticlesFeed):
+    """
+    Atom feed of the latest blog articles.
+    """
+    feed_type = Atom1Feed
+    subtitle = LatestArticlesFeed.description
+
+
+class CategoryArticlesFeed(LatestArticlesFeed):
+    """
+    RSS feed of the latest articles of a category.
+    """
+    def get_object(self, request, pk):
+        return get_object_or_404(Category, pk=pk)
+
+    def title(self, obj: Category):
+        return obj.name
+
+    def link(self, obj: Category):
+        return reverse('blog_category_details', kwargs={'pk': obj.pk})
+
+    def get_articles(self, obj: Category):
+        return super().get_articles(obj).filter(category=obj)
+
+
+class TagArticlesFeed(LatestArticlesFeed):
+    """
+    RSS feed of the latest articles with a tag.
+    """
+    def get_object(self, request, pk):
+        return get_object_or_404(Tag, pk=pk)
+
+    def title(self, obj: Tag):
+        return obj.name
+
+    def link(self, obj: Tag):
+        return reverse('blog_tag_details', kwargs={'pk': obj.pk})
+
+    def get_articles(self, obj: Tag):
+        return super().get_articles(obj).filter(tags=obj)
+
+
+def cached_feed(feed: Feed):
+    """
+    Wraps a feed into a view serving cached feed bytes with conditional GET support.
+
+    The rendered feed is cached under the blog version, so it is rebuilt only after
+    an article, tag, author or category changes. Polls carrying a matching ETag or
+    If-Modified-Since get a 304 answered from the cache without any ORM work.
+
+    Args:
+        feed (Feed): The feed instance to serve.
+
+    Returns:
+        Callable: The view function.
+    """
+    def view(request, *args, **kwargs):
+        # The query string does not change the feed, so it is left out of the key.
+        key = f'blog:feed:{get_version(BLOG_VERSION)}:{request.get_host()}{request.path}'
+        entry = cache.get(key)
+        if entry is None:
+            response = feed(request, *args, **kwargs)
+            entry = {
+                'content': response.content,
+                'content_type': response['Content-Type'],
+                'etag': f'"{hashlib.md5(response.content).hexdigest()}"',
+                'last_modified': response.get('Last-Modified'),
+            }
+            cache.set(key, entry, FEED_CACHE_TIMEOUT)
+
+        last_modified = parse_http_date_safe(entry['last_modified']) if entry['last_modified'] else None
+        not_modified = get_conditional_response(request, etag=entry['etag'], last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+        response['ETag'] = entry['etag']
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    return view
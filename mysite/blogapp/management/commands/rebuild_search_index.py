@@ -0,0 +1,28 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from blogapp.search import rebuild_index
+
+
+class Command(BaseCommand):
+    """
+    Management command for rebuilding the blog full-text search index.
+
+    This command reindexes every article in primary key chunks.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the management command.
+
+        Args:
+            args: The positional arguments for the command.
+            options: The options for the command.
+        """
+        self.stdout.write('Rebuild search index')
+        total = rebuild_index(options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed articles: {total}'))
@@ -0,0 +1,28 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from blogapp.counters import recount_counters
+from core.versions import bump_version
+from blogapp.signals import BLOG_VERSION
+
+
+class Command(BaseCommand):
+    """
+    Management command for repairing the tag and category article counters.
+
+    This command recomputes every counter from the article/tag links in bulk.
+    """
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the management command.
+
+        Args:
+            args: The positional arguments for the command.
+            options: The options for the command.
+        """
+        self.stdout.write('Recount blog counters')
+        recount_counters()
+        bump_version(BLOG_VERSION)
+        self.stdout.write(self.style.SUCCESS('Blog counters recounted'))
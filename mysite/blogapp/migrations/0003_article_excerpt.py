@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-10-19 10:37
+
+from django.db import migrations, models
+
+
+def fill_excerpts(apps, schema_editor):
+    from blogapp.models import make_excerpt
+
+    Article = apps.get_model('blogapp', 'Article')
+    articles = list(Article.objects.only('pk', 'content'))
+    for article in articles:
+        article.excerpt = make_excerpt(article.content)
+    Article.objects.bulk_update(articles, ['excerpt'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0002_alter_category_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-pub_date', '-id'], name='article_pub_date_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.0.6 on 2026-10-19 10:37
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_tags(apps, schema_editor):
+    Tag = apps.get_model('blogapp', 'Tag')
+    ArticleTag = apps.get_model('blogapp', 'Article').tags.through
+
+    duplicates = (
+        Tag.objects
+        .values('name')
+        .annotate(keep_pk=Min('pk'), total=Count('pk'))
+        .filter(total__gt=1)
+    )
+    for duplicate in duplicates:
+        extra_tags = Tag.objects.filter(name=duplicate['name']).exclude(pk=duplicate['keep_pk'])
+        tagged_articles = set(
+            ArticleTag.objects.filter(tag_id=duplicate['keep_pk']).values_list('article_id', flat=True)
+        )
+        for row in ArticleTag.objects.filter(tag__in=extra_tags):
+            if row.article_id not in tagged_articles:
+                ArticleTag.objects.create(article_id=row.article_id, tag_id=duplicate['keep_pk'])
+                tagged_articles.add(row.article_id)
+        extra_tags.delete()
+
+
+def fill_counters(apps, schema_editor):
+    from blogapp.counters import recount_counters
+
+    recount_counters(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0003_article_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(merge_duplicate_tags, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='tag',
+            name='name',
+            field=models.CharField(max_length=20, unique=True),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def create_search_table(apps, schema_editor):
+    from blogapp.search import CREATE_SEARCH_TABLE_SQL
+
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(CREATE_SEARCH_TABLE_SQL)
+        schema_editor.execute(
+            'INSERT INTO article_search (rowid, title, content, tags, author) '
+            'SELECT article.id, article.title, article.content, '
+            "COALESCE((SELECT group_concat(tag.name, ' ') FROM article_tags "
+            'JOIN tag ON tag.id = article_tags.tag_id WHERE article_tags.article_id = article.id), %s), '
+            'author.name FROM article JOIN author ON author.id = article.author_id',
+            params=[''],
+        )
+
+
+def drop_search_table(apps, schema_editor):
+    from blogapp.search import DROP_SEARCH_TABLE_SQL
+
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(DROP_SEARCH_TABLE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0004_tag_category_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -1,4 +1,25 @@
 from django.db import models
+from django.urls import reverse
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+EXCERPT_WORDS = 40
+EXCERPT_MAX_LENGTH = 300
+
+
+def make_excerpt(content: str) -> str:
+    """
+    Builds the short plain text preview of an article's content.
+
+    Args:
+        content (str): The full content of the article.
+
+    Returns:
+        str: The excerpt, at most EXCERPT_MAX_LENGTH characters long.
+    """
+    words = Truncator(strip_tags(content)).words(EXCERPT_WORDS)
+    return Truncator(words).chars(EXCERPT_MAX_LENGTH)
+
 
 class Author(models.Model):
     """
@@ -23,8 +44,10 @@ class Category(models.Model):
 
     Attributes:
         name (CharField): The name of the category.
+        article_count (PositiveIntegerField): The denormalized number of articles in the category.
     """
     name = models.CharField(max_length=40, unique=True)
+    article_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
@@ -38,8 +61,10 @@ class Tag(models.Model):
 
     Attributes:
         name (CharField): The name of the tag.
+        article_count (PositiveIntegerField): The denormalized number of articles with the tag.
     """
-    name = models.CharField(max_length=20)
+    name = models.CharField(max_length=20, unique=True)
+    article_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
@@ -54,6 +79,7 @@ class Article(models.Model):
     Attributes:
         title (CharField): The title of the article.
         content (TextField): The content of the article.
+        excerpt (CharField): The precomputed preview of the content, maintained on save.
         pub_date (DateTimeField): The publication date of the article.
         author (ForeignKey): The author of the article.
         category (ForeignKey): The category of the article.
@@ -61,6 +87,7 @@ class Article(models.Model):
     """
     title = models.CharField(max_length=200)
     content = models.TextField()
+    excerpt = models.CharField(max_length=EXCERPT_MAX_LENGTH, blank=True, editable=False)
     pub_date = models.DateTimeField(auto_now_add=True)
     author = models.ForeignKey(Author, on_delete=models.CASCADE)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
@@ -69,5 +96,18 @@ class Article(models.Model):
     def __str__(self):
         return self.title
 
+    def get_absolute_url(self):
+        return reverse('blog_article_details', kwargs={'pk': self.pk})
+
+    def save(self, *args, **kwargs):
+        self.excerpt = make_excerpt(self.content)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'excerpt'}
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'article'
+        indexes = [
+            models.Index(fields=['-pub_date', '-id'], name='article_pub_date_idx'),
+        ]
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ArticleCursorPagination(CursorPagination):
+    """
+    Cursor pagination of articles by publication date, newest first.
+
+    Every page is one index range scan on pub_date, whatever its depth.
+    """
+    ordering = ('-pub_date', '-pk')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,198 @@
+import re
+
+from django.db import connection
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .models import Article
+
+SEARCH_TABLE = 'article_search'
+
+# Relative bm25 weights of the indexed columns: title, content, tags, author.
+SEARCH_WEIGHTS = (10.0, 1.0, 5.0, 3.0)
+
+SNIPPET_TOKENS = 24
+
+_HIGHLIGHT_START = '\x02'
+_HIGHLIGHT_END = '\x03'
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+CREATE_SEARCH_TABLE_SQL = (
+    f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} '
+    f'USING fts5(title, content, tags, author, tokenize="unicode61 remove_diacritics 2")'
+)
+DROP_SEARCH_TABLE_SQL = f'DROP TABLE IF EXISTS {SEARCH_TABLE}'
+
+
+def search_supported() -> bool:
+    """
+    Returns whether the database supports the full-text index (SQLite FTS5).
+    """
+    return connection.vendor == 'sqlite'
+
+
+def build_match_query(query: str) -> str:
+    """
+    Converts user input into a safe FTS5 MATCH expression.
+
+    Every word is quoted, so FTS5 operators typed by users are treated as text.
+    The last word is matched as a prefix to support search-as-you-type.
+
+    Args:
+        query (str): The raw search query.
+
+    Returns:
+        str: The MATCH expression, empty if the query has no words.
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return ''
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def index_articles(article_pks):
+    """
+    Adds or refreshes the search index rows of the given articles.
+
+    Args:
+        article_pks (Iterable[int]): The primary keys of the articles.
+    """
+    article_pks = list(article_pks)
+    if not article_pks or not search_supported():
+        return
+
+    articles = (
+        Article.objects
+        .filter(pk__in=article_pks)
+        .select_related('author')
+        .prefetch_related('tags')
+        .only('pk', 'title', 'content', 'author__name')
+    )
+    rows = [
+        (
+            article.pk,
+            article.title,
+            article.content,
+            ' '.join(tag.name for tag in article.tags.all()),
+            article.author.name,
+        )
+        for article in articles
+    ]
+    with connection.cursor() as cursor:
+        _delete_rows(cursor, article_pks)
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, title, content, tags, author) VALUES (%s, %s, %s, %s, %s)',
+            rows,
+        )
+
+
+def remove_articles(article_pks):
+    """
+    Removes the given articles from the search index.
+
+    Args:
+        article_pks (Iterable[int]): The primary keys of the articles.
+    """
+    article_pks = list(article_pks)
+    if not article_pks or not search_supported():
+        return
+    with connection.cursor() as cursor:
+        _delete_rows(cursor, article_pks)
+
+
+def _delete_rows(cursor, article_pks):
+    placeholders = ', '.join(['%s'] * len(article_pks))
+    cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})', article_pks)
+
+
+def rebuild_index(chunk_size: int = 1000) -> int:
+    """
+    Rebuilds the whole search index, reading articles in primary key chunks.
+
+    Args:
+        chunk_size (int): The number of articles indexed per chunk.
+
+    Returns:
+        int: The number of indexed articles.
+    """
+    if not search_supported():
+        return 0
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+
+    total = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            Article.objects
+            .filter(pk__gt=last_pk)
+            .order_by('pk')
+            .values_list('pk', flat=True)[:chunk_size]
+        )
+        if not pks:
+            break
+        index_articles(pks)
+        total += len(pks)
+        last_pk = pks[-1]
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+    return total
+
+
+def search_articles(query: str, limit: int = 20, offset: int = 0) -> list:
+    """
+    Searches articles ranked by bm25 relevance.
+
+    Args:
+        query (str): The raw search query.
+        limit (int): The maximum number of results.
+        offset (int): The number of results to skip.
+
+    Returns:
+        list: Dicts with the pk, title, highlighted snippet and rank of every match.
+    """
+    match = build_match_query(query)
+    if not match:
+        return []
+    if not search_supported():
+        return _fallback_search(query, limit, offset)
+
+    weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+    sql = (
+        f'SELECT rowid, title, '
+        f"snippet({SEARCH_TABLE}, -1, %s, %s, '…', {SNIPPET_TOKENS}), "
+        f'bm25({SEARCH_TABLE}, {weights}) AS rank '
+        f'FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s '
+        f'ORDER BY rank LIMIT %s OFFSET %s'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [_HIGHLIGHT_START, _HIGHLIGHT_END, match, limit, offset])
+        rows = cursor.fetchall()
+
+    return [
+        {'pk': pk, 'title': title, 'snippet': _highlight(snippet), 'rank': rank}
+        for pk, title, snippet, rank in rows
+    ]
+
+
+def _highlight(snippet: str) -> str:
+    html = escape(snippet)
+    html = html.replace(_HIGHLIGHT_START, '<mark>').replace(_HIGHLIGHT_END, '</mark>')
+    return mark_safe(html)
+
+
+def _fallback_search(query: str, limit: int, offset: int) -> list:
+    articles = (
+        Article.objects
+        .filter(title__icontains=query)
+        .order_by('-pub_date')
+        .only('pk', 'title', 'excerpt')[offset:offset + limit]
+    )
+    return [
+        {'pk': article.pk, 'title': article.title, 'snippet': escape(article.excerpt), 'rank': 0}
+        for article in articles
+    ]
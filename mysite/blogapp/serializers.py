@@ -0,0 +1,107 @@
+from rest_framework import serializers
+
+from apiapp.fieldsets import SparseFieldsetsSerializerMixin
+from .models import Article, Author, Category, Tag
+
+
+class AuthorSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Author model.
+
+    Attributes:
+        pk (IntegerField): The primary key of the author.
+        name (CharField): The name of the author.
+        bio (CharField): The biography of the author.
+    """
+    class Meta:
+        model = Author
+        fields = 'pk', 'name', 'bio'
+
+
+class CategorySerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Category model.
+
+    Attributes:
+        pk (IntegerField): The primary key of the category.
+        name (CharField): The name of the category.
+        article_count (IntegerField): The number of articles in the category.
+    """
+    class Meta:
+        model = Category
+        fields = 'pk', 'name', 'article_count'
+        read_only_fields = 'article_count',
+
+
+class TagSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Tag model.
+
+    Attributes:
+        pk (IntegerField): The primary key of the tag.
+        name (CharField): The name of the tag.
+        article_count (IntegerField): The number of articles with the tag.
+    """
+    class Meta:
+        model = Tag
+        fields = 'pk', 'name', 'article_count'
+        read_only_fields = 'article_count',
+
+
+class ArticleSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Article model.
+
+    The author, category and tags are rendered as primary keys unless they are
+    expanded with `?include=`.
+
+    Attributes:
+        pk (IntegerField): The primary key of the article.
+        title (CharField): The title of the article.
+        excerpt (CharField): The precomputed preview of the content.
+        content (CharField): The content of the article.
+        pub_date (DateTimeField): The publication date of the article.
+        author (PrimaryKeyRelatedField): The author of the article.
+        category (PrimaryKeyRelatedField): The category of the article.
+        tags (PrimaryKeyRelatedField): The tags of the article.
+    """
+    expandable_fields = {
+        'author': AuthorSerializer,
+        'category': CategorySerializer,
+        'tags': TagSerializer,
+    }
+
+    class Meta:
+        model = Article
+        fields = 'pk', 'title', 'excerpt', 'content', 'pub_date', 'author', 'category', 'tags'
+        read_only_fields = 'excerpt', 'pub_date'
+
+
+class ArticleSearchResultSerializer(serializers.Serializer):
+    """
+    Serializer for one ranked article search result.
+
+    Attributes:
+        pk (IntegerField): The primary key of the article.
+        title (CharField): The title of the article.
+        snippet (CharField): The HTML snippet with highlighted matches.
+        rank (FloatField): The bm25 rank of the match, lower is better.
+    """
+    pk = serializers.IntegerField()
+    title = serializers.CharField()
+    snippet = serializers.CharField()
+    rank = serializers.FloatField()
+
+
+class ArticleSearchSerializer(serializers.Serializer):
+    """
+    Serializer for a page of article search results.
+
+    Attributes:
+        query (CharField): The search query.
+        page (IntegerField): The number of the page.
+        results (ArticleSearchResultSerializer): The ranked matches.
+    """
+    query = serializers.CharField()
+    page = serializers.IntegerField()
+    results = ArticleSearchResultSerializer(many=True)
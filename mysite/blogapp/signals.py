@@ -0,0 +1,171 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from core.versions import bump_version
+from .counters import change_count
+from .models import Article, Author, Category, Tag
+from .search import index_articles, remove_articles
+
+BLOG_VERSION = 'blog'
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def blog_changed(sender, **kwargs):
+    """
+    Invalidates cached blog pages when an article or its related data changes.
+    """
+    bump_version(BLOG_VERSION)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def article_tags_changed(sender, action, **kwargs):
+    """
+    Invalidates cached blog pages when tags are attached to or removed from articles.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_version(BLOG_VERSION)
+
+
+@receiver(pre_save, sender=Article)
+def remember_article_category(sender, instance, raw, **kwargs):
+    """
+    Remembers the stored category of an article before it is saved.
+    """
+    instance._previous_category_id = None
+    if instance.pk and not instance._state.adding and not raw:
+        instance._previous_category_id = (
+            Article.objects.filter(pk=instance.pk).values_list('category_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Article)
+def update_category_counters(sender, instance, created, raw, **kwargs):
+    """
+    Keeps the category article counters in sync with saved articles.
+    """
+    previous_category_id = getattr(instance, '_previous_category_id', None)
+    if created:
+        change_count(Category.objects.filter(pk=instance.category_id), 1)
+    elif previous_category_id is not None and previous_category_id != instance.category_id:
+        change_count(Category.objects.filter(pk=previous_category_id), -1)
+        change_count(Category.objects.filter(pk=instance.category_id), 1)
+
+
+@receiver(pre_delete, sender=Article)
+def remember_article_tags(sender, instance, **kwargs):
+    """
+    Remembers the tags of an article, as deleting it removes the tag links without m2m_changed.
+    """
+    instance._deleted_tag_ids = list(instance.tags.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Article)
+def release_article_counters(sender, instance, **kwargs):
+    """
+    Decrements the counters of the category and tags of a deleted article.
+    """
+    change_count(Category.objects.filter(pk=instance.category_id), -1)
+    tag_ids = getattr(instance, '_deleted_tag_ids', None)
+    if tag_ids:
+        change_count(Tag.objects.filter(pk__in=tag_ids), -1)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_tag_counters(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keeps the tag article counters in sync with the article/tag links.
+    """
+    if action in ('pre_clear', 'pre_remove'):
+        # Only links that actually exist are removed, remember them before they are gone.
+        related = instance.article.all() if reverse else instance.tags.all()
+        if action == 'pre_remove':
+            related = related.filter(pk__in=pk_set)
+        instance._removed_pks = set(related.values_list('pk', flat=True))
+        return
+
+    if action in ('post_clear', 'post_remove'):
+        pk_set, delta = getattr(instance, '_removed_pks', set()), -1
+    elif action == 'post_add':
+        delta = 1
+    else:
+        return
+
+    if not pk_set:
+        return
+    if reverse:
+        change_count(Tag.objects.filter(pk=instance.pk), delta * len(pk_set))
+    else:
+        change_count(Tag.objects.filter(pk__in=pk_set), delta)
+
+
+@receiver(post_save, sender=Article)
+def index_article(sender, instance, raw, **kwargs):
+    """
+    Refreshes the search index row of a saved article.
+    """
+    if not raw:
+        index_articles([instance.pk])
+
+
+@receiver(post_delete, sender=Article)
+def unindex_article(sender, instance, **kwargs):
+    """
+    Removes a deleted article from the search index.
+    """
+    remove_articles([instance.pk])
+
+
+@receiver(post_save, sender=Author)
+def reindex_author_articles(sender, instance, created, raw, **kwargs):
+    """
+    Refreshes the search index rows of the articles of a renamed author.
+    """
+    if not created and not raw:
+        index_articles(instance.article_set.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Tag)
+def reindex_tag_articles(sender, instance, created, raw, **kwargs):
+    """
+    Refreshes the search index rows of the articles of a renamed tag.
+    """
+    if not created and not raw:
+        index_articles(instance.article.values_list('pk', flat=True))
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def reindex_tagged_articles(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Refreshes the search index rows of articles whose tags changed.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        index_articles([instance.pk])
+    elif action == 'post_clear':
+        index_articles(getattr(instance, '_removed_pks', ()))
+    elif pk_set:
+        index_articles(pk_set)
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_tag_articles(sender, instance, **kwargs):
+    """
+    Remembers the articles of a tag, as deleting it removes the links without m2m_changed.
+    """
+    instance._tagged_article_pks = list(instance.article.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def reindex_untagged_articles(sender, instance, **kwargs):
+    """
+    Refreshes the search index rows of the articles of a deleted tag.
+    """
+    index_articles(getattr(instance, '_tagged_article_pks', ()))
@@ -1,3 +1,35 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Article, Author, Category
+
+
+class ArticleAPISparseFieldsetsTestCase(TestCase):
+    """
+    The article API only accepts the names of existing fields in `?fields=` and `?include=`.
+    """
+    url = '/en/blog/api/articles/'
+
+    @classmethod
+    def setUpTestData(cls):
+        author = Author.objects.create(name='Author')
+        category = Category.objects.create(name='Category')
+        Article.objects.create(title='Title', content='Content', author=author, category=category)
+
+    def test_requested_fields_are_returned(self):
+        response = self.client.get(self.url, {'fields': 'pk,title'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()['results'][0]), {'pk', 'title'})
+
+    def test_unknown_fields_are_rejected(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'fields': 'title,nonexistent,other'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Unknown fields: nonexistent, other.']})
+
+    def test_unknown_includes_are_rejected(self):
+        response = self.client.get(self.url, {'include': 'author,content'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'include': ['Unknown fields: content.']})
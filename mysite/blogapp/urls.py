@@ -1,7 +1,48 @@
-from django.urls import path
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
 
-from .views import BlogListView
+from .feeds import (
+    cached_feed,
+    LatestArticlesFeed,
+    LatestArticlesAtomFeed,
+    CategoryArticlesFeed,
+    TagArticlesFeed,
+)
+from .views import (
+    BlogListView,
+    ArticleDetailsView,
+    TagListView,
+    TagDetailsView,
+    CategoryListView,
+    CategoryDetailsView,
+    BlogSearchView,
+    BlogSearchAPIView,
+    ArticleSetView,
+    AuthorSetView,
+    CategorySetView,
+    TagSetView,
+)
+
+routers = DefaultRouter()
+routers.root_view_name = 'blog-api-root'
+
+routers.register('articles', ArticleSetView)
+routers.register('authors', AuthorSetView)
+routers.register('categories', CategorySetView)
+routers.register('tags', TagSetView)
 
 urlpatterns = [
-    path('', BlogListView.as_view(), name='blog')
-]
\ No newline at end of file
+    path('', BlogListView.as_view(), name='blog'),
+    path('articles/<int:pk>/', ArticleDetailsView.as_view(), name='blog_article_details'),
+    path('tags/', TagListView.as_view(), name='blog_tags'),
+    path('tags/<int:pk>/', TagDetailsView.as_view(), name='blog_tag_details'),
+    path('categories/', CategoryListView.as_view(), name='blog_categories'),
+    path('categories/<int:pk>/', CategoryDetailsView.as_view(), name='blog_category_details'),
+    path('feed/', cached_feed(LatestArticlesFeed()), name='blog_feed'),
+    path('feed/atom/', cached_feed(LatestArticlesAtomFeed()), name='blog_feed_atom'),
+    path('categories/<int:pk>/feed/', cached_feed(CategoryArticlesFeed()), name='blog_category_feed'),
+    path('tags/<int:pk>/feed/', cached_feed(TagArticlesFeed()), name='blog_tag_feed'),
+    path('search/', BlogSearchView.as_view(), name='blog_search'),
+    path('api/search/', BlogSearchAPIView.as_view(), name='blog_search_api'),
+    path('api/', include(routers.urls)),
+]
@@ -1,26 +1,367 @@
-from django.shortcuts import render
-from django.views.generic import ListView
+import base64
+from datetime import datetime
 
-from .models import Article
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch, Q
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.utils.translation import get_language
+from django.views.generic import DetailView, ListView, TemplateView
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.permissions import DjangoModelPermissionsOrAnonReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.viewsets import ModelViewSet
 
-class BlogListView(ListView):
+from apiapp.fieldsets import SparseFieldsetsViewMixin, sparse_fieldsets_schema
+
+from core.versions import get_version
+from .models import Article, Author, Category, Tag
+from .pagination import ArticleCursorPagination
+from .search import search_articles
+from .serializers import (
+    ArticleSerializer,
+    ArticleSearchSerializer,
+    AuthorSerializer,
+    CategorySerializer,
+    TagSerializer,
+)
+from .signals import BLOG_VERSION
+
+BLOG_PAGE_SIZE = getattr(settings, 'BLOG_PAGE_SIZE', 10)
+BLOG_CACHE_TIMEOUT = getattr(settings, 'BLOG_CACHE_TIMEOUT', 60 * 15)
+BLOG_SEARCH_PAGE_SIZE = getattr(settings, 'BLOG_SEARCH_PAGE_SIZE', 20)
+BLOG_SEARCH_MAX_PAGE = getattr(settings, 'BLOG_SEARCH_MAX_PAGE', 50)
+
+
+def encode_cursor(article: Article) -> str:
+    """
+    Encodes the keyset position of an article into an opaque cursor.
+
+    Args:
+        article (Article): The last article of a page.
+
+    Returns:
+        str: The cursor pointing right after the article.
+    """
+    raw = f'{article.pub_date.isoformat()}|{article.pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Decodes a cursor created by encode_cursor.
+
+    Args:
+        cursor (str): The opaque cursor.
+
+    Returns:
+        tuple: The publication date and primary key of the last seen article.
+
+    Raises:
+        Http404: If the cursor is malformed.
+    """
+    try:
+        pub_date, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(pub_date), int(pk)
+    except ValueError:
+        raise Http404('Invalid cursor')
+
+
+class BlogListView(TemplateView):
     """
     View for displaying a list of blog articles.
 
-    This view retrieves a queryset of articles with related data pre-fetched and passes it to the template
-    for rendering.
+    Articles are paginated by a (pub_date, pk) keyset cursor, so every page costs one
+    index range scan regardless of its depth. List queries defer the full content and
+    show the precomputed excerpt instead. The rendered list of a page is cached per
+    cursor and language, and invalidated whenever the blog version changes.
 
     Attributes:
-        queryset (QuerySet): The queryset of articles with related data pre-fetched.
         template_name (str): The template to render for the blog list view.
+        page_template_name (str): The template of the cached list fragment.
+        page_size (int): The number of articles per page.
+    """
+    template_name = 'blogapp/blog-list.html'
+    page_template_name = 'blogapp/blog-list-page.html'
+    page_size = BLOG_PAGE_SIZE
+
+    def get_cache_prefix(self) -> str:
+        return 'all'
+
+    def get_queryset(self):
+        return (
+            Article.objects
+            .select_related('author')
+            .select_related('category')
+            .prefetch_related('tags')
+            .defer('content')
+            .order_by('-pub_date', '-pk')
+        )
+
+    def get_page(self, cursor: str) -> tuple:
+        """
+        Fetches the articles of one page.
+
+        Args:
+            cursor (str): The cursor of the page, or None for the first page.
+
+        Returns:
+            tuple: The list of articles and the cursor of the next page or None.
+        """
+        queryset = self.get_queryset()
+        if cursor:
+            pub_date, pk = decode_cursor(cursor)
+            queryset = queryset.filter(Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, pk__lt=pk))
+
+        articles = list(queryset[:self.page_size + 1])
+        next_cursor = None
+        if len(articles) > self.page_size:
+            articles = articles[:self.page_size]
+            next_cursor = encode_cursor(articles[-1])
+        return articles, next_cursor
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['articles_page'] = self.render_page(self.request.GET.get('cursor'))
+        return context
+
+    def render_page(self, cursor: str) -> str:
+        """
+        Returns the rendered article list of a page, from the cache when possible.
+
+        Args:
+            cursor (str): The cursor of the page, or None for the first page.
+
+        Returns:
+            str: The rendered HTML fragment.
+        """
+        key = (
+            f'blog:list:{get_version(BLOG_VERSION)}:{self.get_cache_prefix()}:'
+            f'{get_language()}:{cursor or ""}'
+        )
+        fragment = cache.get(key)
+        if fragment is None:
+            articles, next_cursor = self.get_page(cursor)
+            fragment = render_to_string(
+                self.page_template_name,
+                {'articles': articles, 'next_cursor': next_cursor},
+            )
+            cache.set(key, fragment, BLOG_CACHE_TIMEOUT)
+        return fragment
+
+
+class ArticleDetailsView(DetailView):
+    """
+    View for displaying a single article, the target of the feed items.
+
+    Attributes:
+        template_name (str): The template to render for the article details view.
+        queryset (QuerySet): The articles with their author, category and tags.
+        context_object_name (str): The variable name to use in the template for the article.
+    """
+    template_name = 'blogapp/article-details.html'
+    queryset = Article.objects.select_related('author', 'category').prefetch_related('tags')
+    context_object_name = 'article'
+
+
+class TagListView(ListView):
+    """
+    View for displaying the tag cloud.
+
+    Tags are listed with their denormalized article counters, so no aggregation
+    over the article/tag links is needed.
+
+    Attributes:
+        template_name (str): The template to render for the tag list view.
+        queryset (QuerySet): The tags ordered by their article counters.
         context_object_name (str): The variable name to use in the template for the queryset.
     """
-    queryset = (
-        Article.objects
-        .select_related('author')
-        .select_related('category')
-        .prefetch_related('tags')
+    template_name = 'blogapp/tag-list.html'
+    queryset = Tag.objects.order_by('-article_count', 'name')
+    context_object_name = 'tags'
+
+
+class CategoryListView(ListView):
+    """
+    View for displaying the list of categories with their article counters.
+
+    Attributes:
+        template_name (str): The template to render for the category list view.
+        queryset (QuerySet): The categories ordered by their article counters.
+        context_object_name (str): The variable name to use in the template for the queryset.
+    """
+    template_name = 'blogapp/category-list.html'
+    queryset = Category.objects.order_by('-article_count', 'name')
+    context_object_name = 'categories'
+
+
+class TagDetailsView(BlogListView):
+    """
+    View for displaying the articles with a given tag.
+
+    Attributes:
+        template_name (str): The template to render for the tag details view.
+    """
+    template_name = 'blogapp/tag-details.html'
+
+    def get_cache_prefix(self) -> str:
+        return f'tag-{self.kwargs["pk"]}'
+
+    def get_queryset(self):
+        return super().get_queryset().filter(tags=self.kwargs['pk'])
+
+    def get_context_data(self, **kwargs):
+        kwargs['tag'] = get_object_or_404(Tag, pk=self.kwargs['pk'])
+        return super().get_context_data(**kwargs)
+
+
+class CategoryDetailsView(BlogListView):
+    """
+    View for displaying the articles of a given category.
+
+    Attributes:
+        template_name (str): The template to render for the category details view.
+    """
+    template_name = 'blogapp/category-details.html'
+
+    def get_cache_prefix(self) -> str:
+        return f'category-{self.kwargs["pk"]}'
+
+    def get_queryset(self):
+        return super().get_queryset().filter(category=self.kwargs['pk'])
+
+    def get_context_data(self, **kwargs):
+        kwargs['category'] = get_object_or_404(Category, pk=self.kwargs['pk'])
+        return super().get_context_data(**kwargs)
+
+
+def _search_page(request) -> tuple:
+    # Like Django's Paginator, pages past the last one are not found.
+    query = request.GET.get('q', '').strip()
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+    if page > BLOG_SEARCH_MAX_PAGE:
+        raise Http404('Invalid page.')
+    results = search_articles(query, BLOG_SEARCH_PAGE_SIZE, (page - 1) * BLOG_SEARCH_PAGE_SIZE)
+    if page > 1 and not results:
+        raise Http404('Invalid page.')
+    return query, page, results
+
+
+class BlogSearchView(TemplateView):
+    """
+    View for searching blog articles.
+
+    Results come from the full-text index over titles, content, tag names and
+    author names, ranked by bm25 with highlighted snippets.
+
+    Attributes:
+        template_name (str): The template to render for the search page.
+    """
+    template_name = 'blogapp/blog-search.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query, page, results = _search_page(self.request)
+        context.update({
+            'query': query,
+            'page': page,
+            'results': results,
+            'has_next': len(results) == BLOG_SEARCH_PAGE_SIZE,
+        })
+        return context
+
+
+class BlogSearchAPIView(APIView):
+    """
+    API view for searching blog articles.
+
+    Accepts the `q` and `page` query parameters and returns the ranked matches.
+    """
+    throttle_scope = 'search'
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', str, description='The search query.'),
+            OpenApiParameter('page', int, description='The number of the results page.'),
+        ],
+        responses=ArticleSearchSerializer,
     )
+    def get(self, request):
+        query, page, results = _search_page(request)
+        return Response({
+            'query': query,
+            'page': page,
+            'results': results,
+        })
 
-    template_name = 'blogapp/blog-list.html'
-    context_object_name = 'articles'
+
+@sparse_fieldsets_schema(expandable=('author', 'category', 'tags'))
+class ArticleSetView(SparseFieldsetsViewMixin, ModelViewSet):
+    """
+    A view set for interacting with the article resource.
+
+    Supports `?fields=` to select the rendered fields and `?include=author,category,tags`
+    to expand related objects. The queryset only loads what the response needs, and
+    lists are cursor paginated by publication date.
+
+    Attributes:
+        queryset (QuerySet): The queryset representing all articles in the database.
+        serializer_class (Serializer): The serializer class used to serialize/deserialize
+            article instances.
+    """
+    queryset = Article.objects.prefetch_related(Prefetch('tags', queryset=Tag.objects.only('pk')))
+    serializer_class = ArticleSerializer
+    pagination_class = ArticleCursorPagination
+    permission_classes = [DjangoModelPermissionsOrAnonReadOnly]
+    always_fetch_fields = ('pub_date',)
+
+
+@sparse_fieldsets_schema()
+class AuthorSetView(SparseFieldsetsViewMixin, ModelViewSet):
+    """
+    A view set for interacting with the author resource.
+
+    Attributes:
+        queryset (QuerySet): The queryset representing all authors in the database.
+        serializer_class (Serializer): The serializer class used to serialize/deserialize
+            author instances.
+    """
+    queryset = Author.objects.order_by('pk')
+    serializer_class = AuthorSerializer
+    permission_classes = [DjangoModelPermissionsOrAnonReadOnly]
+
+
+@sparse_fieldsets_schema()
+class CategorySetView(SparseFieldsetsViewMixin, ModelViewSet):
+    """
+    A view set for interacting with the category resource.
+
+    Attributes:
+        queryset (QuerySet): The queryset representing all categories in the database.
+        serializer_class (Serializer): The serializer class used to serialize/deserialize
+            category instances.
+    """
+    queryset = Category.objects.order_by('pk')
+    serializer_class = CategorySerializer
+    permission_classes = [DjangoModelPermissionsOrAnonReadOnly]
+
+
+@sparse_fieldsets_schema()
+class TagSetView(SparseFieldsetsViewMixin, ModelViewSet):
+    """
+    A view set for interacting with the tag resource.
+
+    Attributes:
+        queryset (QuerySet): The queryset representing all tags in the database.
+        serializer_class (Serializer): The serializer class used to serialize/deserialize
+            tag instances.
+    """
+    queryset = Tag.objects.order_by('pk')
+    serializer_class = TagSerializer
+    permission_classes = [DjangoModelPermissionsOrAnonReadOnly]
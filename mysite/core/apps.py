@@ -0,0 +1,21 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from .db import configure_sqlite_connection
+        from .signals import connect_versioned_models
+
+        connection_created.connect(configure_sqlite_connection, dispatch_uid='core-sqlite-pragmas')
+        connect_versioned_models()
+
+        if getattr(settings, 'TEMPLATE_PROFILING', False):
+            from . import template_profiler
+
+            template_profiler.install()
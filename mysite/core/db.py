@@ -0,0 +1,110 @@
+import functools
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connections, DEFAULT_DB_ALIAS, OperationalError, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -64000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+BUSY_ERRORS = ('database is locked', 'database table is locked', 'database is busy')
+
+
+def get_sqlite_pragmas() -> dict:
+    return getattr(settings, 'SQLITE_PRAGMAS', DEFAULT_SQLITE_PRAGMAS)
+
+
+def apply_pragmas(cursor, pragmas: dict):
+    """
+    Executes PRAGMA statements on a DB-API cursor.
+
+    Args:
+        cursor: A sqlite3 or Django cursor.
+        pragmas (dict): Mapping of pragma name to value.
+    """
+    for name, value in pragmas.items():
+        cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """
+    Applies the SQLITE_PRAGMAS profile to every new SQLite connection.
+
+    Connected to the `connection_created` signal in CoreConfig.ready(). Replica
+    connections are additionally made read-only.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor, get_sqlite_pragmas())
+        if connection.alias in getattr(settings, 'DATABASE_REPLICAS', []):
+            apply_pragmas(cursor, {'query_only': 1})
+
+
+def is_busy_error(exc: Exception) -> bool:
+    return isinstance(exc, OperationalError) and any(message in str(exc) for message in BUSY_ERRORS)
+
+
+def retry_on_busy(func=None, *, retries: int = 5, base_delay: float = 0.02, using: str = DEFAULT_DB_ALIAS):
+    """
+    Runs a function in a transaction, retrying it with backoff when the database is busy.
+
+    SQLite reports SQLITE_BUSY when a write transaction cannot get the write lock in
+    time, e.g. when a deferred transaction has to upgrade its read lock. The whole
+    transaction is retried with exponential backoff and jitter. Inside an outer
+    transaction the function is only run once, as retrying it alone is not safe.
+    Errors raised once the transaction committed, e.g. by `on_commit` hooks, are
+    never retried, as that would run the committed function a second time.
+
+    Usage::
+
+        @retry_on_busy
+        def place_order(...): ...
+
+        @retry_on_busy(retries=10)
+        def place_order(...): ...
+
+    Args:
+        func (Callable): The function to wrap.
+        retries (int): The maximum number of retries.
+        base_delay (float): The delay before the first retry in seconds.
+        using (str): The database alias of the transaction.
+
+    Returns:
+        Callable: The wrapped function.
+    """
+    if func is None:
+        return functools.partial(retry_on_busy, retries=retries, base_delay=base_delay, using=using)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if connections[using].in_atomic_block:
+            return func(*args, **kwargs)
+
+        attempt = 0
+        while True:
+            committed = []
+            try:
+                with transaction.atomic(using=using):
+                    # Registered first, so it runs before the hooks added by the function.
+                    transaction.on_commit(lambda: committed.append(True), using=using)
+                    return func(*args, **kwargs)
+            except OperationalError as exc:
+                if committed or not is_busy_error(exc) or attempt >= retries:
+                    raise
+                delay = base_delay * 2 ** attempt * (1 + random.random())
+                attempt += 1
+                logger.info('Database busy in %s, retry %s in %.3fs', func.__qualname__, attempt, delay)
+                time.sleep(delay)
+
+    return wrapper
@@ -0,0 +1,158 @@
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.core.management import BaseCommand
+
+from core.db import BUSY_ERRORS, apply_pragmas, get_sqlite_pragmas
+
+SCHEMA = """
+CREATE TABLE bench_product (id INTEGER PRIMARY KEY, name TEXT, price REAL, stock INTEGER);
+CREATE TABLE bench_order (id INTEGER PRIMARY KEY, product_id INTEGER, quantity INTEGER, created_at REAL);
+CREATE INDEX bench_order_product ON bench_order (product_id);
+"""
+
+
+class Command(BaseCommand):
+    """
+    Command to benchmark a concurrent read/write mix on a scratch SQLite file.
+
+    Each profile runs the same workload: worker threads with their own connection run
+    either an order write (insert plus stock update) or a read (join and aggregate).
+    The `default` profile uses SQLite defaults, `tuned` applies SQLITE_PRAGMAS.
+
+    Usage:
+    python manage.py bench_sqlite [--threads 8] [--seconds 5] [--write-ratio 0.2] [--profile tuned]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Number of concurrent connections.')
+        parser.add_argument('--seconds', type=float, default=5, help='Duration of each run.')
+        parser.add_argument('--write-ratio', type=float, action='append', dest='write_ratios',
+                            help='Share of write operations, can be repeated. Defaults to 0.05, 0.2 and 0.5.')
+        parser.add_argument('--profile', choices=['default', 'tuned'], action='append', dest='profiles',
+                            help='Pragma profile, can be repeated. Defaults to both.')
+        parser.add_argument('--products', type=int, default=1000, help='Number of rows to seed.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        profiles = options['profiles'] or ['default', 'tuned']
+        write_ratios = options['write_ratios'] or [0.05, 0.2, 0.5]
+
+        self.stdout.write(
+            f'{"profile":<8} {"writes":>6} {"ops/s":>9} {"reads/s":>9} {"writes/s":>9} '
+            f'{"busy":>6} {"p50 ms":>8} {"p99 ms":>8}'
+        )
+        for write_ratio in write_ratios:
+            for profile in profiles:
+                pragmas = get_sqlite_pragmas() if profile == 'tuned' else {}
+                result = self.run_profile(pragmas, write_ratio, options)
+                self.stdout.write(
+                    f'{profile:<8} {write_ratio:>6.0%} {result["ops"]:>9.0f} {result["reads"]:>9.0f} '
+                    f'{result["writes"]:>9.0f} {result["busy"]:>6} {result["p50_ms"]:>8.2f} {result["p99_ms"]:>8.2f}'
+                )
+
+    def run_profile(self, pragmas: dict, write_ratio: float, options: dict) -> dict:
+        """
+        Runs the workload once against a fresh database file.
+
+        Args:
+            pragmas (dict): The pragmas applied to every connection.
+            write_ratio (float): The share of write operations.
+            options (dict): The command options.
+
+        Returns:
+            dict: Throughput per second, the number of busy errors and latency percentiles.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bench.sqlite3')
+            self.seed(path, pragmas, options['products'])
+
+            stop = threading.Event()
+            results = []
+            workers = [
+                threading.Thread(target=self.worker, args=(path, pragmas, write_ratio, options['products'], stop, results))
+                for _ in range(options['threads'])
+            ]
+            started = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            time.sleep(options['seconds'])
+            stop.set()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for result in results for latency in result['latencies'])
+        reads = sum(result['reads'] for result in results)
+        writes = sum(result['writes'] for result in results)
+        return {
+            'ops': (reads + writes) / elapsed,
+            'reads': reads / elapsed,
+            'writes': writes / elapsed,
+            'busy': sum(result['busy'] for result in results),
+            'p50_ms': statistics.median(latencies) * 1000 if latencies else 0,
+            'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+        }
+
+    def seed(self, path: str, pragmas: dict, products: int):
+        connection = sqlite3.connect(path)
+        apply_pragmas(connection, pragmas)
+        connection.executescript(SCHEMA)
+        connection.executemany(
+            'INSERT INTO bench_product (name, price, stock) VALUES (?, ?, ?)',
+            ((f'Product {number}', random.uniform(1, 100), 1_000_000) for number in range(products)),
+        )
+        connection.commit()
+        connection.close()
+
+    def worker(self, path, pragmas, write_ratio, products, stop, results):
+        # timeout=0 leaves busy handling to the busy_timeout pragma, as in the tuned profile.
+        connection = sqlite3.connect(path, timeout=0, isolation_level=None)
+        apply_pragmas(connection, pragmas)
+        result = {'reads': 0, 'writes': 0, 'busy': 0, 'latencies': []}
+
+        while not stop.is_set():
+            product_id = random.randint(1, products)
+            started = time.perf_counter()
+            try:
+                if random.random() < write_ratio:
+                    connection.execute('BEGIN')
+                    connection.execute(
+                        'INSERT INTO bench_order (product_id, quantity, created_at) VALUES (?, 1, ?)',
+                        (product_id, time.time()),
+                    )
+                    connection.execute('UPDATE bench_product SET stock = stock - 1 WHERE id = ?', (product_id,))
+                    connection.execute('COMMIT')
+                    result['writes'] += 1
+                else:
+                    connection.execute(
+                        'SELECT p.name, count(o.id), sum(o.quantity) FROM bench_product p '
+                        'LEFT JOIN bench_order o ON o.product_id = p.id WHERE p.id = ? GROUP BY p.id',
+                        (product_id,),
+                    ).fetchall()
+                    result['reads'] += 1
+            except sqlite3.OperationalError as exc:
+                if not any(message in str(exc) for message in BUSY_ERRORS):
+                    raise
+                if connection.in_transaction:
+                    connection.execute('ROLLBACK')
+                result['busy'] += 1
+                continue
+            result['latencies'].append(time.perf_counter() - started)
+
+        connection.close()
+        results.append(result)
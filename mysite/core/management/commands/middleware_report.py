@@ -0,0 +1,45 @@
+from django.core.management import BaseCommand
+
+from core import middleware_profiler
+
+
+class Command(BaseCommand):
+    """
+    Command to print the middleware cost percentiles collected by MIDDLEWARE_PROFILING.
+
+    Usage:
+    python manage.py middleware_report [--route api/] [--reset]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--route', default='', help='Only show routes starting with this prefix.')
+        parser.add_argument('--reset', action='store_true', help='Clear the samples after the report.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        rows = [row for row in middleware_profiler.report() if row['route'].startswith(options['route'])]
+        if not rows:
+            self.stdout.write('No samples, run the workers with MIDDLEWARE_PROFILING=1.')
+
+        self.stdout.write(
+            f'{"route":<30} {"middleware":<55} {"count":>6} '
+            f'{"before p50/p90/p99 ms":>24} {"after p50/p90/p99 ms":>24}'
+        )
+        for row in rows:
+            before = f'{row["before_p50_ms"]:.2f}/{row["before_p90_ms"]:.2f}/{row["before_p99_ms"]:.2f}'
+            after = f'{row["after_p50_ms"]:.2f}/{row["after_p90_ms"]:.2f}/{row["after_p99_ms"]:.2f}'
+            self.stdout.write(
+                f'{row["route"][:30]:<30} {row["middleware"][:55]:<55} {row["count"]:>6} {before:>24} {after:>24}'
+            )
+
+        if options['reset']:
+            middleware_profiler.reset()
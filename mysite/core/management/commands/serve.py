@@ -0,0 +1,107 @@
+import os
+
+from django.core.management import BaseCommand, CommandError
+
+
+def default_workers() -> int:
+    """
+    Returns the worker count for the cores this process may run on (2 * cores + 1).
+
+    WEB_CONCURRENCY overrides the computed value.
+    """
+    if os.environ.get('WEB_CONCURRENCY'):
+        return int(os.environ['WEB_CONCURRENCY'])
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return 2 * cores + 1
+
+
+def post_fork(server, worker):
+    # Connections opened while preloading in the master must not be shared with the workers.
+    from django.db import connections
+
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    """
+    Command to serve the project with gunicorn, the production entry point.
+
+    The app is loaded once in the master (including the template warm-up of
+    mysite.wsgi) and forked into the workers. Workers are recycled after
+    --max-requests requests with jitter, and SIGTERM drains in-flight requests for
+    up to --graceful-timeout seconds before exiting.
+
+    Usage:
+    python manage.py serve [--bind 0.0.0.0:8000] [--workers 5] [--asgi]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bind', default=os.environ.get('BIND', '0.0.0.0:8000'), help='Address to listen on.')
+        parser.add_argument('--workers', type=int, default=default_workers(),
+                            help='Number of worker processes, defaults to 2 * cores + 1.')
+        parser.add_argument('--threads', type=int, default=1, help='Threads per sync worker.')
+        parser.add_argument('--max-requests', type=int, default=1000,
+                            help='Restart a worker after this many requests, 0 disables recycling.')
+        parser.add_argument('--max-requests-jitter', type=int, default=100,
+                            help='Random extra requests per worker so they do not restart together.')
+        parser.add_argument('--timeout', type=int, default=30, help='Kill workers silent for this many seconds.')
+        parser.add_argument('--graceful-timeout', type=int, default=30,
+                            help='Seconds to finish in-flight requests after SIGTERM.')
+        parser.add_argument('--keep-alive', type=int, default=5, help='Seconds to keep idle connections open.')
+        parser.add_argument('--asgi', action='store_true', help='Serve mysite.asgi with uvicorn workers.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            raise CommandError('gunicorn is not installed, run `pip install gunicorn`.')
+
+        if options['asgi']:
+            try:
+                import uvicorn.workers  # noqa: F401
+            except ImportError:
+                raise CommandError('--asgi needs uvicorn, run `pip install uvicorn`.')
+            app_path, worker_class = 'mysite.asgi:application', 'uvicorn.workers.UvicornWorker'
+        else:
+            app_path, worker_class = 'mysite.wsgi:application', 'gthread' if options['threads'] > 1 else 'sync'
+
+        config = {
+            'bind': options['bind'],
+            'workers': options['workers'],
+            'threads': options['threads'],
+            'worker_class': worker_class,
+            'preload_app': True,
+            'max_requests': options['max_requests'],
+            'max_requests_jitter': options['max_requests_jitter'],
+            'timeout': options['timeout'],
+            'graceful_timeout': options['graceful_timeout'],
+            'keepalive': options['keep_alive'],
+            'accesslog': '-',
+            'post_fork': post_fork,
+        }
+
+        class Application(BaseApplication):
+            def load_config(self):
+                for key, value in config.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                from gunicorn.util import import_app
+
+                return import_app(app_path)
+
+        self.stdout.write(f'Serving {app_path} on {options["bind"]} with {options["workers"]} {worker_class} workers')
+        Application().run()
@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Command to report where worker startup time goes.
+
+    This command boots the project in a fresh interpreter with `-X importtime`
+    and prints the slowest module imports and the setup time of every app.
+
+    Usage:
+    python manage.py startup_report [--production] [--limit 25]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=25, help='Number of slowest imports to show.')
+        parser.add_argument(
+            '--production',
+            action='store_true',
+            help='Measure with DJANGO_DEBUG=0, as production workers start.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'mysite.settings'))
+        if options['production']:
+            env['DJANGO_DEBUG'] = '0'
+
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-m', 'core.startup'],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode:
+            raise CommandError(process.stderr[-2000:])
+
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        imports = parse_importtime(process.stderr)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Startup phases (DEBUG={result["debug"]})'))
+        for phase in ('settings_ms', 'setup_ms', 'wsgi_handler_ms', 'urlconf_ms', 'template_warmup_ms', 'total_ms'):
+            self.stdout.write(f'  {phase[:-3]:<20} {result[phase]:>10.1f} ms')
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Apps'))
+        self.stdout.write(f'  {"app":<20} {"create":>10} {"models":>10} {"ready":>10}')
+        for label, timings in result['apps'].items():
+            self.stdout.write(
+                f'  {label:<20} {timings.get("create_ms", 0):>10.1f} '
+                f'{timings.get("import_models_ms", 0):>10.1f} {timings.get("ready_ms", 0):>10.1f}'
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Slowest imports (cumulative, top {options["limit"]})'))
+        for module, self_us, cumulative_us in imports[:options['limit']]:
+            self.stdout.write(f'  {module:<50} {cumulative_us / 1000:>10.1f} ms  (self {self_us / 1000:.1f} ms)')
+
+
+def parse_importtime(output: str) -> list:
+    """
+    Parses the `-X importtime` report into top level package timings.
+
+    Args:
+        output (str): The stderr of the measured interpreter.
+
+    Returns:
+        list: Tuples of module name, self and cumulative microseconds, slowest first.
+    """
+    rows = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        # Nested imports are indented, their time is already part of a top level entry.
+        if len(name) - len(name.lstrip()) > 1:
+            continue
+        package = name.strip().split('.')[0]
+        _, total_self, total_cumulative = rows.get(package, (package, 0, 0))
+        rows[package] = (package, total_self + self_us, total_cumulative + cumulative_us)
+    return sorted(rows.values(), key=lambda row: row[2], reverse=True)
@@ -0,0 +1,57 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Command to copy the primary SQLite database into the local replica files.
+
+    Uses the SQLite online backup API, so the primary stays writable during the copy.
+    Meant for development, where a second SQLite file stands in for a replica.
+
+    Usage:
+    python manage.py sync_replica [--interval 1]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=0,
+                            help='Keep syncing every N seconds instead of syncing once.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        primary = settings.DATABASES['default']
+        replicas = [settings.DATABASES[alias] for alias in settings.DATABASE_REPLICAS]
+        if not replicas:
+            raise CommandError('No replicas configured, set DJANGO_REPLICA_DB.')
+        if any(db['ENGINE'] != 'django.db.backends.sqlite3' for db in [primary, *replicas]):
+            raise CommandError('sync_replica only copies SQLite databases.')
+
+        while True:
+            start = time.perf_counter()
+            for replica in replicas:
+                self.copy(str(primary['NAME']), str(replica['NAME']))
+            self.stdout.write(f'Synced {len(replicas)} replica(s) in {(time.perf_counter() - start) * 1000:.1f} ms')
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def copy(self, source_path: str, target_path: str):
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
@@ -0,0 +1,148 @@
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest
+from django.utils.cache import get_conditional_response, has_vary_header, patch_vary_headers
+from django.utils.http import parse_http_date_safe
+
+from . import page_cache, replicas, template_profiler
+
+
+class TemplateProfilerMiddleware:
+    """
+    Middleware reporting the template render share of every response.
+
+    Adds a `Server-Timing` header with the time spent rendering templates and the
+    total time spent below this middleware. Only active when TEMPLATE_PROFILING is on.
+    """
+    def __init__(self, get_response):
+        if not getattr(settings, 'TEMPLATE_PROFILING', False):
+            raise MiddlewareNotUsed
+        template_profiler.install()
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        token = template_profiler.start_request()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+            if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+                response.render()
+        finally:
+            template_time = template_profiler.finish_request(token)
+        total = time.perf_counter() - start
+        response['Server-Timing'] = f'template;dur={template_time * 1000:.2f}, total;dur={total * 1000:.2f}'
+        return response
+
+
+class AnonymousPageCacheMiddleware:
+    """
+    Middleware serving whole pages to anonymous visitors from the cache.
+
+    Only GET/HEAD requests to language prefixed URLs listed in PAGE_CACHE_SECTIONS
+    without session, messages or authorization credentials are cached. Pages are
+    keyed by URL, language and the request headers listed in their `Vary` header, and
+    tagged with the versions of their section, so a write bumping one of those
+    versions purges exactly the affected section.
+
+    Expired or outdated pages are regenerated by a single request holding a lock,
+    while concurrent requests keep getting the stale copy. Cached pages answer
+    conditional requests with 304 like the views do. Responses that set cookies, use
+    the CSRF token, vary on cookies or are marked private are never stored.
+    """
+    def __init__(self, get_response):
+        if not getattr(settings, 'PAGE_CACHE_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.bypass_cookies = {settings.SESSION_COOKIE_NAME, 'messages'}
+
+    def __call__(self, request: HttpRequest):
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        language, path = page_cache.split_language(request.path_info)
+        namespaces = page_cache.section_namespaces(path) if language else None
+        if namespaces is None:
+            return self.get_response(request)
+
+        key = page_cache.page_key(language, request.get_full_path())
+        token = page_cache.versions_token(namespaces)
+        variant = page_cache.variant_key(key, request, page_cache.load_vary(key))
+        entry = page_cache.load_page(variant)
+        if entry is not None:
+            if page_cache.is_fresh(entry, token):
+                return self.cached_response(request, entry, 'HIT')
+            if not page_cache.acquire_regeneration(variant):
+                return self.cached_response(request, entry, 'STALE')
+        elif not page_cache.acquire_regeneration(variant):
+            return self.get_response(request)
+
+        try:
+            response = self.get_response(request)
+            headers = page_cache.vary_headers(response)
+            if headers is not None and self.is_cacheable_response(request, response):
+                patch_vary_headers(response, ('Cookie',))
+                page_cache.store_vary(key, headers)
+                page_cache.store_page(page_cache.variant_key(key, request, headers), token, response)
+                response['X-Page-Cache'] = 'MISS'
+        finally:
+            page_cache.release_regeneration(variant)
+        return response
+
+    def is_cacheable_request(self, request: HttpRequest) -> bool:
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        if 'HTTP_AUTHORIZATION' in request.META:
+            return False
+        return not self.bypass_cookies & set(request.COOKIES)
+
+    def is_cacheable_response(self, request: HttpRequest, response) -> bool:
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return False
+        if request.META.get('CSRF_COOKIE_NEEDS_UPDATE') or request.META.get('CSRF_COOKIE_USED'):
+            return False
+        # E.g. the page read the session, so its content may depend on the visitor.
+        if has_vary_header(response, 'Cookie'):
+            return False
+        cache_control = response.get('Cache-Control', '')
+        return 'private' not in cache_control and 'no-store' not in cache_control
+
+    def cached_response(self, request: HttpRequest, entry: dict, status: str):
+        response = page_cache.entry_to_response(entry)
+        response = get_conditional_response(
+            request,
+            etag=response.get('ETag'),
+            last_modified=parse_http_date_safe(response.get('Last-Modified')),
+            response=response,
+        )
+        response['X-Page-Cache'] = status
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Middleware routing the reads of safe requests to the read replicas.
+
+    A request that writes to the primary sets a short lived cookie pinning the client
+    to the primary for REPLICA_PIN_SECONDS, so it reads its own writes while the
+    replicas catch up. Only active when DATABASE_REPLICAS is configured.
+    """
+    safe_methods = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        if not replicas.replica_aliases():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.cookie_name = getattr(settings, 'REPLICA_PIN_COOKIE', 'pin_primary')
+        self.pin_seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+    def __call__(self, request: HttpRequest):
+        use_replica = request.method in self.safe_methods and self.cookie_name not in request.COOKIES
+        with replicas.read_from_replicas(use_replica), replicas.track_writes() as wrote:
+            response = self.get_response(request)
+            if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+                response.render()
+            if wrote():
+                response.set_cookie(self.cookie_name, '1', max_age=self.pin_seconds, httponly=True, samesite='Lax')
+        return response
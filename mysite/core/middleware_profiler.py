@@ -0,0 +1,178 @@
+"""
+Opt-in cost profiler for the configured middleware.
+
+With MIDDLEWARE_PROFILING on, settings replace every MIDDLEWARE entry with
+``core.middleware_profiler.<dotted__path>``. Importing such a name builds a
+wrapper class around the original middleware that measures the time it spends
+before calling the next layer and after it returns, per route.
+
+Samples are kept per worker and periodically published to the shared cache, where
+the `middleware_report` command and the /__perf__/middleware/ view read them.
+"""
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+MAX_SAMPLES = 1000
+PUBLISH_INTERVAL = 5
+WORKERS_KEY = 'middleware-profile:workers'
+WORKER_KEY = 'middleware-profile:{pid}'
+PUBLISH_TIMEOUT = 60 * 60 * 24
+
+_lock = threading.Lock()
+_samples = defaultdict(lambda: (deque(maxlen=MAX_SAMPLES), deque(maxlen=MAX_SAMPLES)))
+_wrappers = {}
+_last_publish = 0.0
+
+
+def profiled_path(path: str) -> str:
+    """
+    Returns the import path of the profiling wrapper of a middleware.
+
+    Args:
+        path (str): The dotted path of the middleware.
+
+    Returns:
+        str: The dotted path resolving to the wrapper class.
+    """
+    return f'{__name__}.{path.replace(".", "__")}'
+
+
+def __getattr__(name: str):
+    if name.startswith('_'):
+        raise AttributeError(name)
+    path = name.replace('__', '.')
+    if path not in _wrappers:
+        _wrappers[path] = _build_wrapper(path, import_string(path))
+    return _wrappers[path]
+
+
+def _build_wrapper(path: str, middleware_class):
+    class ProfiledMiddleware:
+        sync_capable = True
+        async_capable = False
+
+        def __init__(self, get_response):
+            def timed_get_response(request):
+                marks = request._middleware_marks[path]
+                marks[1] = time.perf_counter()
+                try:
+                    return get_response(request)
+                finally:
+                    marks[2] = time.perf_counter()
+
+            self.inner = middleware_class(timed_get_response)
+            for hook in ('process_view', 'process_exception', 'process_template_response'):
+                if hasattr(self.inner, hook):
+                    setattr(self, hook, getattr(self.inner, hook))
+
+        def __call__(self, request):
+            if not hasattr(request, '_middleware_marks'):
+                request._middleware_marks = {}
+            start = time.perf_counter()
+            marks = request._middleware_marks[path] = [start, None, None]
+            try:
+                return self.inner(request)
+            finally:
+                end = time.perf_counter()
+                if marks[1] is None:
+                    before, after = end - start, 0.0
+                else:
+                    before, after = marks[1] - start, end - marks[2]
+                match = getattr(request, 'resolver_match', None)
+                route = match.route if match is not None else '<unresolved>'
+                record(route, path, before, after)
+
+    ProfiledMiddleware.__name__ = f'Profiled{getattr(middleware_class, "__name__", "Middleware")}'
+    ProfiledMiddleware.__qualname__ = ProfiledMiddleware.__name__
+    return ProfiledMiddleware
+
+
+def record(route: str, middleware: str, before: float, after: float):
+    """
+    Stores one measurement and publishes the worker samples when they are due.
+
+    Args:
+        route (str): The URL pattern of the request.
+        middleware (str): The dotted path of the middleware.
+        before (float): Seconds spent before calling the next layer.
+        after (float): Seconds spent after the next layer returned.
+    """
+    global _last_publish
+    with _lock:
+        before_samples, after_samples = _samples[(route, middleware)]
+        before_samples.append(before)
+        after_samples.append(after)
+        now = time.monotonic()
+        due = now - _last_publish >= PUBLISH_INTERVAL
+        if due:
+            _last_publish = now
+    if due:
+        publish()
+
+
+def publish():
+    """
+    Writes the samples of this worker to the shared cache.
+    """
+    pid = os.getpid()
+    with _lock:
+        snapshot = {key: (list(before), list(after)) for key, (before, after) in _samples.items()}
+    cache.set(WORKER_KEY.format(pid=pid), snapshot, PUBLISH_TIMEOUT)
+    workers = set(cache.get(WORKERS_KEY, ()))
+    if pid not in workers:
+        cache.set(WORKERS_KEY, workers | {pid}, PUBLISH_TIMEOUT)
+
+
+def collect() -> dict:
+    """
+    Merges the samples published by all workers.
+
+    Returns:
+        dict: Mapping of (route, middleware) to lists of before and after samples.
+    """
+    merged = defaultdict(lambda: ([], []))
+    workers = cache.get(WORKERS_KEY, ())
+    snapshots = cache.get_many([WORKER_KEY.format(pid=pid) for pid in workers])
+    for snapshot in snapshots.values():
+        for key, (before, after) in snapshot.items():
+            merged[key][0].extend(before)
+            merged[key][1].extend(after)
+    return merged
+
+
+def percentile(samples: list, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def report() -> list:
+    """
+    Returns the percentiles of every middleware per route, costliest first.
+
+    Returns:
+        list: Dicts with the route, middleware, sample count and p50/p90/p99 of the
+            before and after phases in milliseconds.
+    """
+    rows = []
+    for (route, middleware), (before, after) in collect().items():
+        row = {'route': route, 'middleware': middleware, 'count': len(before)}
+        for phase, samples in (('before', before), ('after', after)):
+            for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99)):
+                row[f'{phase}_{name}_ms'] = round(percentile(samples, fraction) * 1000, 3)
+        rows.append(row)
+    return sorted(rows, key=lambda row: row['before_p90_ms'] + row['after_p90_ms'], reverse=True)
+
+
+def reset():
+    with _lock:
+        _samples.clear()
+    workers = cache.get(WORKERS_KEY, ())
+    cache.delete_many([WORKER_KEY.format(pid=pid) for pid in workers] + [WORKERS_KEY])
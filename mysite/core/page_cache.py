@@ -0,0 +1,152 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import cc_delim_re
+from django.utils.translation import get_language_from_path
+
+from .versions import get_versions
+
+PAGE_CACHE_TIMEOUT = getattr(settings, 'PAGE_CACHE_TIMEOUT', 60 * 5)
+PAGE_CACHE_GRACE = getattr(settings, 'PAGE_CACHE_GRACE', 60 * 5)
+PAGE_CACHE_LOCK_TIMEOUT = getattr(settings, 'PAGE_CACHE_LOCK_TIMEOUT', 30)
+PAGE_CACHE_SECTIONS = getattr(settings, 'PAGE_CACHE_SECTIONS', [])
+PAGE_CACHE_EXCLUDED_PREFIXES = getattr(settings, 'PAGE_CACHE_EXCLUDED_PREFIXES', [])
+
+# Headers a response may vary on without splitting the key: the language is part of
+# the path and requests carrying session or messages cookies are never cached.
+VARY_KEYED_ELSEWHERE = {'cookie', 'accept-language'}
+
+
+def split_language(path: str) -> tuple:
+    """
+    Splits the language prefix off a request path.
+
+    Args:
+        path (str): The request path, e.g. '/en/blog/'.
+
+    Returns:
+        tuple: The language code and the rest of the path, or (None, path) without a prefix.
+    """
+    language = get_language_from_path(path)
+    if language is None:
+        return None, path
+    return language, path[len(language) + 2:]
+
+
+def section_namespaces(path: str):
+    """
+    Returns the version namespaces the pages under a path depend on.
+
+    Paths under PAGE_CACHE_EXCLUDED_PREFIXES are never cached. An empty section
+    prefix only matches the index page of the language.
+
+    Args:
+        path (str): The request path without the language prefix.
+
+    Returns:
+        list: The namespaces of the first matching PAGE_CACHE_SECTIONS entry, None if no entry matches.
+    """
+    if any(path.startswith(prefix) for prefix in PAGE_CACHE_EXCLUDED_PREFIXES):
+        return None
+    for prefix, namespaces in PAGE_CACHE_SECTIONS:
+        if path.startswith(prefix) if prefix else path == '':
+            return namespaces
+    return None
+
+
+def page_key(language: str, full_path: str) -> str:
+    digest = hashlib.md5(full_path.encode()).hexdigest()
+    return f'page:{language}:{digest}'
+
+
+def vary_headers(response: HttpResponse):
+    """
+    Returns the request headers a response varies on that must be part of its key.
+
+    Returns:
+        list: The sorted lower case header names, None if the response varies on `*`.
+    """
+    names = {name.strip().lower() for name in cc_delim_re.split(response.get('Vary', '')) if name.strip()}
+    if '*' in names:
+        return None
+    return sorted(names - VARY_KEYED_ELSEWHERE)
+
+
+def variant_key(key: str, request, headers) -> str:
+    """
+    Extends a page key with the values of the request headers the page varies on.
+
+    Args:
+        key (str): The page key.
+        request (HttpRequest): The request.
+        headers (list): The header names returned by `vary_headers`.
+
+    Returns:
+        str: The key of the variant of the page for this request.
+    """
+    if not headers:
+        return key
+    values = '|'.join(request.META.get('HTTP_' + name.upper().replace('-', '_'), '') for name in headers)
+    return f'{key}:{hashlib.md5(values.encode()).hexdigest()}'
+
+
+def load_vary(key: str) -> list:
+    return cache.get(f'{key}:vary') or []
+
+
+def store_vary(key: str, headers: list):
+    cache.set(f'{key}:vary', headers, PAGE_CACHE_TIMEOUT + PAGE_CACHE_GRACE)
+
+
+def versions_token(namespaces) -> str:
+    versions = get_versions(*namespaces)
+    return '.'.join(versions[namespace] for namespace in namespaces)
+
+
+def store_page(key: str, token: str, response: HttpResponse):
+    """
+    Stores a rendered response under its page key.
+
+    The entry stays in the cache for a grace period after it expires, so it can be
+    served as stale content while one request regenerates it.
+    """
+    entry = {
+        'token': token,
+        'expires_at': time.time() + PAGE_CACHE_TIMEOUT,
+        'status': response.status_code,
+        'content': response.content,
+        'headers': list(response.items()),
+    }
+    cache.set(key, entry, PAGE_CACHE_TIMEOUT + PAGE_CACHE_GRACE)
+
+
+def load_page(key: str):
+    return cache.get(key)
+
+
+def is_fresh(entry: dict, token: str) -> bool:
+    return entry['token'] == token and entry['expires_at'] > time.time()
+
+
+def acquire_regeneration(key: str) -> bool:
+    """
+    Lets only one request regenerate an expired page.
+
+    Returns:
+        bool: True if the caller should render the page, False if another request already does.
+    """
+    return cache.add(f'{key}:lock', 1, PAGE_CACHE_LOCK_TIMEOUT)
+
+
+def release_regeneration(key: str):
+    cache.delete(f'{key}:lock')
+
+
+def entry_to_response(entry: dict) -> HttpResponse:
+    response = HttpResponse(entry['content'], status=entry['status'])
+    for header, value in entry['headers']:
+        response[header] = value
+    return response
@@ -0,0 +1,116 @@
+import contextvars
+import logging
+import random
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections, DEFAULT_DB_ALIAS, DatabaseError
+
+logger = logging.getLogger(__name__)
+
+_read_from_replica = contextvars.ContextVar('read_from_replica', default=False)
+_wrote = contextvars.ContextVar('wrote_to_primary', default=False)
+
+# alias -> (healthy, checked_at), kept per process.
+_health = {}
+
+
+def replica_aliases() -> list:
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def is_healthy(alias: str) -> bool:
+    """
+    Checks that a replica answers queries and holds the schema.
+
+    The result is remembered for REPLICA_HEALTH_CHECK_INTERVAL seconds, so at most one
+    probe per interval and process hits the replica.
+
+    Args:
+        alias (str): The database alias of the replica.
+
+    Returns:
+        bool: True if the replica can serve reads.
+    """
+    healthy, checked_at = _health.get(alias, (None, 0.0))
+    if healthy is not None and time.monotonic() - checked_at < getattr(settings, 'REPLICA_HEALTH_CHECK_INTERVAL', 10):
+        return healthy
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT 1 FROM django_migrations LIMIT 1')
+        healthy = True
+    except DatabaseError:
+        logger.warning('Replica %s is unhealthy, reading from the primary', alias, exc_info=True)
+        connections[alias].close()
+        healthy = False
+    _health[alias] = (healthy, time.monotonic())
+    return healthy
+
+
+def pick_replica() -> str:
+    """
+    Returns a random healthy replica alias, or the primary if there is none.
+    """
+    healthy = [alias for alias in replica_aliases() if is_healthy(alias)]
+    return random.choice(healthy) if healthy else DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def read_from_replicas(enabled: bool = True):
+    """
+    Routes the reads of the enclosed block to the replicas.
+
+    Used by ReplicaRoutingMiddleware for safe requests and usable directly for
+    read-only work outside of requests, e.g. exports.
+
+    Args:
+        enabled (bool): False pins the block to the primary.
+    """
+    token = _read_from_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+@contextmanager
+def track_writes():
+    """
+    Records whether the enclosed block routed a write to the primary.
+
+    Yields:
+        Callable: Returns True once a write was routed.
+    """
+    token = _wrote.set(False)
+    try:
+        yield _wrote.get
+    finally:
+        _wrote.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Database router sending writes to the primary and, when enabled, reads to a replica.
+
+    Reads only go to a replica inside `read_from_replicas()` and outside of transactions
+    on the primary, so a request always sees its own writes. Without DATABASE_REPLICAS
+    everything stays on the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _read_from_replica.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return pick_replica()
+
+    def db_for_write(self, model, **hints):
+        _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas are copies of the primary, see the sync_replica command.
+        return db not in replica_aliases()
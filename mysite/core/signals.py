@@ -0,0 +1,54 @@
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .versions import bump_version, model_namespace, object_namespace
+
+
+def bump_object_versions(model, pks):
+    """
+    Bumps the versions of the given instances and of their model.
+
+    Args:
+        model: The model class.
+        pks (Iterable): The primary keys of the changed instances.
+    """
+    for pk in pks:
+        bump_version(object_namespace(model, pk))
+    bump_version(model_namespace(model))
+
+
+def object_changed(sender, instance, **kwargs):
+    bump_object_versions(sender, [instance.pk])
+
+
+def object_relations_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if _is_versioned(type(instance)):
+        bump_object_versions(type(instance), [instance.pk])
+    if _is_versioned(model):
+        if pk_set:
+            bump_object_versions(model, pk_set)
+        else:
+            bump_version(model_namespace(model))
+
+
+def _is_versioned(model) -> bool:
+    return model._meta.label in getattr(settings, 'VERSIONED_MODELS', ())
+
+
+def connect_versioned_models():
+    """
+    Connects the version bumping receivers to the models listed in VERSIONED_MODELS.
+
+    Saving, deleting or changing a many-to-many relation of such a model bumps the
+    version of the instance and of the whole model, invalidating cache keys built from them.
+    """
+    for label in getattr(settings, 'VERSIONED_MODELS', ()):
+        model = apps.get_model(label)
+        uid = f'core-versions-{label}'
+        post_save.connect(object_changed, sender=model, dispatch_uid=uid)
+        post_delete.connect(object_changed, sender=model, dispatch_uid=uid)
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(object_relations_changed, sender=field.remote_field.through, dispatch_uid=uid)
@@ -0,0 +1,85 @@
+"""
+Measures the startup phases of a worker process.
+
+Run as ``python -X importtime -m core.startup`` from the project directory; the
+result is printed as JSON on stdout. The `startup_report` management command runs
+it in a fresh interpreter and formats the result.
+"""
+import json
+import os
+import sys
+import time
+
+
+def _timed(timings: dict, name: str, func):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings[name] = (time.perf_counter() - start) * 1000
+    return wrapper
+
+
+def measure() -> dict:
+    """
+    Boots Django and the WSGI application and times every phase.
+
+    Returns:
+        dict: Durations in milliseconds of settings, per app phases, URLconf and WSGI setup.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+    result = {'apps': {}}
+    started = time.perf_counter()
+
+    import django
+    from django.apps.config import AppConfig
+    from django.conf import settings
+
+    start = time.perf_counter()
+    settings.INSTALLED_APPS  # noqa: B018 - forces the settings module import
+    result['settings_ms'] = (time.perf_counter() - start) * 1000
+
+    original_create = AppConfig.create.__func__
+
+    def create(cls, entry):
+        start = time.perf_counter()
+        app_config = original_create(cls, entry)
+        timings = result['apps'].setdefault(app_config.label, {})
+        timings['create_ms'] = (time.perf_counter() - start) * 1000
+        app_config.import_models = _timed(timings, 'import_models_ms', app_config.import_models)
+        app_config.ready = _timed(timings, 'ready_ms', app_config.ready)
+        return app_config
+
+    AppConfig.create = classmethod(create)
+    try:
+        start = time.perf_counter()
+        django.setup(set_prefix=False)
+        result['setup_ms'] = (time.perf_counter() - start) * 1000
+    finally:
+        AppConfig.create = classmethod(original_create)
+
+    from django.core.wsgi import get_wsgi_application
+    from django.urls import get_resolver
+
+    start = time.perf_counter()
+    get_wsgi_application()
+    result['wsgi_handler_ms'] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    get_resolver().url_patterns  # noqa: B018 - imports the URLconf and every view module
+    result['urlconf_ms'] = (time.perf_counter() - start) * 1000
+
+    from core.template_cache import warm_template_cache
+
+    start = time.perf_counter()
+    warm_template_cache()
+    result['template_warmup_ms'] = (time.perf_counter() - start) * 1000
+
+    result['total_ms'] = (time.perf_counter() - started) * 1000
+    result['debug'] = settings.DEBUG
+    return result
+
+
+if __name__ == '__main__':
+    json.dump(measure(), sys.stdout)
@@ -0,0 +1,56 @@
+import logging
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.template import engines, TemplateDoesNotExist, TemplateSyntaxError
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = ('.html', '.txt', '.xml')
+
+
+def project_template_dirs() -> list:
+    """
+    Returns the template directories of the apps inside the project.
+
+    Third party apps such as the admin or DRF are left out; their templates are
+    compiled on first use.
+    """
+    base_dir = Path(settings.BASE_DIR).resolve()
+    directories = []
+    for app_config in apps.get_app_configs():
+        directory = Path(app_config.path).resolve() / 'templates'
+        if directory.is_relative_to(base_dir) and directory.is_dir():
+            directories.append(directory)
+    return directories
+
+
+def warm_template_cache() -> int:
+    """
+    Compiles the project templates into the cached loaders of the Django engines.
+
+    Meant to be called once per worker at startup (before forking when the app is
+    preloaded), so the first requests do not pay for reading and parsing templates.
+    Only the DIRS of the engines and the templates of the project apps are compiled,
+    which keeps the startup short.
+
+    Returns:
+        int: The number of compiled templates.
+    """
+    compiled = 0
+    for engine in engines.all():
+        directories = [*engine.dirs, *project_template_dirs()]
+        for directory in dict.fromkeys(directories):
+            for path in Path(directory).rglob('*'):
+                if path.suffix not in TEMPLATE_SUFFIXES or not path.is_file():
+                    continue
+                name = path.relative_to(directory).as_posix()
+                try:
+                    engine.get_template(name)
+                except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+                    logger.debug('Could not warm template %s: %s', name, exc)
+                else:
+                    compiled += 1
+    logger.info('Warmed %s templates', compiled)
+    return compiled
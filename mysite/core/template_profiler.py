@@ -0,0 +1,127 @@
+import threading
+import time
+from contextvars import ContextVar
+
+from django.template.base import Template
+from django.template.loader_tags import BlockNode
+
+_lock = threading.Lock()
+_stats = {}
+_installed = False
+
+# Template time of the current request and the nesting depth of template renders.
+_request_time = ContextVar('template_profiler_request_time', default=None)
+_depth = ContextVar('template_profiler_depth', default=0)
+
+
+def record(kind: str, name: str, duration: float):
+    """
+    Adds one measured render to the aggregated statistics.
+
+    Args:
+        kind (str): The kind of the measured unit, 'template' or 'block'.
+        name (str): The name of the template or block.
+        duration (float): The render duration in seconds.
+    """
+    key = (kind, name)
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            _stats[key] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+
+
+def get_stats() -> list:
+    """
+    Returns the aggregated render statistics, slowest total first.
+
+    Times are inclusive: a template's time contains the blocks and included templates it renders.
+
+    Returns:
+        list: Dicts with the kind, name, count, total, mean and max time in milliseconds.
+    """
+    with _lock:
+        items = [(key, list(entry)) for key, entry in _stats.items()]
+    rows = [
+        {
+            'kind': kind,
+            'name': name,
+            'count': count,
+            'total_ms': round(total * 1000, 3),
+            'mean_ms': round(total / count * 1000, 3),
+            'max_ms': round(maximum * 1000, 3),
+        }
+        for (kind, name), (count, total, maximum) in items
+    ]
+    return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+
+def reset_stats():
+    with _lock:
+        _stats.clear()
+
+
+def start_request():
+    """
+    Starts measuring the template time of the current request.
+
+    Returns:
+        Token: The token to pass to finish_request.
+    """
+    return _request_time.set([0.0])
+
+
+def finish_request(token) -> float:
+    """
+    Stops measuring the template time of the current request.
+
+    Args:
+        token: The token returned by start_request.
+
+    Returns:
+        float: The time spent rendering templates in seconds.
+    """
+    spent = _request_time.get()
+    _request_time.reset(token)
+    return spent[0] if spent else 0.0
+
+
+def install():
+    """
+    Instruments template and block rendering. Safe to call more than once.
+    """
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    original_template_render = Template._render
+    original_block_render = BlockNode.render
+
+    def template_render(self, context):
+        depth = _depth.get()
+        token = _depth.set(depth + 1)
+        start = time.perf_counter()
+        try:
+            return original_template_render(self, context)
+        finally:
+            duration = time.perf_counter() - start
+            _depth.reset(token)
+            record('template', self.origin.template_name or self.origin.name, duration)
+            spent = _request_time.get()
+            if depth == 0 and spent is not None:
+                spent[0] += duration
+
+    def block_render(self, context):
+        start = time.perf_counter()
+        try:
+            return original_block_render(self, context)
+        finally:
+            template_name = self.origin.template_name if self.origin else None
+            record('block', f'{template_name}:{self.name}', time.perf_counter() - start)
+
+    Template._render = template_render
+    BlockNode.render = block_render
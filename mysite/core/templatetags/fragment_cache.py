@@ -0,0 +1,68 @@
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.template import TemplateSyntaxError
+from django.utils.translation import get_language
+
+from core.versions import get_version, model_namespace, object_namespace
+
+register = template.Library()
+
+FRAGMENT_CACHE_TIMEOUT = getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', 60 * 60)
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, fragment_name, obj, vary_on):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.obj = obj
+        self.vary_on = vary_on
+
+    def render(self, context):
+        obj = self.obj.resolve(context)
+        vary_on = ':'.join(str(var.resolve(context)) for var in self.vary_on)
+        if isinstance(obj, QuerySet):
+            # Resolving the queryset does not run it, so a hit costs no database query.
+            label, pk, namespace = obj.model._meta.label_lower, '*', model_namespace(obj.model)
+        else:
+            label, pk, namespace = obj._meta.label_lower, obj.pk, object_namespace(obj, obj.pk)
+        key = f'fragment:{self.fragment_name}:{label}:{pk}:{get_version(namespace)}:{get_language()}:{vary_on}'
+        value = cache.get(key)
+        if value is None:
+            value = self.nodelist.render(context)
+            cache.set(key, value, FRAGMENT_CACHE_TIMEOUT)
+        return value
+
+
+@register.tag('cache_fragment')
+def do_cache_fragment(parser, token):
+    """
+    Caches the enclosed template fragment of a model instance or a whole queryset.
+
+    The cache key contains the fragment name, the instance, its version from
+    core.versions, the active language and any extra vary-on values, so the fragment
+    is re-rendered after the instance changes. A queryset is keyed by the version of
+    its model instead; the fragment must then only show fields of that model. The
+    model must be listed in VERSIONED_MODELS for its version to be bumped.
+
+    Cache whole lists rather than single rows: every fragment costs a version and an
+    entry lookup, which is slower than rendering a small row.
+
+    Usage::
+
+        {% load fragment_cache %}
+        {% cache_fragment 'product-list' products [vary_on ...] %}
+            ...
+        {% endcache_fragment %}
+    """
+    nodelist = parser.parse(('endcache_fragment',))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise TemplateSyntaxError(f"'{bits[0]}' tag requires a fragment name and an object.")
+
+    fragment_name = bits[1].strip('\'"')
+    obj = parser.compile_filter(bits[2])
+    vary_on = [parser.compile_filter(bit) for bit in bits[3:]]
+    return FragmentCacheNode(nodelist, fragment_name, obj, vary_on)
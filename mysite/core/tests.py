@@ -0,0 +1,109 @@
+from django.core.cache import cache
+from django.db import OperationalError, transaction
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from django.utils.cache import patch_vary_headers
+
+from .db import retry_on_busy
+from .middleware import AnonymousPageCacheMiddleware
+
+
+class RetryOnBusyTestCase(TransactionTestCase):
+    """
+    Busy errors are retried until the transaction commits, never after.
+    """
+    def test_busy_error_before_commit_is_retried(self):
+        calls = []
+
+        @retry_on_busy(base_delay=0)
+        def write():
+            calls.append(True)
+            if len(calls) < 3:
+                raise OperationalError('database is locked')
+            return len(calls)
+
+        self.assertEqual(write(), 3)
+
+    def test_busy_error_in_commit_hook_is_not_retried(self):
+        calls = []
+
+        def failing_hook():
+            raise OperationalError('database is locked')
+
+        @retry_on_busy(base_delay=0)
+        def write():
+            calls.append(True)
+            transaction.on_commit(failing_hook)
+
+        with self.assertRaises(OperationalError):
+            write()
+        self.assertEqual(len(calls), 1)
+
+    def test_retries_are_limited(self):
+        calls = []
+
+        @retry_on_busy(retries=2, base_delay=0)
+        def write():
+            calls.append(True)
+            raise OperationalError('database is locked')
+
+        with self.assertRaises(OperationalError):
+            write()
+        self.assertEqual(len(calls), 3)
+
+
+@override_settings(PAGE_CACHE_ENABLED=True)
+class AnonymousPageCacheTestCase(SimpleTestCase):
+    """
+    Cached pages honour conditional requests and per-visitor pages are never stored.
+    """
+    path = '/en/blog/page-cache-test/'
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.renders = 0
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def middleware(self, view):
+        def counting_view(request):
+            self.renders += 1
+            return view(request)
+        return AnonymousPageCacheMiddleware(counting_view)
+
+    def test_hit_answers_conditional_request(self):
+        def view(request):
+            response = HttpResponse('feed')
+            response['ETag'] = '"v1"'
+            return response
+        middleware = self.middleware(view)
+
+        self.assertEqual(middleware(self.factory.get(self.path))['X-Page-Cache'], 'MISS')
+        response = middleware(self.factory.get(self.path, HTTP_IF_NONE_MATCH='"v1"'))
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['X-Page-Cache'], 'HIT')
+        self.assertEqual(self.renders, 1)
+
+    def test_page_using_csrf_token_is_not_stored(self):
+        def view(request):
+            return HttpResponse(get_token(request))
+        middleware = self.middleware(view)
+
+        middleware(self.factory.get(self.path))
+        middleware(self.factory.get(self.path))
+
+        self.assertEqual(self.renders, 2)
+
+    def test_page_varying_on_cookie_is_not_stored(self):
+        def view(request):
+            response = HttpResponse('hello')
+            patch_vary_headers(response, ('Cookie',))
+            return response
+        middleware = self.middleware(view)
+
+        middleware(self.factory.get(self.path))
+        middleware(self.factory.get(self.path))
+
+        self.assertEqual(self.renders, 2)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import template_profile, middleware_profile
+
+urlpatterns = [
+    path('templates/', template_profile, name='perf_templates'),
+    path('middleware/', middleware_profile, name='perf_middleware'),
+]
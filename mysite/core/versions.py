@@ -0,0 +1,98 @@
+import time
+
+from django.core.cache import cache
+
+VERSION_KEY_PREFIX = 'version'
+
+
+def _version_key(namespace: str) -> str:
+    return f'{VERSION_KEY_PREFIX}:{namespace}'
+
+
+def get_version(namespace: str) -> str:
+    """
+    Returns the current version token of a cached namespace.
+
+    The token changes every time the namespace is bumped, so it can be
+    embedded into cache keys to invalidate every entry of the namespace at once.
+
+    Args:
+        namespace (str): The name of the versioned namespace.
+
+    Returns:
+        str: The current version token.
+    """
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def get_versions(*namespaces: str) -> dict:
+    """
+    Returns the current version tokens of several namespaces with one cache round trip.
+
+    Args:
+        *namespaces (str): The names of the versioned namespaces.
+
+    Returns:
+        dict: Mapping of namespace to its version token.
+    """
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in found.items()}
+    for namespace in namespaces:
+        if namespace not in versions:
+            versions[namespace] = get_version(namespace)
+    return versions
+
+
+def bump_version(namespace: str) -> str:
+    """
+    Replaces the version token of a namespace, invalidating all keys built from it.
+
+    Args:
+        namespace (str): The name of the versioned namespace.
+
+    Returns:
+        str: The new version token.
+    """
+    version = _new_version()
+    cache.set(_version_key(namespace), version, timeout=None)
+    return version
+
+
+def _new_version() -> str:
+    # Time based tokens stay unique across worker processes without
+    # relying on an atomic increment of the cache backend.
+    return format(time.time_ns(), 'x')
+
+
+def model_namespace(model) -> str:
+    """
+    Returns the version namespace covering every instance of a model.
+
+    Args:
+        model: The model class or instance.
+
+    Returns:
+        str: The version namespace name.
+    """
+    return f'model:{model._meta.label_lower}'
+
+
+def object_namespace(model, pk) -> str:
+    """
+    Returns the version namespace of a single model instance.
+
+    Args:
+        model: The model class or instance.
+        pk: The primary key of the instance.
+
+    Returns:
+        str: The version namespace name.
+    """
+    return f'{model_namespace(model)}:{pk}'
@@ -0,0 +1,43 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpRequest, JsonResponse
+
+from . import middleware_profiler, template_profiler
+
+
+@staff_member_required
+def template_profile(request: HttpRequest) -> JsonResponse:
+    """
+    Debug view returning the template render statistics of this worker process.
+
+    Pass `?reset=1` to clear the statistics after reading them.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        JsonResponse: The per template and per block statistics.
+    """
+    stats = template_profiler.get_stats()
+    if request.GET.get('reset'):
+        template_profiler.reset_stats()
+    return JsonResponse({'templates': stats})
+
+
+@staff_member_required
+def middleware_profile(request: HttpRequest) -> JsonResponse:
+    """
+    Debug view returning the middleware cost percentiles published by all workers.
+
+    Pass `?reset=1` to clear the samples after reading them.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        JsonResponse: The per route and per middleware percentiles.
+    """
+    middleware_profiler.publish()
+    rows = middleware_profiler.report()
+    if request.GET.get('reset'):
+        middleware_profiler.reset()
+    return JsonResponse({'middleware': rows})
@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the Job model.
+
+    Attributes:
+        list_display (tuple): The fields to display in the job list view.
+        list_filter (tuple): The fields to filter the jobs by.
+    """
+    list_display = 'name', 'status', 'progress', 'attempts', 'run_at', 'created_by', 'finished_at'
+    list_filter = 'status', 'name'
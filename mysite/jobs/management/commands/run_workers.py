@@ -0,0 +1,77 @@
+import logging
+import signal
+import threading
+
+from django.core.management import BaseCommand
+from django.db import DatabaseError, connections
+
+from jobs.worker import claim_job, run_job, worker_id
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to process background jobs with a pool of worker threads.
+
+    Every thread claims due jobs with a lease and runs them. Several commands may run
+    side by side, on one or more machines sharing the database. SIGTERM and SIGINT
+    let the running jobs finish before exiting.
+
+    Usage:
+    python manage.py run_workers [--concurrency 4] [--interval 1] [--once]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Number of worker threads.')
+        parser.add_argument('--interval', type=float, default=1, help='Seconds between polls of an idle worker.')
+        parser.add_argument('--once', action='store_true', help='Exit once no job is due.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        self.stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: self.stop.set())
+
+        threads = [
+            threading.Thread(target=self.work, args=(options['interval'], options['once']), daemon=True)
+            for _ in range(options['concurrency'])
+        ]
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f'Started {len(threads)} job workers.')
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(timeout=0.5)
+
+        self.stdout.write(self.style.SUCCESS('Job workers stopped.'))
+
+    def work(self, interval: float, once: bool):
+        worker = worker_id()
+        try:
+            while not self.stop.is_set():
+                try:
+                    job = claim_job(worker)
+                except DatabaseError:
+                    # E.g. the database is busy; the job stays due and is claimed later.
+                    logger.warning('Could not claim a job', exc_info=True)
+                    self.stop.wait(interval)
+                    continue
+                if job is None:
+                    if once:
+                        return
+                    self.stop.wait(interval)
+                    continue
+                run_job(job)
+                self.stdout.write(f'Job {job.pk} ({job.name}): {job.status}')
+        finally:
+            connections.close_all()
@@ -0,0 +1,46 @@
+# Generated by Django 5.0.6 on 2026-10-19 10:52
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='name')),
+                ('args', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='args')),
+                ('kwargs', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='kwargs')),
+                ('status', models.CharField(choices=[('queued', 'queued'), ('running', 'running'), ('succeeded', 'succeeded'), ('failed', 'failed')], default='queued', max_length=10, verbose_name='status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='attempts')),
+                ('max_attempts', models.PositiveIntegerField(default=3, verbose_name='max_attempts')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='run_at')),
+                ('locked_by', models.CharField(blank=True, default='', max_length=100, verbose_name='locked_by')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='locked_until')),
+                ('progress', models.PositiveSmallIntegerField(default=0, verbose_name='progress')),
+                ('progress_message', models.CharField(blank=True, default='', max_length=255, verbose_name='progress_message')),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='result')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='last_error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='started_at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='finished_at')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'job',
+                'indexes': [models.Index(fields=['status', 'run_at'], name='job_due_idx')],
+            },
+        ),
+    ]
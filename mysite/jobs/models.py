@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+
+class Job(models.Model):
+    """
+    Model representing a background job waiting for or processed by a worker.
+
+    Attributes:
+        name (str): The registered name of the job function.
+        args (list): The positional arguments of the call.
+        kwargs (dict): The keyword arguments of the call.
+        status (str): The processing status of the job.
+        attempts (int): The number of started attempts.
+        max_attempts (int): The number of attempts before the job is marked as failed.
+        run_at (DateTime): The earliest time the job may be claimed.
+        locked_by (str): The worker holding the lease.
+        locked_until (DateTime): The end of the lease; afterwards the job may be claimed again.
+        progress (int): The reported progress in percent.
+        progress_message (str): A short description of the current step.
+        result (Any): The JSON result of a succeeded job.
+        last_error (str): The error of the last failed attempt.
+        created_by (User): The user who enqueued the job.
+        created_at (DateTime): The date and time when the job was enqueued.
+        started_at (DateTime): The date and time when the last attempt started.
+        finished_at (DateTime): The date and time when the job succeeded or failed for good.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, _('queued')),
+        (STATUS_RUNNING, _('running')),
+        (STATUS_SUCCEEDED, _('succeeded')),
+        (STATUS_FAILED, _('failed')),
+    ]
+
+    name = models.CharField(_('name'), max_length=100)
+    args = models.JSONField(_('args'), default=list, encoder=DjangoJSONEncoder)
+    kwargs = models.JSONField(_('kwargs'), default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(_('status'), max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    attempts = models.PositiveIntegerField(_('attempts'), default=0)
+    max_attempts = models.PositiveIntegerField(_('max_attempts'), default=3)
+    run_at = models.DateTimeField(_('run_at'), default=now)
+    locked_by = models.CharField(_('locked_by'), max_length=100, blank=True, default='')
+    locked_until = models.DateTimeField(_('locked_until'), blank=True, null=True)
+    progress = models.PositiveSmallIntegerField(_('progress'), default=0)
+    progress_message = models.CharField(_('progress_message'), max_length=255, blank=True, default='')
+    result = models.JSONField(_('result'), blank=True, null=True, encoder=DjangoJSONEncoder)
+    last_error = models.TextField(_('last_error'), blank=True, default='')
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, blank=True, null=True, related_name='jobs',
+    )
+    created_at = models.DateTimeField(_('created_at'), auto_now_add=True)
+    started_at = models.DateTimeField(_('started_at'), blank=True, null=True)
+    finished_at = models.DateTimeField(_('finished_at'), blank=True, null=True)
+
+    class Meta:
+        db_table = 'job'
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='job_due_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name}: ID={self.pk}'
@@ -0,0 +1,102 @@
+import contextvars
+import functools
+
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from .models import Job
+
+REGISTRY = {}
+
+_current_job = contextvars.ContextVar('current_job', default=None)
+
+
+def job(func=None, *, name: str = None, max_attempts: int = 3):
+    """
+    Registers a function as a background job.
+
+    The function must take JSON serializable arguments and return a JSON
+    serializable result. It gets an `enqueue(*args, **kwargs)` attribute.
+
+    Usage::
+
+        @job
+        def export_products(): ...
+
+        export_products.enqueue(user=request.user)
+
+    Args:
+        func (Callable): The job function.
+        name (str): The registered name, defaults to `<module>.<function>`.
+        max_attempts (int): The number of attempts before the job fails for good.
+
+    Returns:
+        Callable: The registered function.
+    """
+    if func is None:
+        return functools.partial(job, name=name, max_attempts=max_attempts)
+
+    job_name = name or f'{func.__module__}.{func.__name__}'
+    REGISTRY[job_name] = func
+    func.job_name = job_name
+    func.max_attempts = max_attempts
+    func.enqueue = functools.partial(enqueue, func)
+    return func
+
+
+def enqueue(func_or_name, *args, user=None, delay: float = 0, **kwargs) -> Job:
+    """
+    Adds a job to the queue.
+
+    Args:
+        func_or_name (Callable | str): The job function or its registered name.
+        *args: The positional arguments of the job.
+        user (User): The user the job is run for, who may poll its result.
+        delay (float): Seconds before the job may start.
+        **kwargs: The keyword arguments of the job.
+
+    Returns:
+        Job: The queued job.
+    """
+    name = func_or_name if isinstance(func_or_name, str) else func_or_name.job_name
+    func = REGISTRY[name]
+    return Job.objects.create(
+        name=name,
+        args=list(args),
+        kwargs=kwargs,
+        max_attempts=func.max_attempts,
+        run_at=now() + timedelta(seconds=delay),
+        created_by=user if user is not None and user.is_authenticated else None,
+    )
+
+
+def current_job():
+    """
+    Returns the Job being processed by the current worker thread, or None.
+    """
+    return _current_job.get()
+
+
+def set_progress(progress: int, message: str = ''):
+    """
+    Reports the progress of the current job and extends its lease.
+
+    Does nothing outside of a worker, so job functions can also be called directly.
+
+    Args:
+        progress (int): The progress in percent.
+        message (str): A short description of the current step.
+    """
+    from .worker import extend_lease
+
+    job_ = current_job()
+    if job_ is None:
+        return
+    job_.progress = max(0, min(100, int(progress)))
+    job_.progress_message = message[:255]
+    Job.objects.filter(pk=job_.pk, locked_by=job_.locked_by).update(
+        progress=job_.progress,
+        progress_message=job_.progress_message,
+        locked_until=extend_lease(),
+    )
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from .models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for polling the state of a Job.
+
+    The result is only rendered once the job succeeded and the error once it failed.
+    """
+    class Meta:
+        model = Job
+        fields = 'pk', 'name', 'status', 'progress', 'progress_message', 'attempts', 'result', 'last_error', \
+            'created_at', 'started_at', 'finished_at'
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if instance.status != Job.STATUS_SUCCEEDED:
+            data.pop('result')
+        if instance.status != Job.STATUS_FAILED:
+            data.pop('last_error')
+        return data
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import JobDetailAPIView
+
+app_name = 'jobs'
+
+urlpatterns = [
+    path('<int:pk>/', JobDetailAPIView.as_view(), name='job-detail'),
+]
@@ -0,0 +1,42 @@
+from django.http import JsonResponse
+from django.urls import reverse
+from rest_framework.generics import RetrieveAPIView
+
+from .models import Job
+from .serializers import JobSerializer
+
+
+def accepted(job: Job) -> JsonResponse:
+    """
+    Returns the 202 response of a request that enqueued a job.
+
+    The `Location` header and the `status_url` field point to the polling endpoint.
+
+    Args:
+        job (Job): The enqueued job.
+
+    Returns:
+        JsonResponse: The response with the job id and status URL.
+    """
+    status_url = reverse('jobs:job-detail', kwargs={'pk': job.pk})
+    response = JsonResponse({'job': job.pk, 'status': job.status, 'status_url': status_url}, status=202)
+    response['Location'] = status_url
+    return response
+
+
+class JobDetailAPIView(RetrieveAPIView):
+    """
+    API view for polling the status, progress and result of a job.
+
+    Users see the jobs they enqueued; staff sees all jobs. Jobs enqueued anonymously
+    can not be polled.
+    """
+    serializer_class = JobSerializer
+
+    def get_queryset(self):
+        user = self.request.user
+        if user.is_staff:
+            return Job.objects.all()
+        if user.is_authenticated:
+            return Job.objects.filter(created_by=user)
+        return Job.objects.none()
@@ -0,0 +1,120 @@
+import logging
+import os
+import socket
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.timezone import now
+
+from .models import Job
+from .queue import REGISTRY, _current_job
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = getattr(settings, 'JOBS_LEASE_SECONDS', 300)
+RETRY_BASE_DELAY = getattr(settings, 'JOBS_RETRY_BASE_DELAY', 30)
+
+
+def worker_id() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+def extend_lease():
+    return now() + timedelta(seconds=LEASE_SECONDS)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Returns the exponential backoff delay after a failed attempt.
+
+    Args:
+        attempts (int): The number of failed attempts so far.
+
+    Returns:
+        timedelta: The delay before the next attempt.
+    """
+    return timedelta(seconds=RETRY_BASE_DELAY * 2 ** (attempts - 1))
+
+
+def claim_job(worker: str, candidates: int = 10):
+    """
+    Claims the next due job with a lease.
+
+    Queued jobs and running jobs whose lease expired (their worker died) are due.
+    A job is claimed with a conditional UPDATE that only succeeds if nobody else
+    claimed it since it was read, so concurrent workers never run the same attempt.
+
+    Args:
+        worker (str): The id of the claiming worker.
+        candidates (int): The number of due jobs to try.
+
+    Returns:
+        Job: The claimed job, or None if no job is due.
+    """
+    current = now()
+    due = (
+        Job.objects
+        .filter(
+            Q(status=Job.STATUS_QUEUED, run_at__lte=current)
+            | Q(status=Job.STATUS_RUNNING, locked_until__lt=current)
+        )
+        .order_by('run_at', 'pk')
+        .values_list('pk', 'status', 'attempts', 'max_attempts')[:candidates]
+    )
+    for pk, status, attempts, max_attempts in due:
+        if attempts >= max_attempts:
+            # The last attempt lost its worker.
+            Job.objects.filter(pk=pk, status=status, attempts=attempts).update(
+                status=Job.STATUS_FAILED, last_error='Lease expired', locked_until=None, finished_at=current,
+            )
+            continue
+        claimed = Job.objects.filter(pk=pk, status=status, attempts=attempts).update(
+            status=Job.STATUS_RUNNING,
+            attempts=attempts + 1,
+            locked_by=worker,
+            locked_until=extend_lease(),
+            started_at=current,
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def run_job(job: Job):
+    """
+    Runs a claimed job and records its result or schedules a retry.
+
+    Args:
+        job (Job): A job claimed by `claim_job`.
+    """
+    token = _current_job.set(job)
+    try:
+        func = REGISTRY[job.name]
+        result = func(*job.args, **job.kwargs)
+    except Exception as exc:
+        logger.warning('Job %s (%s) failed on attempt %s: %s', job.pk, job.name, job.attempts, exc)
+        job.last_error = ''.join(traceback.format_exception(exc))
+        if job.attempts >= job.max_attempts:
+            job.status = Job.STATUS_FAILED
+            job.finished_at = now()
+        else:
+            job.status = Job.STATUS_QUEUED
+            job.run_at = now() + retry_delay(job.attempts)
+        _finish(job, ['status', 'last_error', 'finished_at', 'run_at'])
+    else:
+        job.status = Job.STATUS_SUCCEEDED
+        job.result = result
+        job.progress = 100
+        job.finished_at = now()
+        _finish(job, ['status', 'result', 'progress', 'finished_at'])
+    finally:
+        _current_job.reset(token)
+
+
+def _finish(job: Job, fields: list):
+    # Only the lease holder may record the outcome.
+    values = {field: getattr(job, field) for field in fields}
+    Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(locked_until=None, **values)
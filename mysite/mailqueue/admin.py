@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from .models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the OutboxMessage model.
+
+    Attributes:
+        list_display (tuple): The fields to display in the outbox list view.
+        list_filter (tuple): The fields to filter the outbox by.
+    """
+    list_display = 'subject', 'to', 'status', 'attempts', 'next_attempt_at', 'sent_at'
+    list_filter = 'status',
@@ -0,0 +1,46 @@
+from django.core.mail.backends.base import BaseEmailBackend
+
+from .models import OutboxMessage
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    """
+    Email backend that stores messages in the outbox instead of sending them.
+
+    Sending only costs one INSERT per batch, so request handlers no longer wait on
+    the SMTP server. The `send_queued_mail` management command delivers the outbox.
+    """
+    def send_messages(self, email_messages):
+        messages = [
+            message_to_outbox(message)
+            for message in email_messages
+            if message.recipients()
+        ]
+        OutboxMessage.objects.bulk_create(messages)
+        return len(messages)
+
+
+def message_to_outbox(message) -> OutboxMessage:
+    """
+    Converts an EmailMessage into an unsaved outbox row.
+
+    Args:
+        message (EmailMessage): The message to convert.
+
+    Returns:
+        OutboxMessage: The outbox row holding the message.
+    """
+    if message.attachments:
+        raise ValueError('Queued emails do not support attachments.')
+
+    return OutboxMessage(
+        subject=message.subject,
+        body=message.body,
+        from_email=message.from_email,
+        to=list(message.to),
+        cc=list(message.cc),
+        bcc=list(message.bcc),
+        reply_to=list(message.reply_to),
+        headers=dict(message.extra_headers),
+        alternatives=[list(alternative) for alternative in getattr(message, 'alternatives', [])],
+    )
@@ -0,0 +1,113 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.utils.timezone import now
+
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+# The MAILQUEUE_* settings are read on each call, so `override_settings` applies to them.
+DEFAULT_DELIVERY_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+
+def outbox_to_message(outbox: OutboxMessage, connection) -> EmailMultiAlternatives:
+    """
+    Rebuilds an email message from an outbox row.
+
+    Args:
+        outbox (OutboxMessage): The queued message.
+        connection: The email backend used to deliver the message.
+
+    Returns:
+        EmailMultiAlternatives: The message ready to be sent.
+    """
+    return EmailMultiAlternatives(
+        subject=outbox.subject,
+        body=outbox.body,
+        from_email=outbox.from_email,
+        to=outbox.to,
+        cc=outbox.cc,
+        bcc=outbox.bcc,
+        reply_to=outbox.reply_to,
+        headers=outbox.headers,
+        alternatives=[tuple(alternative) for alternative in outbox.alternatives],
+        connection=connection,
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Returns the exponential backoff delay after a failed delivery attempt.
+
+    Args:
+        attempts (int): The number of failed attempts so far.
+
+    Returns:
+        timedelta: The delay before the next attempt.
+    """
+    base_delay = getattr(settings, 'MAILQUEUE_RETRY_BASE_DELAY', 60)
+    return timedelta(seconds=base_delay * 2 ** (attempts - 1))
+
+
+def deliver_batch(batch_size: int = 100, backend: str = None) -> tuple:
+    """
+    Delivers one batch of due outbox messages over a single backend connection.
+
+    Args:
+        batch_size (int): The maximum number of messages to deliver.
+        backend (str): The dotted path of the delivering email backend,
+            `MAILQUEUE_DELIVERY_BACKEND` by default.
+
+    Returns:
+        tuple: The numbers of sent and failed messages.
+    """
+    due = list(
+        OutboxMessage.objects
+        .filter(status=OutboxMessage.STATUS_PENDING, next_attempt_at__lte=now())
+        .order_by('next_attempt_at', 'pk')[:batch_size]
+    )
+    if not due:
+        return 0, 0
+
+    sent = failed = 0
+    backend = backend or getattr(settings, 'MAILQUEUE_DELIVERY_BACKEND', DEFAULT_DELIVERY_BACKEND)
+    connection = get_connection(backend, fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning('Could not open the email connection: %s', exc)
+        for outbox in due:
+            _mark_failed(outbox, exc)
+        return 0, len(due)
+
+    try:
+        for outbox in due:
+            try:
+                connection.send_messages([outbox_to_message(outbox, connection)])
+            except Exception as exc:
+                logger.warning('Failed to deliver outbox message %s: %s', outbox.pk, exc)
+                _mark_failed(outbox, exc)
+                failed += 1
+            else:
+                outbox.status = OutboxMessage.STATUS_SENT
+                outbox.sent_at = now()
+                outbox.last_error = ''
+                outbox.save(update_fields=['status', 'sent_at', 'last_error'])
+                sent += 1
+    finally:
+        connection.close()
+
+    return sent, failed
+
+
+def _mark_failed(outbox: OutboxMessage, exc: Exception):
+    outbox.attempts += 1
+    outbox.last_error = repr(exc)
+    if outbox.attempts >= getattr(settings, 'MAILQUEUE_MAX_ATTEMPTS', 5):
+        outbox.status = OutboxMessage.STATUS_FAILED
+    else:
+        outbox.next_attempt_at = now() + retry_delay(outbox.attempts)
+    outbox.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
@@ -0,0 +1,54 @@
+import time
+
+from django.core.management import BaseCommand
+
+from mailqueue.delivery import deliver_batch
+
+
+class Command(BaseCommand):
+    """
+    Command to deliver queued emails.
+
+    This command drains the outbox in batches, reusing one email backend connection
+    per batch and retrying failed messages with exponential backoff.
+    Run a single worker per outbox.
+
+    Usage:
+    python manage.py send_queued_mail [--batch-size 100] [--loop] [--interval 5]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--loop', action='store_true', help='Keep polling the outbox.')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds between polls in loop mode.')
+        parser.add_argument('--backend', default=None, help='Dotted path of the delivering email backend.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        while True:
+            sent, failed = self.drain(options['batch_size'], options['backend'])
+            if sent or failed:
+                self.stdout.write(f'Sent: {sent}, failed: {failed}')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Outbox drained.'))
+
+    def drain(self, batch_size: int, backend: str) -> tuple:
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = deliver_batch(batch_size, backend)
+            total_sent += sent
+            total_failed += failed
+            if sent + failed < batch_size:
+                return total_sent, total_failed
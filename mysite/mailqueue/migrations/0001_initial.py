@@ -0,0 +1,40 @@
+# Generated by Django 5.0.6 on 2026-10-19 10:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='subject')),
+                ('body', models.TextField(blank=True, verbose_name='body')),
+                ('from_email', models.CharField(max_length=255, verbose_name='from_email')),
+                ('to', models.JSONField(default=list, verbose_name='to')),
+                ('cc', models.JSONField(default=list, verbose_name='cc')),
+                ('bcc', models.JSONField(default=list, verbose_name='bcc')),
+                ('reply_to', models.JSONField(default=list, verbose_name='reply_to')),
+                ('headers', models.JSONField(default=dict, verbose_name='headers')),
+                ('alternatives', models.JSONField(default=list, verbose_name='alternatives')),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('sent', 'sent'), ('failed', 'failed')], default='pending', max_length=10, verbose_name='status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='attempts')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='next_attempt_at')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='last_error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='sent_at')),
+            ],
+            options={
+                'db_table': 'outbox_message',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbox_due_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import models
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxMessage(models.Model):
+    """
+    Model representing an outbound email waiting to be delivered.
+
+    Attributes:
+        subject (str): The subject of the email.
+        body (str): The plain text body of the email.
+        from_email (str): The sender address.
+        to (list): The recipient addresses.
+        cc (list): The carbon copy addresses.
+        bcc (list): The blind carbon copy addresses.
+        reply_to (list): The reply-to addresses.
+        headers (dict): Extra headers of the email.
+        alternatives (list): Alternative bodies as [content, mimetype] pairs.
+        status (str): The delivery status of the message.
+        attempts (int): The number of failed delivery attempts.
+        next_attempt_at (DateTime): The earliest time of the next delivery attempt.
+        last_error (str): The error of the last failed delivery attempt.
+        created_at (DateTime): The date and time when the message was queued.
+        sent_at (DateTime): The date and time when the message was delivered.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _('pending')),
+        (STATUS_SENT, _('sent')),
+        (STATUS_FAILED, _('failed')),
+    ]
+
+    subject = models.CharField(_('subject'), max_length=255)
+    body = models.TextField(_('body'), blank=True)
+    from_email = models.CharField(_('from_email'), max_length=255)
+    to = models.JSONField(_('to'), default=list)
+    cc = models.JSONField(_('cc'), default=list)
+    bcc = models.JSONField(_('bcc'), default=list)
+    reply_to = models.JSONField(_('reply_to'), default=list)
+    headers = models.JSONField(_('headers'), default=dict)
+    alternatives = models.JSONField(_('alternatives'), default=list)
+    status = models.CharField(_('status'), max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(_('attempts'), default=0)
+    next_attempt_at = models.DateTimeField(_('next_attempt_at'), default=now)
+    last_error = models.TextField(_('last_error'), blank=True, default='')
+    created_at = models.DateTimeField(_('created_at'), auto_now_add=True)
+    sent_at = models.DateTimeField(_('sent_at'), blank=True, null=True)
+
+    class Meta:
+        db_table = 'outbox_message'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_due_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.subject}: ID={self.pk}'
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+from .delivery import deliver_batch
+from .models import OutboxMessage
+
+
+class FailingEmailBackend(LocmemEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionError('SMTP server unavailable')
+
+
+@override_settings(
+    EMAIL_BACKEND='mailqueue.backends.QueuedEmailBackend',
+    MAILQUEUE_DELIVERY_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+)
+class QueuedMailTestCase(TestCase):
+    """
+    Mail sent through the queued backend is stored in the outbox and delivered later.
+    """
+    def test_send_mail_is_queued(self):
+        sent = mail.send_mail('Subject', 'Body', 'from@example.com', ['to@example.com'])
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(len(mail.outbox), 0)
+        outbox = OutboxMessage.objects.get()
+        self.assertEqual(outbox.status, OutboxMessage.STATUS_PENDING)
+        self.assertEqual(outbox.to, ['to@example.com'])
+
+    def test_send_queued_mail_delivers_outbox(self):
+        message = mail.EmailMultiAlternatives('Subject', 'Body', 'from@example.com', ['to@example.com'],
+                                              cc=['cc@example.com'])
+        message.attach_alternative('<p>Body</p>', 'text/html')
+        message.send()
+
+        call_command('send_queued_mail', stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 1)
+        delivered = mail.outbox[0]
+        self.assertEqual(delivered.subject, 'Subject')
+        self.assertEqual(delivered.to, ['to@example.com'])
+        self.assertEqual(delivered.cc, ['cc@example.com'])
+        self.assertEqual(delivered.alternatives, [('<p>Body</p>', 'text/html')])
+        outbox = OutboxMessage.objects.get()
+        self.assertEqual(outbox.status, OutboxMessage.STATUS_SENT)
+        self.assertIsNotNone(outbox.sent_at)
+
+    def test_messages_not_due_are_kept(self):
+        mail.send_mail('Subject', 'Body', 'from@example.com', ['to@example.com'])
+        OutboxMessage.objects.update(next_attempt_at=now() + timedelta(minutes=5))
+
+        self.assertEqual(deliver_batch(), (0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(MAILQUEUE_DELIVERY_BACKEND='mailqueue.tests.FailingEmailBackend', MAILQUEUE_MAX_ATTEMPTS=2)
+    def test_failed_delivery_is_retried_then_given_up(self):
+        mail.send_mail('Subject', 'Body', 'from@example.com', ['to@example.com'])
+
+        self.assertEqual(deliver_batch(), (0, 1))
+        outbox = OutboxMessage.objects.get()
+        self.assertEqual(outbox.status, OutboxMessage.STATUS_PENDING)
+        self.assertEqual(outbox.attempts, 1)
+        self.assertGreater(outbox.next_attempt_at, now())
+
+        OutboxMessage.objects.update(next_attempt_at=now())
+        self.assertEqual(deliver_batch(), (0, 1))
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, OutboxMessage.STATUS_FAILED)
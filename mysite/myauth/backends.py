@@ -0,0 +1,28 @@
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from .permissions import permissions_cache_key, PERMISSIONS_CACHE_TIMEOUT
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Authentication backend that keeps resolved permissions in the shared cache.
+
+    ModelBackend only memoizes permissions on the user object, so every new request
+    queries the permission tables again. This backend stores the resolved permission
+    sets in the cache, keyed by user and by the groups/user versions, so repeated
+    permission checks across requests do not hit the database.
+    """
+    def _get_permissions(self, user_obj, obj, from_name):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+
+        perm_cache_name = f'_{from_name}_perm_cache'
+        if not hasattr(user_obj, perm_cache_name):
+            key = permissions_cache_key(user_obj.pk, from_name)
+            perms = cache.get(key)
+            if perms is None:
+                perms = super()._get_permissions(user_obj, obj, from_name)
+                cache.set(key, perms, PERMISSIONS_CACHE_TIMEOUT)
+            setattr(user_obj, perm_cache_name, perms)
+        return getattr(user_obj, perm_cache_name)
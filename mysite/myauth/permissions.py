@@ -0,0 +1,61 @@
+from django.conf import settings
+
+from core.versions import bump_version, get_versions
+
+GROUPS_VERSION = 'auth-groups'
+PERMISSIONS_CACHE_TIMEOUT = getattr(settings, 'PERMISSIONS_CACHE_TIMEOUT', 60 * 60)
+
+
+def user_version_namespace(user_pk) -> str:
+    """
+    Returns the version namespace holding the permission state of one user.
+
+    Args:
+        user_pk (int): The primary key of the user.
+
+    Returns:
+        str: The version namespace name.
+    """
+    return f'auth-user-{user_pk}'
+
+
+def permissions_cache_key(user_pk, from_name: str) -> str:
+    """
+    Builds the cache key of the resolved permissions of a user.
+
+    The key embeds the groups version and the user version, so any change
+    of a group, its permissions or the user's memberships produces a new key.
+
+    Args:
+        user_pk (int): The primary key of the user.
+        from_name (str): The permission source, 'user' or 'group'.
+
+    Returns:
+        str: The cache key.
+    """
+    user_namespace = user_version_namespace(user_pk)
+    versions = get_versions(GROUPS_VERSION, user_namespace)
+    return (
+        f'myauth:perms:{from_name}:{user_pk}:'
+        f'{versions[GROUPS_VERSION]}:{versions[user_namespace]}'
+    )
+
+
+def invalidate_group_permissions():
+    """
+    Invalidates the cached permissions of every user.
+
+    Called whenever a group or the permissions attached to it change.
+    """
+    bump_version(GROUPS_VERSION)
+
+
+def invalidate_user_permissions(*user_pks):
+    """
+    Invalidates the cached permissions of the given users.
+
+    Args:
+        *user_pks (int): The primary keys of the users.
+    """
+    for user_pk in user_pks:
+        bump_version(user_version_namespace(user_pk))
@@ -0,0 +1,56 @@
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import User
+from .permissions import invalidate_group_permissions, invalidate_user_permissions
+
+M2M_CHANGE_ACTIONS = {'post_add', 'post_remove', 'post_clear', 'pre_clear'}
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def group_permissions_changed(sender, action, **kwargs):
+    """
+    Invalidates cached permissions when permissions are attached to or removed from a group.
+    """
+    if action in M2M_CHANGE_ACTIONS:
+        invalidate_group_permissions()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def user_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Invalidates cached permissions of the users whose groups or own permissions changed.
+    """
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+
+    if not reverse:
+        invalidate_user_permissions(instance.pk)
+    elif pk_set:
+        invalidate_user_permissions(*pk_set)
+    else:
+        # Clearing from the group/permission side does not report the affected users.
+        invalidate_group_permissions()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def group_changed(sender, **kwargs):
+    """
+    Invalidates cached permissions when a group or a permission is saved or deleted.
+    """
+    invalidate_group_permissions()
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created, update_fields, **kwargs):
+    """
+    Invalidates cached permissions when a user's active or superuser flags may have changed.
+    """
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    if not created:
+        invalidate_user_permissions(instance.pk)
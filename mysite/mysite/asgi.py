@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
 
 application = get_asgi_application()
+
+from core.template_cache import warm_template_cache  # noqa: E402
+from shop.suggest import warm_index  # noqa: E402
+
+warm_template_cache()
+warm_index()
@@ -12,19 +12,25 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 import os
 from pathlib import Path
 
-import sentry_sdk
-
-sentry_sdk.init(
-    dsn="https://5cf2a6de1f94818a43971435eae9bb2e@o4507221223473152.ingest.de.sentry.io/4507221645852752",
-    # Set traces_sample_rate to 1.0 to capture 100%
-    # of transactions for performance monitoring.
-    traces_sample_rate=1.0,
-    # Set profiles_sample_rate to 1.0 to profile 100%
-    # of sampled transactions.
-    # We recommend adjusting this value in production.
-    profiles_sample_rate=1.0,
+SENTRY_DSN = os.environ.get(
+    'SENTRY_DSN',
+    "https://5cf2a6de1f94818a43971435eae9bb2e@o4507221223473152.ingest.de.sentry.io/4507221645852752",
 )
 
+if SENTRY_DSN:
+    import sentry_sdk
+
+    sentry_sdk.init(
+        dsn=SENTRY_DSN,
+        # Set traces_sample_rate to 1.0 to capture 100%
+        # of transactions for performance monitoring.
+        traces_sample_rate=float(os.environ.get('SENTRY_TRACES_SAMPLE_RATE', 1.0)),
+        # Set profiles_sample_rate to 1.0 to profile 100%
+        # of sampled transactions.
+        # We recommend adjusting this value in production.
+        profiles_sample_rate=float(os.environ.get('SENTRY_PROFILES_SAMPLE_RATE', 1.0)),
+    )
+
 from django.utils.translation import gettext_lazy as _
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -37,10 +43,14 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'django-insecure-&z6-ydtxx-4oc%hf=cc)s%8!%e!rw9v4718e%q_6&5=urau96s'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Production workers run with DJANGO_DEBUG=0, which skips the debug-only apps,
+# middleware and the host lookups below.
+DEBUG = os.environ.get('DJANGO_DEBUG', '1') == '1'
 
-ALLOWED_HOSTS = ["localhost",
-                 '127.0.0.1',
+ALLOWED_HOSTS = [
+    "localhost",
+    '127.0.0.1',
+    *filter(None, os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',')),
 ]
 
 INTERNAL_IPS = [
@@ -50,7 +60,10 @@ INTERNAL_IPS = [
 if DEBUG:
     import socket
 
-    hostname, _, ips = socket.gethostbyname_ex(socket.gethostname())
+    try:
+        hostname, aliases, ips = socket.gethostbyname_ex(socket.gethostname())
+    except OSError:
+        ips = []
     INTERNAL_IPS.append("10.0.2.2")
     INTERNAL_IPS.extend(
         [ip[: ip.rfind('.')] + '.1' for ip in ips]
@@ -71,10 +84,11 @@ INSTALLED_APPS = [
     'rest_framework',
     'django_filters',
     'drf_spectacular',
-    'debug_toolbar',
-    'django.contrib.admindocs',
 
 
+    'core.apps.CoreConfig',
+    'mailqueue.apps.MailqueueConfig',
+    'jobs.apps.JobsConfig',
     'shop.apps.ShopConfig',
     'requestdataapp.apps.RequestdataappConfig',
     'myauth.apps.MyauthConfig',
@@ -82,8 +96,18 @@ INSTALLED_APPS = [
     'blogapp.apps.BlogappConfig',
 ]
 
+if DEBUG:
+    INSTALLED_APPS += [
+        'debug_toolbar',
+        'django.contrib.admindocs',
+    ]
+
 MIDDLEWARE = [
+    'core.middleware.TemplateProfilerMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.middleware.AnonymousPageCacheMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -92,18 +116,30 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 
     'django.middleware.locale.LocaleMiddleware',
-    'django.contrib.admindocs.middleware.XViewMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
-
 ]
 
+if DEBUG:
+    MIDDLEWARE += [
+        'django.contrib.admindocs.middleware.XViewMiddleware',
+        'debug_toolbar.middleware.DebugToolbarMiddleware',
+    ]
+
+# Measure the time every middleware spends per route, see core.middleware_profiler.
+MIDDLEWARE_PROFILING = os.environ.get('MIDDLEWARE_PROFILING') == '1'
+
+if MIDDLEWARE_PROFILING:
+    MIDDLEWARE = [
+        'core.middleware_profiler.' + path.replace('.', '__')
+        for path in MIDDLEWARE
+    ]
+
 ROOT_URLCONF = 'mysite.urls'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
+        'APP_DIRS': False,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -111,10 +147,47 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Compiled templates are kept in memory and warmed when a worker starts,
+            # see core.template_cache.warm_template_cache.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
 
+# Report template render times per template and per block, see core.template_profiler.
+TEMPLATE_PROFILING = os.environ.get('TEMPLATE_PROFILING') == '1'
+
+# Models whose saves bump the versions used by fragment and page cache keys.
+VERSIONED_MODELS = [
+    'shop.Product',
+    'shop.Order',
+    'shop.PromoCode',
+]
+
+FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
+# Full page cache for anonymous visitors, see core.middleware.AnonymousPageCacheMiddleware.
+# Sections map a path prefix (after the language prefix) to the versions their pages depend on;
+# an empty prefix only matches the index page. Only anonymous HTML sections belong here,
+# the APIs are never page cached. Pages reading the session, like the index page, vary on
+# cookies and are never stored.
+PAGE_CACHE_ENABLED = not DEBUG
+PAGE_CACHE_TIMEOUT = 60 * 5
+PAGE_CACHE_EXCLUDED_PREFIXES = [
+    'api/',
+    'blog/api/',
+]
+PAGE_CACHE_SECTIONS = [
+    ('blog/', ['blog']),
+    ('products/', ['model:shop.product']),
+    ('product/', ['model:shop.product']),
+]
+
 WSGI_APPLICATION = 'mysite.wsgi.application'
 
 
@@ -125,10 +198,60 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        # A file, not the shared in-memory database, so concurrent tests wait on
+        # busy_timeout instead of failing with 'database table is locked'.
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
+    }
+}
+
+# Read replicas, see core.replicas. Locally a second SQLite file kept in sync with
+# `python manage.py sync_replica --interval 1` stands in for a replica.
+DATABASE_REPLICAS = []
+
+if os.environ.get('DJANGO_REPLICA_DB'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ['DJANGO_REPLICA_DB'],
+        'TEST': {'MIRROR': 'default'},
     }
+    DATABASE_REPLICAS.append('replica')
+
+DATABASE_ROUTERS = ['core.replicas.PrimaryReplicaRouter']
+REPLICA_HEALTH_CHECK_INTERVAL = 10
+REPLICA_PIN_COOKIE = 'pin_primary'
+REPLICA_PIN_SECONDS = 5
+
+# Applied to every new SQLite connection, see core.db.configure_sqlite_connection.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -64000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
 }
 
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('DJANGO_CACHE_DIR', BASE_DIR / 'cache'),
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
+
+AUTHENTICATION_BACKENDS = [
+    'myauth.backends.CachedModelBackend',
+]
+
+PERMISSIONS_CACHE_TIMEOUT = 60 * 60
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -177,32 +300,29 @@ LOCALE_PATHS = [
 
 STATIC_URL = 'static/'
 
+# Collected by `collectstatic` in the Docker image and served by WhiteNoise, as
+# nothing else serves /static/ when DEBUG is off.
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
 MEDIA_URL = 'media/'
 
 MEDIA_ROOT = BASE_DIR / 'media'
 
-
-ALLOWED_HOSTS = [
-    "localhost",
-    '127.0.0.1',
-]
-
-
-INTERNAL_IPS = [
-    # ...
-    "127.0.0.1",
-    # ...
-]
-
-if DEBUG:
-    import socket
-
-    hostname, _, ips = socket.gethostbyname_ex(socket.gethostname())
-    INTERNAL_IPS.append("10.0.2.2")
-    INTERNAL_IPS.extend(
-        [ip[: ip.rfind('.')] + '.1' for ip in ips]
-
-    )
+# Admin exports are kept outside of MEDIA_ROOT and served by shop.views.ExportDownloadView.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage',
+    },
+    'exports': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {
+            'location': BASE_DIR / 'exports',
+        },
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -222,8 +342,42 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_THROTTLE_CLASSES': [
+        'apiapp.throttling.AnonTokenBucketThrottle',
+        'apiapp.throttling.UserTokenBucketThrottle',
+        'apiapp.throttling.ScopedTokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': '120/min',
+        'user': '600/min',
+        'products': '300/min',
+        'suggest': '600/min',
+        'search': '60/min',
+    },
 }
 
+# Rendered API responses, see apiapp.response_cache.CachedResponseMixin. Entries are kept
+# in a per-process LRU in front of the RESPONSE_CACHE_ALIAS cache shared by the workers.
+RESPONSE_CACHE_ENABLED = True
+RESPONSE_CACHE_TIMEOUT = 60 * 5
+RESPONSE_CACHE_LOCAL_ENTRIES = 1000
+RESPONSE_CACHE_ALIAS = 'default'
+
+# Seconds between checks whether another worker changed the products, see shop.suggest.
+SUGGEST_RESYNC_INTERVAL = 1
+
+# Number of "frequently bought together" products kept per product, see shop.related.
+RELATED_PRODUCTS_TOP_K = 10
+
+# Top-sellers leaderboard, see shop.leaderboard.
+LEADERBOARD_CACHE_SECONDS = 60
+LEADERBOARD_MAX_LIMIT = 50
+LEADERBOARD_HOURLY_RETENTION_HOURS = 48
+LEADERBOARD_DAILY_RETENTION_DAYS = 90
+
+# Token buckets shared by all workers, see apiapp.throttling.
+THROTTLE_DB_PATH = os.environ.get('DJANGO_THROTTLE_DB', BASE_DIR / 'throttle.sqlite3')
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'My Site Project Api',
     'DESCRIPTION': 'My site with shop app and auth',
@@ -233,7 +387,17 @@ SPECTACULAR_SETTINGS = {
 
 
 
-# EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# Background jobs are processed by `manage.py run_workers`, see jobs.worker.
+JOBS_LEASE_SECONDS = 300
+JOBS_RETRY_BASE_DELAY = 30
+
+# Outgoing mail is queued in the outbox and delivered by `manage.py send_queued_mail`.
+EMAIL_BACKEND = 'mailqueue.backends.QueuedEmailBackend'
+MAILQUEUE_DELIVERY_BACKEND = os.environ.get(
+    'MAILQUEUE_DELIVERY_BACKEND', 'django.core.mail.backends.smtp.EmailBackend'
+)
+MAILQUEUE_MAX_ATTEMPTS = 5
+MAILQUEUE_RETRY_BASE_DELAY = 60
 
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = '587'
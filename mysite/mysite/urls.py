@@ -18,20 +18,20 @@ from django.conf.urls.i18n import i18n_patterns
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
-import debug_toolbar
 
 from mysite import settings
 
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
 urlpatterns = [
-    path('admin/doc/', include('django.contrib.admindocs.urls')),
     path('admin/', admin.site.urls),
     path('req/', include('requestdataapp.urls')),
+    path('api/jobs/', include('jobs.urls')),
     path('api/', include('apiapp.urls')),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger'),
     path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    path('__perf__/', include('core.urls')),
 ]
 
 urlpatterns += i18n_patterns(
@@ -40,11 +40,15 @@ urlpatterns += i18n_patterns(
     path('blog/', include('blogapp.urls')),
 )
 
+if 'django.contrib.admindocs' in settings.INSTALLED_APPS:
+    urlpatterns.insert(0, path('admin/doc/', include('django.contrib.admindocs.urls')))
+
 if settings.DEBUG:
     urlpatterns.extend(
         static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     )
 
+if 'debug_toolbar' in settings.INSTALLED_APPS:
     urlpatterns.append(
-        path('__debug__/', include(debug_toolbar.urls)),
+        path('__debug__/', include('debug_toolbar.urls')),
     )
\ No newline at end of file
@@ -1,11 +1,31 @@
 from django.contrib import admin
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 
-from .models import Product, Order
+from core.signals import bump_object_versions
+from . import suggest
+from .models import Product, Order, OrderItem, PromoCode
 from .admin_mixins import ExportAsCSVMixin
 
 
+def set_archived(queryset: QuerySet, archived: bool):
+    """
+    Archives or unarchives products with one UPDATE.
+
+    The update sends no model signals, so the suggest index and the versions of the
+    products, used by the page and response caches, are invalidated explicitly.
+
+    Args:
+        queryset (QuerySet): The products to change.
+        archived (bool): The new archive state.
+    """
+    pks = list(queryset.values_list('pk', flat=True))
+    Product.objects.filter(pk__in=pks).update(is_archived=archived)
+    transaction.on_commit(suggest.products_changed)
+    transaction.on_commit(lambda: bump_object_versions(Product, pks))
+
+
 @admin.action(description='Product archiving')
 def mark_archived(modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet):
     """
@@ -16,7 +36,7 @@ def mark_archived(modeladmin: admin.ModelAdmin, request: HttpRequest, queryset:
         request (HttpRequest): The HTTP request.
         queryset (QuerySet): The queryset containing the selected products.
     """
-    queryset.update(is_archived=True)
+    set_archived(queryset, True)
 
 @admin.action(description='Product unarchiving')
 def mark_unarchived(modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet):
@@ -28,7 +48,7 @@ def mark_unarchived(modeladmin: admin.ModelAdmin, request: HttpRequest, queryset
         request (HttpRequest): The HTTP request.
         queryset (QuerySet): The queryset containing the selected products.
     """
-    queryset.update(is_archived=False)
+    set_archived(queryset, False)
 
 
 @admin.register(Product)
@@ -51,13 +71,14 @@ class ProductAdmin(admin.ModelAdmin, ExportAsCSVMixin):
         'export_csv'
     ]
 
-    list_display = 'name', 'description_short', 'price', 'discount', 'created_at', 'is_archived'
+    list_display = 'name', 'description_short', 'price', 'discount', 'stock', 'created_at', 'is_archived'
     list_display_links = 'name',
     search_fields = 'name',
     fieldsets = [
         (None, {'fields': ('name', 'description')}),
         ('Price options', {'fields': ('price', 'discount'), 'classes': ('collapse',)}),
         (None, {'fields': ('created_at',)}),
+        ('Stock', {'fields': ('stock',)}),
         ('Product archiving', {'fields': ('is_archived',), 'classes': ('collapse',)})
     ]
 
@@ -77,6 +98,22 @@ class ProductAdmin(admin.ModelAdmin, ExportAsCSVMixin):
             return obj.description[:48] + '...'
 
 
+class OrderItemInline(admin.TabularInline):
+    """
+    Inline showing the items of an order.
+
+    Attributes:
+        model (Model): The OrderItem model.
+        extra (int): The number of empty item forms.
+        raw_id_fields (tuple): The foreign keys edited by primary key.
+        readonly_fields (tuple): The discounts, stored when the item is added.
+    """
+    model = OrderItem
+    extra = 0
+    raw_id_fields = 'product',
+    readonly_fields = 'discount', 'promo_discount'
+
+
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     """
@@ -85,9 +122,14 @@ class OrderAdmin(admin.ModelAdmin):
     This class defines how the Order model is displayed and managed in the Django admin interface.
 
     Attributes:
+        inlines (list): The inlines shown on the order change page.
         list_display (tuple): The fields to display in the order list view.
+        readonly_fields (tuple): The denormalized totals, computed from the items.
     """
-    list_display = 'delivery_address', 'promocode', 'created_at', 'user_verbose', 'product_display'
+    inlines = [OrderItemInline]
+    list_display = 'delivery_address', 'promocode', 'created_at', 'user_verbose', 'product_display', \
+        'item_count', 'total'
+    readonly_fields = 'subtotal', 'discount_total', 'total', 'item_count'
 
     def user_verbose(self, obj: Order):
         """
@@ -113,3 +155,22 @@ class OrderAdmin(admin.ModelAdmin):
         """
         products = [product.name for product in obj.products.all()]
         return ', '.join(products)
+
+
+@admin.register(PromoCode)
+class PromoCodeAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the PromoCode model.
+
+    Attributes:
+        list_display (tuple): The fields to display in the promo code list view.
+        list_filter (tuple): The fields to filter the promo codes by.
+        search_fields (tuple): The fields to search for promo codes.
+        filter_horizontal (tuple): The many-to-many fields edited with a filter widget.
+        readonly_fields (tuple): The fields that can not be edited.
+    """
+    list_display = 'code', 'discount_percent', 'valid_from', 'valid_until', 'used_count', 'max_uses', 'is_active'
+    list_filter = 'is_active',
+    search_fields = 'code',
+    filter_horizontal = 'products',
+    readonly_fields = 'used_count',
@@ -1,46 +1,38 @@
-import csv
-
 from django.db.models import QuerySet
-from django.db.models.options import Options
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest
+from django.urls import reverse
+
+from .jobs import export_csv
 
 
 class ExportAsCSVMixin:
     """
     Mixin class to export queryset data as CSV.
 
-    This mixin provides a method to export queryset data as a CSV file.
+    This mixin provides an admin action exporting the selected objects as a CSV file
+    in a background job.
 
     Methods:
-        export_csv(request: HttpRequest, queryset: QuerySet) -> HttpResponse:
-            Exports the provided queryset data as a CSV file and returns an HTTP response.
+        export_csv(request: HttpRequest, queryset: QuerySet) -> None:
+            Enqueues the export and tells the user where to poll for the file.
 
     Attributes:
         None
     """
     def export_csv(self, request: HttpRequest, queryset: QuerySet):
         """
-        Exports the provided queryset data as a CSV file.
+        Enqueues a CSV export of the provided queryset.
 
         Args:
             request (HttpRequest): The HTTP request.
             queryset (QuerySet): The queryset to export as CSV.
 
         Returns:
-            HttpResponse: The HTTP response containing the CSV data.
+            None
         """
-        meta: Options = self.model._meta
-        field_names = [field.name for field in meta.fields]
-
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename={meta.model_name}-export.csv'
-
-        csv_writer = csv.writer(response)
-        csv_writer.writerow(field_names)
-
-        for obj in queryset:
-            csv_writer.writerow([getattr(obj, f) for f in field_names])
-
-        return response
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+        job = export_csv.enqueue(self.model._meta.label_lower, pks, user=request.user)
+        status_url = reverse('jobs:job-detail', kwargs={'pk': job.pk})
+        self.message_user(request, f'The export of {len(pks)} objects was started, see {status_url}')
 
     export_csv.short_description = 'Export as CSV'
@@ -0,0 +1,95 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+
+from core.db import retry_on_busy
+from core.signals import bump_object_versions
+from .models import Order, OrderItem, Product
+from .leaderboard import record_sales
+from .promocodes import ActivePromo, redeem
+from .related import record_order
+from .totals import update_order_totals
+
+
+class OutOfStock(ValidationError):
+    """
+    Raised when a product does not have enough stock for a checkout.
+
+    Attributes:
+        product_id (int): The product that ran out.
+    """
+    def __init__(self, product_id: int):
+        super().__init__(_('Not enough stock for product %(product)s.'), code='out_of_stock',
+                         params={'product': product_id})
+        self.product_id = product_id
+
+
+@retry_on_busy
+def checkout(user, delivery_address: str, quantities: dict, promo: ActivePromo = None) -> Order:
+    """
+    Places an order, reserving the stock of its products.
+
+    Stock is taken with one conditional `UPDATE ... SET stock = stock - n WHERE stock >= n`
+    per product, in product order to avoid deadlocks, so concurrent checkouts can never
+    oversell. The order lines are written with a single `bulk_create`, keeping the
+    prices and discounts of the moment, and the order totals computed from them.
+    Everything runs in one short transaction that is retried when the database is busy.
+
+    Args:
+        user (User): The user placing the order.
+        delivery_address (str): The delivery address.
+        quantities (dict): Mapping of product primary key to the ordered quantity.
+        promo (ActivePromo): A validated promo code to redeem.
+
+    Returns:
+        Order: The placed order.
+
+    Raises:
+        OutOfStock: If a product is archived or lacks stock; nothing is written then.
+        ValidationError: If the promo code was used up meanwhile.
+    """
+    quantities = {product_id: quantity for product_id, quantity in quantities.items() if quantity > 0}
+    if not quantities:
+        raise ValidationError(_('An order needs at least one product.'), code='empty')
+
+    for product_id, quantity in sorted(quantities.items()):
+        reserved = (
+            Product.objects
+            .filter(pk=product_id, is_archived=False, stock__gte=quantity)
+            .update(stock=F('stock') - quantity)
+        )
+        if not reserved:
+            raise OutOfStock(product_id)
+
+    if promo is not None:
+        redeem(promo)
+
+    prices = {
+        pk: (price, discount)
+        for pk, price, discount in Product.objects.filter(pk__in=quantities).values_list('pk', 'price', 'discount')
+    }
+    order = Order.objects.create(
+        user=user,
+        delivery_address=delivery_address,
+        promocode=promo.code if promo is not None else '',
+    )
+    OrderItem.objects.bulk_create([
+        OrderItem(
+            order=order,
+            product_id=product_id,
+            quantity=quantity,
+            unit_price=prices[product_id][0],
+            discount=prices[product_id][1],
+            promo_discount=promo.discount_percent if promo is not None and promo.applies_to(product_id) else 0,
+        )
+        for product_id, quantity in quantities.items()
+    ])
+    update_order_totals([order])
+
+    # The stock updates and the order lines bypass the model signals. The order is
+    # committed when these run, so their failures are logged rather than raised.
+    transaction.on_commit(lambda: bump_object_versions(Product, list(quantities)), robust=True)
+    transaction.on_commit(lambda: record_sales(quantities), robust=True)
+    transaction.on_commit(lambda: record_order(quantities), robust=True)
+    return order
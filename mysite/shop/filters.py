@@ -0,0 +1,26 @@
+from django_filters import rest_framework as filters
+
+from .models import Product
+
+
+class ProductFilterSet(filters.FilterSet):
+    """
+    Filters of the product API.
+
+    `effective_price` is a generated column, which django-filter does not derive
+    filters for, so its exact and range filters are declared explicitly.
+    Range filters on it are served by the `product_effective_price_idx` index.
+    """
+    effective_price = filters.NumberFilter(field_name='effective_price')
+    effective_price__gte = filters.NumberFilter(field_name='effective_price', lookup_expr='gte')
+    effective_price__lte = filters.NumberFilter(field_name='effective_price', lookup_expr='lte')
+
+    class Meta:
+        model = Product
+        fields = {
+            'name': ['exact'],
+            'description': ['exact'],
+            'price': ['exact', 'gte', 'lte'],
+            'discount': ['exact'],
+            'is_archived': ['exact'],
+        }
@@ -1,7 +1,9 @@
 from django import forms
 from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError
 
 from .models import Product, Order
+from .promocodes import redeem, validate_promo
 
 class ProductForm(forms.ModelForm):
     """
@@ -14,10 +16,11 @@ class ProductForm(forms.ModelForm):
         description (CharField): A brief description of the product.
         price (DecimalField): The price of the product.
         discount (IntegerField): The discount percentage applied to the product.
+        stock (IntegerField): The number of units available for ordering.
     """
     class Meta:
         model = Product
-        fields = ['name', 'description', 'price', 'discount']
+        fields = ['name', 'description', 'price', 'discount', 'stock']
 
 
 class OrderForm(forms.ModelForm):
@@ -25,6 +28,9 @@ class OrderForm(forms.ModelForm):
     Form for creating or updating an order.
 
     This form allows users to input details for creating or updating an order.
+    A promo code is validated against the ordered products. New orders are placed
+    with `shop.checkout.checkout`, one unit per product; `save()` redeems a promo
+    code newly applied to an existing order.
 
     Attributes:
         delivery_address (CharField): The delivery address for the order.
@@ -36,6 +42,49 @@ class OrderForm(forms.ModelForm):
         model = Order
         fields = ['delivery_address', 'promocode', 'user', 'products']
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['promocode'].required = False
+
+    def clean(self):
+        cleaned_data = super().clean()
+        self.promo = None
+        code = cleaned_data.get('promocode')
+        if 'products' in self.fields:
+            products = cleaned_data.get('products')
+            product_ids = [product.pk for product in products] if products is not None else None
+        else:
+            product_ids = list(self.instance.products.values_list('pk', flat=True))
+        if code and product_ids is not None:
+            try:
+                self.promo = validate_promo(code, product_ids)
+            except ValidationError as error:
+                self.add_error('promocode', error)
+            else:
+                cleaned_data['promocode'] = self.promo.code
+        return cleaned_data
+
+    def save(self, commit=True):
+        """
+        Redeems a newly applied promo code and saves the order.
+
+        Call inside a transaction, so a failed save does not count the redemption.
+
+        Raises:
+            ValidationError: If the promo code was used up meanwhile.
+        """
+        if self.promo is not None and 'promocode' in self.changed_data:
+            redeem(self.promo)
+        return super().save(commit)
+
+
+class OrderUpdateForm(OrderForm):
+    """
+    Form for updating an order, without changing the user who placed it or its items.
+    """
+    class Meta(OrderForm.Meta):
+        fields = ['delivery_address', 'promocode']
+
 
 class GroupForm(forms.ModelForm):
     """
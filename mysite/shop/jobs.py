@@ -0,0 +1,73 @@
+import csv
+import io
+import secrets
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.urls import reverse
+from django.utils import translation
+
+from jobs.queue import current_job, job, set_progress
+from .models import Product
+
+
+@job(name='shop.export_products')
+def export_products() -> dict:
+    """
+    Exports all products for ProductsDataExportView.
+
+    Returns:
+        dict: The exported products.
+    """
+    products = Product.objects.order_by('pk').values_list('pk', 'name', 'price', 'is_archived')
+    return {
+        'products': [
+            {
+                'pk': pk,
+                'name': name,
+                'price': price,
+                'is_archived': is_archived,
+            }
+            for pk, name, price, is_archived in products
+        ],
+    }
+
+
+@job(name='shop.export_csv')
+def export_csv(model_label: str, pks: list) -> dict:
+    """
+    Writes the given objects to a CSV file in the private exports storage, see ExportAsCSVMixin.
+
+    The file gets a random name and is downloaded through ExportDownloadView.
+
+    Args:
+        model_label (str): The label of the exported model, e.g. 'shop.product'.
+        pks (list): The primary keys of the exported objects.
+
+    Returns:
+        dict: The name of the stored file and the URL of its download view.
+    """
+    model = apps.get_model(model_label)
+    field_names = [field.name for field in model._meta.fields]
+
+    output = io.StringIO()
+    csv_writer = csv.writer(output)
+    csv_writer.writerow(field_names)
+
+    chunk_size = 1000
+    for start in range(0, len(pks), chunk_size):
+        for obj in model.objects.filter(pk__in=pks[start:start + chunk_size]).order_by('pk'):
+            csv_writer.writerow([getattr(obj, f) for f in field_names])
+        set_progress(100 * (start + chunk_size) // max(len(pks), 1), f'{min(start + chunk_size, len(pks))} rows')
+
+    file_name = f'{model._meta.model_name}-export-{secrets.token_urlsafe(16)}.csv'
+    name = storages['exports'].save(file_name, ContentFile(output.getvalue()))
+    running = current_job()
+    url = None
+    if running is not None:
+        # No language is active in the worker; the download view lives under i18n_patterns.
+        with translation.override(settings.LANGUAGE_CODE.split('-')[0]):
+            url = reverse('export_download', kwargs={'pk': running.pk})
+    return {'file': name, 'url': url}
@@ -0,0 +1,205 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Max, Q, Sum
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from .models import ProductSales
+
+UPSERT_SQL = (
+    f'INSERT INTO {ProductSales._meta.db_table} (product_id, period, bucket, quantity) VALUES (%s, %s, %s, %s) '
+    'ON CONFLICT (period, bucket, product_id) DO UPDATE SET quantity = quantity + excluded.quantity'
+)
+
+WINDOWS = {
+    '24h': timedelta(hours=24),
+    '7d': timedelta(days=7),
+    '30d': timedelta(days=30),
+}
+DEFAULT_WINDOW = '24h'
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def max_limit() -> int:
+    return getattr(settings, 'LEADERBOARD_MAX_LIMIT', 50)
+
+
+def hourly_retention() -> timedelta:
+    return timedelta(hours=getattr(settings, 'LEADERBOARD_HOURLY_RETENTION_HOURS', 48))
+
+
+def daily_retention() -> timedelta:
+    return timedelta(days=getattr(settings, 'LEADERBOARD_DAILY_RETENTION_DAYS', 90))
+
+
+def floor_hour(moment):
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(moment):
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def record_sales(quantities: dict, now=None):
+    """
+    Adds sold units to the hourly buckets of the current hour.
+
+    Args:
+        quantities (dict): Mapping of product primary key to the sold quantity.
+        now (datetime): The time of the sale, defaults to now.
+    """
+    quantities = {product_id: quantity for product_id, quantity in quantities.items() if quantity > 0}
+    if not quantities:
+        return
+    bucket = connection.ops.adapt_datetimefield_value(floor_hour(now or timezone.now()))
+    with connection.cursor() as cursor:
+        cursor.executemany(UPSERT_SQL, [
+            (product_id, ProductSales.HOUR, bucket, quantity)
+            for product_id, quantity in sorted(quantities.items())
+        ])
+
+
+def compacted_until():
+    """
+    Returns the start of the first day that has not been rolled up into a daily bucket.
+
+    Returns:
+        datetime: The start of the day, or None if there are no daily buckets.
+    """
+    last_day = ProductSales.objects.filter(period=ProductSales.DAY).aggregate(last=Max('bucket'))['last']
+    return last_day + timedelta(days=1) if last_day is not None else None
+
+
+def compact(now=None) -> int:
+    """
+    Rolls the hourly buckets of finished days up into daily buckets.
+
+    The daily buckets are written with an UPSERT of the full day sum, so running
+    the compaction twice is harmless. Hourly buckets are kept for
+    `LEADERBOARD_HOURLY_RETENTION_HOURS` so the 24h window stays exact, daily buckets
+    for `LEADERBOARD_DAILY_RETENTION_DAYS`.
+
+    Args:
+        now (datetime): The current time, defaults to now.
+
+    Returns:
+        int: The number of written daily buckets.
+    """
+    now = now or timezone.now()
+    today = floor_day(now)
+    hours = ProductSales.objects.filter(period=ProductSales.HOUR, bucket__lt=today)
+    start = compacted_until()
+    if start is not None:
+        hours = hours.filter(bucket__gte=start)
+    days = (
+        hours
+        .annotate(day=TruncDay('bucket'))
+        .values('day', 'product_id')
+        .annotate(sold=Sum('quantity'))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        written = ProductSales.objects.bulk_create(
+            [
+                ProductSales(product_id=row['product_id'], period=ProductSales.DAY, bucket=row['day'],
+                             quantity=row['sold'])
+                for row in days
+            ],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['period', 'bucket', 'product'],
+            update_fields=['quantity'],
+        )
+        ProductSales.objects.filter(
+            period=ProductSales.HOUR, bucket__lt=min(today, floor_hour(now - hourly_retention())),
+        ).delete()
+        ProductSales.objects.filter(period=ProductSales.DAY, bucket__lt=today - daily_retention()).delete()
+    clear_cache()
+    return len(written)
+
+
+def window_filter(window: str, now) -> Q:
+    """
+    Returns the buckets covering a window.
+
+    Windows within the hourly retention are summed from hourly buckets. Longer
+    windows use the daily buckets of the compacted days, starting with the whole
+    first day, plus the hourly buckets after them.
+
+    Args:
+        window (str): One of `WINDOWS`.
+        now (datetime): The end of the window.
+
+    Returns:
+        Q: The filter selecting the buckets.
+    """
+    since = now - WINDOWS[window]
+    start = compacted_until()
+    if since >= now - hourly_retention() or start is None or start <= since:
+        return Q(period=ProductSales.HOUR, bucket__gte=floor_hour(since))
+    return (
+        Q(period=ProductSales.DAY, bucket__gte=floor_day(since), bucket__lt=start)
+        | Q(period=ProductSales.HOUR, bucket__gte=start)
+    )
+
+
+def compute_top_sellers(window: str, limit: int, now=None) -> list:
+    """
+    Sums the sales buckets of a window into a leaderboard.
+
+    Args:
+        window (str): One of `WINDOWS`.
+        limit (int): The number of products to return.
+        now (datetime): The end of the window, defaults to now.
+
+    Returns:
+        list: Dictionaries with the `pk`, `name` and `sold` units of the best-selling products.
+    """
+    rows = (
+        ProductSales.objects
+        .filter(window_filter(window, now or timezone.now()), product__is_archived=False)
+        .values(pk=F('product_id'), name=F('product__name'))
+        .annotate(sold=Sum('quantity'))
+        .order_by('-sold', 'pk')
+    )
+    return list(rows[:limit])
+
+
+def top_sellers(window: str = DEFAULT_WINDOW, limit: int = 10) -> list:
+    """
+    Returns the best-selling products of a window from a small in-process cache.
+
+    Each window is computed for `LEADERBOARD_MAX_LIMIT` products and kept for
+    `LEADERBOARD_CACHE_SECONDS`, so every worker runs at most one aggregate
+    query per window and interval.
+
+    Args:
+        window (str): One of `WINDOWS`.
+        limit (int): The number of products to return, at most `LEADERBOARD_MAX_LIMIT`.
+
+    Returns:
+        list: Dictionaries with the `pk`, `name` and `sold` units of the best-selling products.
+    """
+    now = time.monotonic()
+    entry = _cache.get(window)
+    if entry is None or entry[0] <= now:
+        with _cache_lock:
+            entry = _cache.get(window)
+            if entry is None or entry[0] <= now:
+                entry = now + getattr(settings, 'LEADERBOARD_CACHE_SECONDS', 60), \
+                    compute_top_sellers(window, max_limit())
+                _cache[window] = entry
+    return entry[1][:limit]
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
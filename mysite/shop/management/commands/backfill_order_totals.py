@@ -0,0 +1,54 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from shop.models import Order
+from shop.totals import update_order_totals
+
+
+class Command(BaseCommand):
+    '''
+    Command to recompute the stored totals of existing orders.
+
+    Migration shop.0010 fills in the totals once on `migrate`; the command repairs
+    them afterwards, e.g. after items were changed with raw SQL.
+
+    Orders are processed in primary key order, one transaction per batch, so the
+    command can be interrupted and resumed with --start-after.
+
+    Usage:
+    python manage.py backfill_order_totals [--batch-size 500] [--start-after 0]
+    '''
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--start-after', type=int, default=0, help='Skip orders up to this primary key.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        last_pk = options['start_after']
+        total = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    Order.objects
+                    .filter(pk__gt=last_pk)
+                    .order_by('pk')
+                    .only('pk')[:options['batch_size']]
+                )
+                if not batch:
+                    break
+                update_order_totals(batch)
+            last_pk = batch[-1].pk
+            total += len(batch)
+            self.stdout.write(f'Updated {total} orders, last ID {last_pk}')
+
+        self.stdout.write(self.style.SUCCESS('Order totals backfilled.'))
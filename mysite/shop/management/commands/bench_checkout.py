@@ -0,0 +1,89 @@
+import threading
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management import BaseCommand
+from django.db import connections
+
+from myauth.models import User
+from shop.checkout import OutOfStock, checkout
+from shop.models import Order, Product
+
+
+class Command(BaseCommand):
+    '''
+    Command to check that concurrent checkouts never oversell and to measure their rate.
+
+    The command creates a product with --stock units and lets --threads threads check
+    it out --quantity units at a time until it is sold out. It then verifies that the
+    sold units match the stock taken, and removes the test product and orders again.
+
+    Usage:
+    python manage.py bench_checkout [--threads 8] [--stock 500] [--quantity 1]
+    '''
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Number of concurrent buyers.')
+        parser.add_argument('--stock', type=int, default=500, help='Units of the test product.')
+        parser.add_argument('--quantity', type=int, default=1, help='Units bought per checkout.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        user = User.objects.order_by('pk').first()
+        if user is None:
+            user = User.objects.create_user(username='bench-checkout')
+        product = Product.objects.create(name='Checkout benchmark', description='', price=1, stock=options['stock'])
+
+        counts = {'placed': 0, 'sold_out': 0, 'errors': 0}
+        lock = threading.Lock()
+
+        def buyer():
+            try:
+                while True:
+                    try:
+                        checkout(user, 'Benchmark', {product.pk: options['quantity']})
+                    except OutOfStock:
+                        with lock:
+                            counts['sold_out'] += 1
+                        return
+                    except ValidationError:
+                        with lock:
+                            counts['errors'] += 1
+                        return
+                    with lock:
+                        counts['placed'] += 1
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=buyer) for _ in range(options['threads'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        product.refresh_from_db()
+        orders = Order.objects.filter(items__product=product)
+        sold = sum(orders.values_list('items__quantity', flat=True))
+        try:
+            self.stdout.write(
+                f'{counts["placed"]} checkouts in {elapsed:.2f}s ({counts["placed"] / elapsed:.0f}/s), '
+                f'{sold} units sold, {product.stock} left, {counts["errors"]} errors'
+            )
+            if sold + product.stock != options['stock'] or product.stock < 0:
+                self.stderr.write(self.style.ERROR('Oversold: the sold units do not match the stock taken.'))
+            else:
+                self.stdout.write(self.style.SUCCESS('No oversell.'))
+        finally:
+            orders.delete()
+            product.delete()
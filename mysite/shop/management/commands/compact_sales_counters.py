@@ -0,0 +1,30 @@
+from django.core.management import BaseCommand
+
+from shop.leaderboard import compact
+
+
+class Command(BaseCommand):
+    '''
+    Command to roll the hourly sales counters up into daily counters.
+
+    Sums the hourly buckets of finished days into daily buckets and prunes the
+    buckets past their retention. Meant to run periodically, e.g. hourly from cron;
+    running it more often is harmless.
+
+    Usage:
+    python manage.py compact_sales_counters
+    '''
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        written = compact()
+        self.stdout.write(self.style.SUCCESS(f'Compacted sales counters into {written} daily buckets.'))
@@ -10,9 +10,12 @@ class Command(BaseCommand):
     This command creates sample products for demonstration purposes.
 
     Usage:
-    python manage.py create_products
+    python manage.py create_product [--stock 100]
     '''
 
+    def add_arguments(self, parser):
+        parser.add_argument('--stock', type=int, default=100, help='Units available per created product.')
+
     def handle(self, *args, **options):
         """
         Handles the execution of the command.
@@ -41,7 +44,8 @@ class Command(BaseCommand):
         for name, price in zip(names, prices):
             product, created = Product.objects.get_or_create(
                 name=name,
-                price=price
+                price=price,
+                defaults={'stock': options['stock']},
             )
             self.stdout.write(f'Created product {name} for ${price}')
 
@@ -0,0 +1,33 @@
+from django.core.management import BaseCommand
+
+from shop.related import rebuild
+
+
+class Command(BaseCommand):
+    '''
+    Command to rebuild the "frequently bought together" recommendations.
+
+    Recounts the product co-occurrences of all orders and replaces the stored top
+    neighbours. Needed after order lines were removed or edited; new orders are
+    counted as they are placed.
+
+    Usage:
+    python manage.py rebuild_related_products [--chunk-size 5000]
+    '''
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Order lines read per query.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        pairs = rebuild(options['chunk_size'], stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(f'Related products rebuilt from {pairs} product pairs.'))
@@ -0,0 +1,44 @@
+from django.core.management import BaseCommand
+
+from core.signals import bump_object_versions
+from shop.models import Product
+
+
+class Command(BaseCommand):
+    '''
+    Command to set the stock of products.
+
+    Products created before stock levels were introduced have a stock of 0, so the
+    checkout rejects them until their stock is set. Run this once after deploying,
+    e.g. with --only-empty, and whenever inventory is restocked.
+
+    Usage:
+    python manage.py set_stock 100 [--only-empty] [--product 1 --product 2]
+    '''
+
+    def add_arguments(self, parser):
+        parser.add_argument('stock', type=int, help='The number of units available per product.')
+        parser.add_argument('--only-empty', action='store_true', help='Only change products without stock.')
+        parser.add_argument('--product', type=int, action='append', dest='products',
+                            help='The primary key of a product to change; all products if omitted.')
+
+    def handle(self, *args, **options):
+        """
+        Handles the execution of the command.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Keyword arguments.
+
+        Returns:
+            None
+        """
+        products = Product.objects.filter(is_archived=False)
+        if options['products']:
+            products = products.filter(pk__in=options['products'])
+        if options['only_empty']:
+            products = products.filter(stock=0)
+        pks = list(products.values_list('pk', flat=True))
+        Product.objects.filter(pk__in=pks).update(stock=max(options['stock'], 0))
+        bump_object_versions(Product, pks)
+        self.stdout.write(self.style.SUCCESS(f'Stock of {len(pks)} products set to {options["stock"]}.'))
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-10-19 10:54
+
+import django.core.validators
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0002_alter_order_created_at_alter_order_delivery_address_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PromoCode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=10, unique=True, verbose_name='code')),
+                ('description', models.CharField(blank=True, default='', max_length=255, verbose_name='description')),
+                ('discount_percent', models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(100)], verbose_name='discount_percent')),
+                ('valid_from', models.DateTimeField(default=django.utils.timezone.now, verbose_name='valid_from')),
+                ('valid_until', models.DateTimeField(blank=True, null=True, verbose_name='valid_until')),
+                ('max_uses', models.PositiveIntegerField(blank=True, null=True, verbose_name='max_uses')),
+                ('used_count', models.PositiveIntegerField(default=0, verbose_name='used_count')),
+                ('is_active', models.BooleanField(default=True, verbose_name='is_active')),
+                ('products', models.ManyToManyField(blank=True, related_name='promo_codes', to='shop.product')),
+            ],
+            options={
+                'db_table': 'promo_code',
+            },
+        ),
+    ]
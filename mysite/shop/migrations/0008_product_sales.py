@@ -0,0 +1,31 @@
+# Generated by Django 5.0.6 on 2026-10-19 11:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0007_related_products'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('h', 'Hour'), ('d', 'Day')], max_length=1, verbose_name='period')),
+                ('bucket', models.DateTimeField(verbose_name='bucket')),
+                ('quantity', models.PositiveIntegerField(default=0, verbose_name='quantity')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales', to='shop.product')),
+            ],
+            options={
+                'db_table': 'product_sales',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='productsales',
+            constraint=models.UniqueConstraint(fields=('period', 'bucket', 'product'), name='product_sales_bucket_unique'),
+        ),
+    ]
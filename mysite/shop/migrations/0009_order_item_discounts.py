@@ -0,0 +1,42 @@
+# Generated by Django 5.0.6 on 2026-10-19 11:13
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_discounts(apps, schema_editor):
+    # The discounts at order time are unknown; the current ones reproduce the stored totals.
+    Product = apps.get_model('shop', 'Product')
+    PromoCode = apps.get_model('shop', 'PromoCode')
+    Order = apps.get_model('shop', 'Order')
+    OrderItem = apps.get_model('shop', 'OrderItem')
+    OrderItem.objects.update(
+        discount=Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('discount')[:1]),
+    )
+    for promo in PromoCode.objects.prefetch_related('products'):
+        items = OrderItem.objects.filter(order__in=Order.objects.filter(promocode=promo.code))
+        product_ids = [product.pk for product in promo.products.all()]
+        if product_ids:
+            items = items.filter(product__in=product_ids)
+        items.update(promo_discount=promo.discount_percent)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0008_product_sales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='discount',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='discount'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='promo_discount',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='promo_discount'),
+        ),
+        migrations.RunPython(backfill_discounts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.6 on 2026-10-19 11:31
+
+from collections import defaultdict
+
+from django.db import migrations
+
+from shop.totals import TOTAL_FIELDS, compute_totals
+
+BATCH_SIZE = 500
+
+
+def backfill_order_totals(apps, schema_editor):
+    # Same computation as `manage.py backfill_order_totals`, on the historical models.
+    Order = apps.get_model('shop', 'Order')
+    OrderItem = apps.get_model('shop', 'OrderItem')
+    last_pk = 0
+    while True:
+        orders = list(Order.objects.filter(pk__gt=last_pk).order_by('pk').only('pk')[:BATCH_SIZE])
+        if not orders:
+            break
+        lines = defaultdict(list)
+        rows = (
+            OrderItem.objects
+            .filter(order__in=orders)
+            .values_list('order_id', 'quantity', 'unit_price', 'discount', 'promo_discount')
+        )
+        for order_id, *line in rows:
+            lines[order_id].append(line)
+        for order in orders:
+            for field, value in compute_totals(lines[order.pk]).items():
+                setattr(order, field, value)
+        Order.objects.bulk_update(orders, TOTAL_FIELDS)
+        last_pk = orders[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0009_order_item_discounts'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_order_totals, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,9 @@
+from decimal import Decimal
+
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Round
 from django.utils.timezone import now
 
 from myauth.models import User
@@ -15,6 +20,8 @@ class Product(models.Model):
         discount (int): The discount percentage applied to the product.
         created_at (Date): The date and time when the product was created.
         is_archived (bool): Indicates if the product is archived or not.
+        stock (int): The number of units available for ordering.
+        effective_price (Decimal): The price after discount, stored by the database.
     """
     name = models.CharField(_('name'), max_length=50)
     description = models.TextField(_('description'), max_length=500)
@@ -22,9 +29,19 @@ class Product(models.Model):
     discount = models.IntegerField(_('discount'), default=0)
     created_at = models.DateField(_('created_at'), default=now)
     is_archived = models.BooleanField(_('is_archived'), default=False)
+    stock = models.PositiveIntegerField(_('stock'), default=0)
+    effective_price = models.GeneratedField(
+        expression=Round(F('price') * (100 - F('discount')) * Decimal('0.01'), 2),
+        output_field=models.DecimalField(max_digits=8, decimal_places=2),
+        db_persist=True,
+        verbose_name=_('effective_price'),
+    )
 
     class Meta:
         db_table = 'product'
+        indexes = [
+            models.Index(fields=['effective_price'], name='product_effective_price_idx'),
+        ]
 
     def __str__(self):
         """
@@ -45,13 +62,195 @@ class Order(models.Model):
         promocode (str): The promotional code applied to the order.
         created_at (Date): The date and time when the order was created.
         user (User): The user who placed the order.
-        products (ManyToManyField): The products included in the order.
+        products (ManyToManyField): The products included in the order, through the order items.
+        subtotal (Decimal): The value of the items before discounts.
+        discount_total (Decimal): The product and promo code discounts.
+        total (Decimal): The value of the order after discounts.
+        item_count (int): The number of ordered units.
+
+    The totals are denormalized from the prices and discounts stored on the items,
+    see shop.totals.
     """
     delivery_address = models.CharField(_('delivery_address'), max_length=50)
     promocode = models.CharField(_('promocode'), max_length=10, default='')
     created_at = models.DateField(_('created_at'), default=now)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    products = models.ManyToManyField(Product, related_name='order')
+    products = models.ManyToManyField(Product, related_name='order', through='OrderItem')
+    subtotal = models.DecimalField(_('subtotal'), max_digits=10, decimal_places=2, default=0)
+    discount_total = models.DecimalField(_('discount_total'), max_digits=10, decimal_places=2, default=0)
+    total = models.DecimalField(_('total'), max_digits=10, decimal_places=2, default=0)
+    item_count = models.PositiveIntegerField(_('item_count'), default=0)
+
+    class Meta:
+        db_table = 'order'
+        indexes = [
+            models.Index(fields=['total'], name='order_total_idx'),
+            models.Index(fields=['item_count'], name='order_item_count_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets the post_save receiver detect a changed promo code without a query.
+        instance._loaded_promocode = dict(zip(field_names, values)).get('promocode')
+        return instance
+
+
+class OrderItem(models.Model):
+    """
+    Model representing one line of an order.
+
+    Uses the table of the former plain many-to-many relation between orders and products.
+
+    Attributes:
+        order (Order): The order the line belongs to.
+        product (Product): The ordered product.
+        quantity (int): The number of ordered units.
+        unit_price (Decimal): The price of one unit when the order was placed.
+        discount (int): The product discount percentage when the order was placed.
+        promo_discount (int): The promo code discount percentage applied to the line.
+    """
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='order_items')
+    quantity = models.PositiveIntegerField(_('quantity'), default=1)
+    unit_price = models.DecimalField(_('unit_price'), max_digits=8, decimal_places=2, default=0)
+    discount = models.PositiveSmallIntegerField(_('discount'), default=0)
+    promo_discount = models.PositiveSmallIntegerField(_('promo_discount'), default=0)
+
+    class Meta:
+        db_table = 'order_products'
+        unique_together = [('order', 'product')]
+
+    def __str__(self):
+        return f'{self.product_id} x {self.quantity}: ID={self.pk}'
+
+class PromoCode(models.Model):
+    """
+    Model representing a promotional code redeemable at checkout.
+
+    Codes are stored upper case, so lookups are case-insensitive through the unique index.
+
+    Attributes:
+        code (str): The normalized code.
+        description (str): A note about the promotion.
+        discount_percent (int): The discount applied to the products in scope.
+        valid_from (DateTime): The start of the validity window.
+        valid_until (DateTime): The end of the validity window, open ended if empty.
+        max_uses (int): The number of redemptions allowed, unlimited if empty.
+        used_count (int): The number of redemptions so far.
+        is_active (bool): Inactive codes can not be redeemed.
+        products (ManyToManyField): The products the code applies to, all products if empty.
+    """
+    code = models.CharField(_('code'), max_length=10, unique=True)
+    description = models.CharField(_('description'), max_length=255, blank=True, default='')
+    discount_percent = models.PositiveSmallIntegerField(
+        _('discount_percent'), validators=[MinValueValidator(1), MaxValueValidator(100)],
+    )
+    valid_from = models.DateTimeField(_('valid_from'), default=now)
+    valid_until = models.DateTimeField(_('valid_until'), blank=True, null=True)
+    max_uses = models.PositiveIntegerField(_('max_uses'), blank=True, null=True)
+    used_count = models.PositiveIntegerField(_('used_count'), default=0)
+    is_active = models.BooleanField(_('is_active'), default=True)
+    products = models.ManyToManyField(Product, blank=True, related_name='promo_codes')
+
+    class Meta:
+        db_table = 'promo_code'
+
+    def __str__(self):
+        return f'{self.code}: ID={self.pk}'
+
+    def save(self, *args, **kwargs):
+        self.code = normalize_code(self.code)
+        super().save(*args, **kwargs)
+
+
+def normalize_code(code: str) -> str:
+    return (code or '').strip().upper()
+
+
+class ProductPair(models.Model):
+    """
+    Model counting how many orders contain both products of a pair.
+
+    Each pair is stored once, with `product_a` < `product_b`, see shop.related.
+
+    Attributes:
+        product_a (Product): The product with the lower primary key.
+        product_b (Product): The product with the higher primary key.
+        count (int): The number of orders containing both products.
+    """
+    product_a = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    product_b = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    count = models.PositiveIntegerField(_('count'), default=0)
+
+    class Meta:
+        db_table = 'product_pair'
+        constraints = [
+            models.UniqueConstraint(fields=['product_a', 'product_b'], name='product_pair_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['product_b', 'product_a'], name='product_pair_b_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.product_a_id}+{self.product_b_id} x {self.count}: ID={self.pk}'
+
+
+class RelatedProduct(models.Model):
+    """
+    Model holding the top neighbours of a product by order co-occurrence.
+
+    Attributes:
+        product (Product): The product the recommendation is for.
+        related (Product): The recommended product.
+        rank (int): The position of the recommendation, starting at 1.
+        score (int): The number of orders containing both products.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='related_products')
+    related = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField(_('rank'))
+    score = models.PositiveIntegerField(_('score'))
 
     class Meta:
-        db_table = 'order'
\ No newline at end of file
+        db_table = 'product_related'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'rank'], name='product_related_rank_unique'),
+        ]
+
+    def __str__(self):
+        return f'{self.product_id} -> {self.related_id} #{self.rank}: ID={self.pk}'
+
+
+class ProductSales(models.Model):
+    """
+    Model counting the units of a product sold in an hour or a day.
+
+    Hourly buckets are incremented as orders are placed; `compact_sales_counters`
+    rolls the hours of finished days up into daily buckets, see shop.leaderboard.
+
+    Attributes:
+        product (Product): The sold product.
+        period (str): The bucket size, `h` for an hour or `d` for a day.
+        bucket (datetime): The start of the bucket in UTC.
+        quantity (int): The number of units sold in the bucket.
+    """
+    HOUR = 'h'
+    DAY = 'd'
+    PERIOD_CHOICES = [
+        (HOUR, _('Hour')),
+        (DAY, _('Day')),
+    ]
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='sales')
+    period = models.CharField(_('period'), max_length=1, choices=PERIOD_CHOICES)
+    bucket = models.DateTimeField(_('bucket'))
+    quantity = models.PositiveIntegerField(_('quantity'), default=0)
+
+    class Meta:
+        db_table = 'product_sales'
+        constraints = [
+            models.UniqueConstraint(fields=['period', 'bucket', 'product'], name='product_sales_bucket_unique'),
+        ]
+
+    def __str__(self):
+        return f'{self.product_id} {self.period} {self.bucket:%Y-%m-%d %H:00} x {self.quantity}: ID={self.pk}'
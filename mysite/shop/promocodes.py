@@ -0,0 +1,112 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+from core.versions import get_version, model_namespace
+from .models import PromoCode, normalize_code
+
+
+class ActivePromo(NamedTuple):
+    """
+    Immutable snapshot of an active promo code, shared by the requests of a worker.
+
+    The usage counter is not part of the snapshot; the limit is enforced by `redeem()`.
+    """
+    pk: int
+    code: str
+    discount_percent: int
+    valid_from: datetime
+    valid_until: Optional[datetime]
+    product_ids: frozenset
+
+    def is_valid_at(self, moment: datetime) -> bool:
+        return self.valid_from <= moment and (self.valid_until is None or moment < self.valid_until)
+
+    def applies_to(self, product_id: int) -> bool:
+        return not self.product_ids or product_id in self.product_ids
+
+
+@lru_cache(maxsize=1024)
+def _load_promo(code: str, version: str):
+    # `version` only keys the cache: a new promo code version misses all old entries.
+    promo = PromoCode.objects.filter(code=code, is_active=True).first()
+    if promo is None:
+        return None
+    return ActivePromo(
+        pk=promo.pk,
+        code=promo.code,
+        discount_percent=promo.discount_percent,
+        valid_from=promo.valid_from,
+        valid_until=promo.valid_until,
+        product_ids=frozenset(promo.products.values_list('pk', flat=True)),
+    )
+
+
+def get_promo(code: str):
+    """
+    Returns the active promo code with the given code.
+
+    Lookups, including misses, are kept in an in-process LRU until a promo code changes.
+
+    Args:
+        code (str): The code as entered, in any case.
+
+    Returns:
+        ActivePromo: The snapshot of the code, or None if there is no active code.
+    """
+    code = normalize_code(code)
+    if not code:
+        return None
+    return _load_promo(code, get_version(model_namespace(PromoCode)))
+
+
+def validate_promo(code: str, product_ids) -> ActivePromo:
+    """
+    Checks that a promo code can be used for an order of the given products.
+
+    Args:
+        code (str): The code as entered.
+        product_ids (Iterable): The primary keys of the ordered products.
+
+    Returns:
+        ActivePromo: The validated promo code.
+
+    Raises:
+        ValidationError: If the code is unknown, expired, used up or applies to none of the products.
+    """
+    promo = get_promo(code)
+    if promo is None:
+        raise ValidationError(_('Unknown promo code.'), code='unknown')
+    if not promo.is_valid_at(now()):
+        raise ValidationError(_('This promo code is not valid now.'), code='expired')
+    if not any(promo.applies_to(pk) for pk in product_ids):
+        raise ValidationError(_('This promo code does not apply to the ordered products.'), code='scope')
+    return promo
+
+
+def redeem(promo: ActivePromo):
+    """
+    Counts one redemption of a promo code.
+
+    A single conditional UPDATE increments the counter while the limit allows it,
+    so concurrent checkouts only contend on the one row for the duration of the statement.
+
+    Args:
+        promo (ActivePromo): The validated promo code.
+
+    Raises:
+        ValidationError: If the code was used up or deactivated meanwhile.
+    """
+    redeemed = (
+        PromoCode.objects
+        .filter(pk=promo.pk, is_active=True)
+        .filter(Q(max_uses__isnull=True) | Q(used_count__lt=F('max_uses')))
+        .update(used_count=F('used_count') + 1)
+    )
+    if not redeemed:
+        raise ValidationError(_('This promo code has been used up.'), code='used_up')
@@ -0,0 +1,142 @@
+import heapq
+from collections import Counter, defaultdict
+from itertools import combinations
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import OrderItem, ProductPair, RelatedProduct
+
+UPSERT_SQL = (
+    f'INSERT INTO {ProductPair._meta.db_table} (product_a_id, product_b_id, count) VALUES (%s, %s, %s) '
+    'ON CONFLICT (product_a_id, product_b_id) DO UPDATE SET count = count + excluded.count'
+)
+
+
+def top_k() -> int:
+    return getattr(settings, 'RELATED_PRODUCTS_TOP_K', 10)
+
+
+def order_pairs(product_ids):
+    """
+    Returns the product pairs of one order, each pair ordered by primary key.
+    """
+    return combinations(sorted(set(product_ids)), 2)
+
+
+def record_order(added_ids, existing_ids=()):
+    """
+    Counts the co-occurrences created by adding products to an order.
+
+    Pairs among the added products and between added and existing products are
+    incremented with one UPSERT each, then the neighbours of the touched products
+    are refreshed.
+
+    Args:
+        added_ids (Iterable[int]): The products added to the order.
+        existing_ids (Iterable[int]): The products the order already contained.
+    """
+    added = set(added_ids)
+    existing = set(existing_ids) - added
+    pairs = set(order_pairs(added))
+    pairs.update(tuple(sorted((new, old))) for new in added for old in existing)
+    if not pairs:
+        return
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.executemany(UPSERT_SQL, [(a, b, 1) for a, b in sorted(pairs)])
+        refresh_related(added | existing)
+
+
+def refresh_related(product_ids):
+    """
+    Recomputes the stored top neighbours of the given products from the pair counts.
+
+    Args:
+        product_ids (Iterable[int]): The products to refresh.
+    """
+    product_ids = set(product_ids)
+    neighbours = defaultdict(Counter)
+    rows = (
+        ProductPair.objects.filter(product_a__in=product_ids)
+        .values_list('product_a_id', 'product_b_id', 'count')
+        .union(
+            ProductPair.objects.filter(product_b__in=product_ids)
+            .values_list('product_a_id', 'product_b_id', 'count')
+        )
+    )
+    for a, b, count in rows:
+        if a in product_ids:
+            neighbours[a][b] = count
+        if b in product_ids:
+            neighbours[b][a] = count
+
+    RelatedProduct.objects.filter(product__in=product_ids).delete()
+    RelatedProduct.objects.bulk_create(_related_rows(neighbours))
+
+
+def rebuild(chunk_size: int = 5000, stdout=None) -> int:
+    """
+    Rebuilds the pair counts and top neighbours from all order lines.
+
+    The order lines are streamed in chunks of whole orders, keyed on the indexed
+    order column, and counted in memory; the tables are then replaced in one transaction.
+
+    Args:
+        chunk_size (int): The number of order lines read per query.
+        stdout: Optional stream for progress messages.
+
+    Returns:
+        int: The number of stored pairs.
+    """
+    counts = Counter()
+    last_order_id = 0
+    while True:
+        rows = list(
+            OrderItem.objects
+            .filter(order_id__gt=last_order_id)
+            .order_by('order_id', 'product_id')
+            .values_list('order_id', 'product_id')[:chunk_size]
+        )
+        if not rows:
+            break
+        if len(rows) == chunk_size and rows[0][0] != rows[-1][0]:
+            # The last order may continue in the next chunk.
+            rows = [row for row in rows if row[0] != rows[-1][0]]
+        elif len(rows) == chunk_size:
+            rows = list(
+                OrderItem.objects.filter(order_id=rows[0][0]).values_list('order_id', 'product_id')
+            )
+
+        products_by_order = defaultdict(list)
+        for order_id, product_id in rows:
+            products_by_order[order_id].append(product_id)
+        for product_ids in products_by_order.values():
+            counts.update(order_pairs(product_ids))
+        last_order_id = rows[-1][0]
+        if stdout is not None:
+            stdout.write(f'Counted orders up to ID {last_order_id}, {len(counts)} pairs')
+
+    neighbours = defaultdict(Counter)
+    for (a, b), count in counts.items():
+        neighbours[a][b] = count
+        neighbours[b][a] = count
+
+    with transaction.atomic():
+        ProductPair.objects.all().delete()
+        ProductPair.objects.bulk_create(
+            (ProductPair(product_a_id=a, product_b_id=b, count=count) for (a, b), count in counts.items()),
+            batch_size=1000,
+        )
+        RelatedProduct.objects.all().delete()
+        RelatedProduct.objects.bulk_create(_related_rows(neighbours), batch_size=1000)
+    return len(counts)
+
+
+def _related_rows(neighbours: dict):
+    k = top_k()
+    for product_id, counter in neighbours.items():
+        best = heapq.nsmallest(k, counter.items(), key=lambda item: (-item[1], item[0]))
+        for rank, (related_id, score) in enumerate(best, start=1):
+            yield RelatedProduct(product_id=product_id, related_id=related_id, rank=rank, score=score)
@@ -1,12 +1,18 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import Product, Order
+from apiapp.fieldsets import SparseFieldsetsSerializerMixin
+from .checkout import OutOfStock, checkout
+from .models import Product, Order, OrderItem
+from .promocodes import redeem, validate_promo
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for the Product model.
 
     This serializer converts Product objects to JSON representations and vice versa.
+    The rendered fields can be trimmed with `?fields=` and `?exclude=`.
 
     Attributes:
         pk (IntegerField): The primary key of the product.
@@ -14,17 +20,84 @@ class ProductSerializer(serializers.ModelSerializer):
         description (CharField): A brief description of the product.
         price (DecimalField): The price of the product.
         discount (IntegerField): The discount percentage applied to the product.
+        stock (IntegerField): The number of units available for ordering.
+        effective_price (DecimalField): The price after discount.
     """
+    effective_price = serializers.DecimalField(max_digits=8, decimal_places=2, read_only=True)
+
     class Meta:
         model = Product
-        fields = 'pk', 'name', 'description', 'price', 'discount'
+        fields = 'pk', 'name', 'description', 'price', 'discount', 'stock', 'effective_price'
+
+
+class ProductSuggestionSerializer(serializers.Serializer):
+    """
+    Serializer documenting a typeahead suggestion of the product API.
+
+    Attributes:
+        pk (IntegerField): The primary key of the product.
+        name (CharField): The name of the product.
+    """
+    pk = serializers.IntegerField()
+    name = serializers.CharField()
+
+
+class RelatedProductSerializer(serializers.Serializer):
+    """
+    Serializer for a product frequently bought together with another product.
+
+    Attributes:
+        pk (IntegerField): The primary key of the related product.
+        name (CharField): The name of the related product.
+        price (DecimalField): The price of the related product.
+        effective_price (DecimalField): The price after discount.
+        score (IntegerField): The number of orders containing both products.
+    """
+    pk = serializers.IntegerField()
+    name = serializers.CharField()
+    price = serializers.DecimalField(max_digits=8, decimal_places=2)
+    effective_price = serializers.DecimalField(max_digits=8, decimal_places=2)
+    score = serializers.IntegerField()
+
+
+class TopSellerSerializer(serializers.Serializer):
+    """
+    Serializer for a product of the top-sellers leaderboard.
+
+    Attributes:
+        pk (IntegerField): The primary key of the product.
+        name (CharField): The name of the product.
+        sold (IntegerField): The number of units sold in the window.
+    """
+    pk = serializers.IntegerField()
+    name = serializers.CharField()
+    sold = serializers.IntegerField()
+
+
+class OrderItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the lines of an order.
+
+    Attributes:
+        product (PrimaryKeyRelatedField): The primary key of the ordered product.
+        quantity (IntegerField): The number of ordered units.
+        unit_price (DecimalField): The price of one unit when the order was placed.
+    """
+    class Meta:
+        model = OrderItem
+        fields = 'product', 'quantity', 'unit_price'
+        read_only_fields = 'unit_price',
+        extra_kwargs = {'quantity': {'min_value': 1}}
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for the Order model.
 
     This serializer converts Order objects to JSON representations and vice versa.
+    The rendered fields can be trimmed with `?fields=` and `?exclude=`.
+    Orders are created through the checkout service, which reserves the stock of the
+    items and redeems the promo code. The items of a placed order can not be changed.
 
     Attributes:
         pk (IntegerField): The primary key of the order.
@@ -32,7 +105,68 @@ class OrderSerializer(serializers.ModelSerializer):
         promocode (CharField): The promotional code applied to the order.
         user (PrimaryKeyRelatedField): The primary key of the user who placed the order.
         products (PrimaryKeyRelatedField): The primary keys of the products included in the order.
+        items (OrderItemSerializer): The ordered products and quantities.
+        subtotal (DecimalField): The value of the items before discounts.
+        discount_total (DecimalField): The product and promo code discounts.
+        total (DecimalField): The value of the order after discounts.
+        item_count (IntegerField): The number of ordered units.
     """
+    items = OrderItemSerializer(many=True, required=False)
+
     class Meta:
         model = Order
-        fields = 'pk', 'delivery_address', 'promocode', 'user', 'products'
+        fields = 'pk', 'delivery_address', 'promocode', 'user', 'products', 'items', \
+            'subtotal', 'discount_total', 'total', 'item_count'
+        read_only_fields = 'products', 'subtotal', 'discount_total', 'total', 'item_count'
+
+    def validate_items(self, items):
+        if self.instance is not None:
+            raise serializers.ValidationError('The items of a placed order can not be changed.')
+        if len({item['product'].pk for item in items}) != len(items):
+            raise serializers.ValidationError('Every product may only be listed once.')
+        return items
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if self.instance is None and not attrs.get('items'):
+            raise serializers.ValidationError({'items': 'An order needs at least one item.'})
+        self.promo = None
+        code = attrs.get('promocode')
+        if code:
+            if 'items' in attrs:
+                product_ids = [item['product'].pk for item in attrs['items']]
+            else:
+                product_ids = list(self.instance.products.values_list('pk', flat=True)) if self.instance else []
+            try:
+                self.promo = validate_promo(code, product_ids)
+            except ValidationError as error:
+                raise serializers.ValidationError({'promocode': error.messages})
+            attrs['promocode'] = self.promo.code
+        return attrs
+
+    def create(self, validated_data):
+        try:
+            return checkout(
+                user=validated_data['user'],
+                delivery_address=validated_data['delivery_address'],
+                quantities={item['product'].pk: item['quantity'] for item in validated_data['items']},
+                promo=self.promo,
+            )
+        except OutOfStock as error:
+            raise serializers.ValidationError({'items': error.messages})
+        except ValidationError as error:
+            raise serializers.ValidationError({'promocode': error.messages})
+
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            if validated_data.get('promocode', instance.promocode) != instance.promocode:
+                self._redeem()
+            return super().update(instance, validated_data)
+
+    def _redeem(self):
+        if self.promo is None:
+            return
+        try:
+            redeem(self.promo)
+        except ValidationError as error:
+            raise serializers.ValidationError({'promocode': error.messages})
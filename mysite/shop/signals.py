@@ -0,0 +1,115 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import leaderboard, related, suggest
+from .models import Order, OrderItem, Product
+from .promocodes import get_promo
+from .totals import apply_promo, price_items, update_order_totals
+
+
+@receiver(m2m_changed, sender=Order.products.through)
+def order_products_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Recomputes the totals of the orders whose products changed.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if action == 'post_add':
+        price_added_items(instance, reverse, pk_set)
+    if not reverse:
+        update_order_totals([instance])
+    elif pk_set:
+        update_order_totals(Order.objects.filter(pk__in=pk_set).only('pk'))
+    # A cleared product leaves no pk_set; the orders are fixed by backfill_order_totals.
+
+    if action == 'post_add':
+        transaction.on_commit(lambda: record_added_products(instance, reverse, pk_set))
+
+
+def price_added_items(instance, reverse, pk_set):
+    """
+    Stores the current discounts on items added through the relation, e.g. `order.products.add()`.
+    """
+    if not reverse:
+        items = OrderItem.objects.filter(order=instance, product__in=pk_set)
+        price_items(items, get_promo(instance.promocode))
+        return
+    for order in Order.objects.filter(pk__in=pk_set).only('pk', 'promocode'):
+        price_items(OrderItem.objects.filter(order=order, product=instance), get_promo(order.promocode))
+
+
+def record_added_products(instance, reverse, pk_set):
+    """
+    Counts the sales and product co-occurrences of products added to orders.
+
+    Removed products are only taken into account by `rebuild_related_products`.
+    """
+    if not reverse:
+        items = OrderItem.objects.filter(order=instance, product__in=pk_set)
+        leaderboard.record_sales(dict(items.values_list('product_id', 'quantity')))
+        existing = OrderItem.objects.filter(order=instance).values_list('product_id', flat=True)
+        related.record_order(pk_set, existing)
+        return
+    items = OrderItem.objects.filter(product=instance, order__in=pk_set)
+    leaderboard.record_sales({instance.pk: sum(items.values_list('quantity', flat=True))})
+    for order_id in pk_set:
+        existing = OrderItem.objects.filter(order_id=order_id).values_list('product_id', flat=True)
+        related.record_order([instance.pk], existing)
+
+
+@receiver(pre_save, sender=OrderItem)
+def order_item_adding(sender, instance, raw, **kwargs):
+    """
+    Stores the current discounts on an item created one by one, e.g. in the admin.
+    """
+    if raw or not instance._state.adding:
+        return
+    instance.discount = Product.objects.values_list('discount', flat=True).get(pk=instance.product_id)
+    promo = get_promo(Order.objects.values_list('promocode', flat=True).get(pk=instance.order_id))
+    if promo is not None and promo.applies_to(instance.product_id):
+        instance.promo_discount = promo.discount_percent
+    else:
+        instance.promo_discount = 0
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def order_item_changed(sender, instance, **kwargs):
+    """
+    Recomputes the totals of an order when one of its items is edited, e.g. in the admin.
+    """
+    update_order_totals(Order.objects.filter(pk=instance.order_id).only('pk'))
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, created, update_fields, **kwargs):
+    """
+    Reprices the items of an order whose promo code changed.
+
+    Other changes, e.g. of the delivery address, leave the stored prices alone. New
+    orders have no items yet; their totals are computed when the items are added.
+    """
+    changed = getattr(instance, '_loaded_promocode', None) != instance.promocode
+    instance._loaded_promocode = instance.promocode
+    if created or not changed or (update_fields is not None and 'promocode' not in update_fields):
+        return
+    apply_promo(OrderItem.objects.filter(order=instance), get_promo(instance.promocode))
+    update_order_totals([instance])
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, raw, **kwargs):
+    """
+    Updates the suggest index once a product is created, renamed or (un)archived.
+    """
+    if not raw:
+        transaction.on_commit(lambda: suggest.product_changed(instance))
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    """
+    Removes a deleted product from the suggest index.
+    """
+    transaction.on_commit(lambda: suggest.product_changed(instance, deleted=True))
@@ -0,0 +1,170 @@
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from core.versions import bump_version, get_version
+from .models import Product
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_VERSION = 'shop:suggest'
+
+
+def normalize(text: str) -> str:
+    return ' '.join(text.casefold().split())
+
+
+class PrefixIndex:
+    """
+    In-process prefix index over the names of the non-archived products.
+
+    Keeps a sorted list of `(key, pk)` entries, one per word of every name, where the
+    key is the name from that word on. A lookup bisects to the first key starting with
+    the query and walks forward, so "pro" finds "Pro Laptop" and "Laptop Pro".
+
+    Attributes:
+        version (str): The suggest version the index was last synced with.
+    """
+
+    def __init__(self, products=(), version: str = None):
+        self.version = version
+        self.entries = []
+        self.names = {}
+        self.lock = threading.Lock()
+        for pk, name in products:
+            self.names[pk] = name
+            self.entries.extend((key, pk) for key in self.keys(name))
+        self.entries.sort()
+
+    @staticmethod
+    def keys(name: str):
+        words = normalize(name).split(' ')
+        return {' '.join(words[position:]) for position in range(len(words)) if words[position]}
+
+    def add(self, pk: int, name: str):
+        with self.lock:
+            self._remove(pk)
+            self.names[pk] = name
+            for key in self.keys(name):
+                insort(self.entries, (key, pk))
+
+    def remove(self, pk: int):
+        with self.lock:
+            self._remove(pk)
+
+    def _remove(self, pk: int):
+        name = self.names.pop(pk, None)
+        if name is None:
+            return
+        for key in self.keys(name):
+            position = bisect_left(self.entries, (key, pk))
+            if position < len(self.entries) and self.entries[position] == (key, pk):
+                del self.entries[position]
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """
+        Returns the products whose name has a word starting with the query.
+
+        Args:
+            query (str): The typed prefix.
+            limit (int): The maximum number of suggestions.
+
+        Returns:
+            list: Dicts with the `pk` and `name` of the products, in key order.
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        entries, names = self.entries, self.names
+        found = {}
+        position = bisect_left(entries, (prefix,))
+        while position < len(entries) and len(found) < limit:
+            key, pk = entries[position]
+            if not key.startswith(prefix):
+                break
+            if pk in names:
+                found.setdefault(pk, names[pk])
+            position += 1
+        return [{'pk': pk, 'name': name} for pk, name in found.items()]
+
+
+_index = None
+_checked_at = 0.0
+
+
+def build_index() -> PrefixIndex:
+    """
+    Builds the index of this process from the database.
+
+    Called when a worker starts and whenever another process changed the products.
+
+    Returns:
+        PrefixIndex: The new index.
+    """
+    global _index, _checked_at
+    version = get_version(SUGGEST_VERSION)
+    products = Product.objects.filter(is_archived=False).values_list('pk', 'name')
+    _index = PrefixIndex(products.iterator(), version)
+    _checked_at = time.monotonic()
+    logger.info('Built the product suggest index with %s products', len(_index.names))
+    return _index
+
+
+def warm_index():
+    try:
+        build_index()
+    except DatabaseError as exc:
+        logger.debug('Could not build the product suggest index: %s', exc)
+
+
+def get_index() -> PrefixIndex:
+    """
+    Returns the index of this process, resyncing it when other workers changed products.
+
+    The shared version is checked at most every SUGGEST_RESYNC_INTERVAL seconds, so
+    most lookups only touch memory.
+
+    Returns:
+        PrefixIndex: The current index.
+    """
+    global _checked_at
+    if _index is None:
+        return build_index()
+    if time.monotonic() - _checked_at >= getattr(settings, 'SUGGEST_RESYNC_INTERVAL', 1):
+        _checked_at = time.monotonic()
+        if get_version(SUGGEST_VERSION) != _index.version:
+            return build_index()
+    return _index
+
+
+def product_changed(product: Product, deleted: bool = False):
+    """
+    Applies a product change to the local index and tells the other workers to resync.
+
+    Args:
+        product (Product): The saved or deleted product.
+        deleted (bool): True if the product was deleted.
+    """
+    previous = get_version(SUGGEST_VERSION)
+    version = bump_version(SUGGEST_VERSION)
+    if _index is None:
+        return
+    if deleted or product.is_archived:
+        _index.remove(product.pk)
+    else:
+        _index.add(product.pk, product.name)
+    # Changes of other workers since the last sync are not applied incrementally.
+    _index.version = version if _index.version == previous else None
+
+
+def products_changed():
+    """
+    Tells every worker, including this one, to rebuild its index.
+
+    Used after bulk updates such as the admin archive actions, which send no model signals.
+    """
+    bump_version(SUGGEST_VERSION)
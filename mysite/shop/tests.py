@@ -1,3 +1,170 @@
-from django.test import TestCase
+import tempfile
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.db import OperationalError, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import translation
+
+from core.db import is_busy_error
+from jobs.worker import run_job
+from myauth.models import User
+from .checkout import OutOfStock, checkout
+from .jobs import export_csv
+from .models import Order, OrderItem, Product
+from .serializers import OrderSerializer
+
+
+class CheckoutConcurrencyTestCase(TransactionTestCase):
+    """
+    Concurrent checkouts of the same product must never sell more than its stock.
+
+    A checkout that still finds the database busy after its retries is rejected like
+    an out of stock one and its buyer tries again, so the outcome does not depend on
+    how the threads are scheduled.
+    """
+    initial_stock = 50
+    threads = 8
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='buyer')
+        self.product = Product.objects.create(name='Limited', description='', price=10, stock=self.initial_stock)
+
+    def run_buyers(self, quantity: int) -> tuple:
+        errors = []
+        rejections = []
+        barrier = threading.Barrier(self.threads)
+
+        def buyer():
+            try:
+                barrier.wait()
+                while True:
+                    try:
+                        checkout(self.user, 'Address', {self.product.pk: quantity})
+                    except OutOfStock:
+                        return
+                    except OperationalError as error:
+                        if not is_busy_error(error):
+                            raise
+                        rejections.append(error)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=buyer) for _ in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors, rejections
+
+    def sold_units(self) -> int:
+        return sum(OrderItem.objects.filter(product=self.product).values_list('quantity', flat=True))
+
+    def test_single_units_never_oversell(self):
+        errors, rejections = self.run_buyers(quantity=1)
+
+        self.assertEqual(errors, [])
+        self.product.refresh_from_db()
+        self.assertGreaterEqual(self.product.stock, 0)
+        self.assertEqual(self.sold_units() + self.product.stock, self.initial_stock)
+        self.assertEqual(self.product.stock, 0)
+        self.assertEqual(Order.objects.count(), self.initial_stock)
+
+    def test_partial_quantities_never_oversell(self):
+        errors, rejections = self.run_buyers(quantity=3)
+
+        self.assertEqual(errors, [])
+        self.product.refresh_from_db()
+        self.assertGreaterEqual(self.product.stock, 0)
+        self.assertEqual(self.sold_units() + self.product.stock, self.initial_stock)
+        self.assertLess(self.product.stock, 3)
+        self.assertEqual(Order.objects.count(), self.initial_stock // 3)
+
+
+class CheckoutCommitHooksTestCase(TransactionTestCase):
+    """
+    A failing post-commit hook must neither fail nor repeat a committed checkout.
+    """
+    def test_failing_hook_is_logged(self):
+        user = User.objects.create_user(username='buyer')
+        product = Product.objects.create(name='Product', description='', price=10, stock=10)
+
+        with mock.patch('shop.checkout.record_sales', side_effect=OperationalError('database is locked')), \
+                self.assertLogs('django.db.backends.base', 'ERROR'):
+            order = checkout(user, 'Address', {product.pk: 2})
+
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 8)
+        self.assertEqual(list(Order.objects.values_list('pk', flat=True)), [order.pk])
+
+
+class ExportCSVTestCase(TestCase):
+    """
+    The download link stored by an export job leads to the exported file.
+    """
+    def setUp(self):
+        exports_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(exports_dir.cleanup)
+        storages_setting = {**settings.STORAGES, 'exports': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+            'OPTIONS': {'location': exports_dir.name},
+        }}
+        self.enterContext(override_settings(STORAGES=storages_setting))
+        self.user = User.objects.create_user(username='manager', is_staff=True)
+
+    def test_stored_link_downloads_export(self):
+        product = Product.objects.create(name='Exported', description='', price=10)
+        job = export_csv.enqueue('shop.product', [product.pk], user=self.user)
+
+        # Run the job like a worker does, outside of any request language.
+        with translation.override(None):
+            run_job(job)
+        job.refresh_from_db()
+
+        self.client.force_login(self.user)
+        response = self.client.get(job.result['url'])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Exported', b''.join(response.streaming_content))
+
+
+class OrderAPISparseFieldsetsTestCase(TestCase):
+    """
+    Orders are rendered in full without sparse fieldset parameters and trimmed with them.
+    """
+    url = '/en/api/orders/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser(username='admin')
+        products = [Product.objects.create(name=f'Product {i}', description='', price=10, stock=10)
+                    for i in range(3)]
+        for product in products:
+            checkout(cls.user, 'Address', {product.pk: 1, products[0].pk: 2})
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_full_list_prefetches_relations(self):
+        # Session, user, count, orders, products and items.
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url, HTTP_ACCEPT='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results'][0]), len(OrderSerializer.Meta.fields))
+
+    def test_excluded_relations_are_not_prefetched(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'exclude': 'products,items'}, HTTP_ACCEPT='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('products', response.json()['results'][0])
+
+    def test_unknown_excluded_fields_are_rejected(self):
+        response = self.client.get(self.url, {'exclude': 'nonexistent'}, HTTP_ACCEPT='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'exclude': ['Unknown fields: nonexistent.']})
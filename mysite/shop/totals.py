@@ -0,0 +1,103 @@
+from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db.models import OuterRef, Subquery
+
+from .models import Order, OrderItem, Product
+
+TOTAL_FIELDS = ['subtotal', 'discount_total', 'total', 'item_count']
+CENT = Decimal('0.01')
+
+
+def compute_totals(lines) -> dict:
+    """
+    Computes the totals of an order from its lines.
+
+    The product discount is applied first; the promo code discount of the line then
+    discounts the remaining price.
+
+    Args:
+        lines (Iterable[tuple]): (quantity, unit_price, discount percent, promo discount percent) tuples.
+
+    Returns:
+        dict: The subtotal, discount_total, total and item_count.
+    """
+    subtotal = discount = Decimal(0)
+    item_count = 0
+    for quantity, unit_price, product_discount, promo_discount in lines:
+        amount = unit_price * quantity
+        line_discount = amount * Decimal(product_discount) / 100
+        line_discount += (amount - line_discount) * Decimal(promo_discount) / 100
+        subtotal += amount
+        discount += line_discount
+        item_count += quantity
+
+    subtotal = subtotal.quantize(CENT, ROUND_HALF_UP)
+    discount = discount.quantize(CENT, ROUND_HALF_UP)
+    return {
+        'subtotal': subtotal,
+        'discount_total': discount,
+        'total': subtotal - discount,
+        'item_count': item_count,
+    }
+
+
+def update_order_totals(orders):
+    """
+    Recomputes and stores the totals of the given orders.
+
+    Only the prices and discounts stored on the items are used, so later changes of
+    product discounts or promo codes never alter placed orders. The lines of all
+    orders are read with one query and the orders written with one `bulk_update`,
+    which does not send model signals. The instances are updated in place.
+
+    Args:
+        orders (Iterable[Order]): The orders; only `pk` needs to be loaded.
+    """
+    orders = list(orders)
+    if not orders:
+        return
+
+    lines = defaultdict(list)
+    rows = (
+        OrderItem.objects
+        .filter(order__in=orders)
+        .values_list('order_id', 'quantity', 'unit_price', 'discount', 'promo_discount')
+    )
+    for order_id, *line in rows:
+        lines[order_id].append(line)
+
+    for order in orders:
+        for field, value in compute_totals(lines[order.pk]).items():
+            setattr(order, field, value)
+    Order.objects.bulk_update(orders, TOTAL_FIELDS)
+
+
+def price_items(items, promo=None):
+    """
+    Stores the current product discounts and the promo code discount on order items.
+
+    Used for items added outside of the checkout service, e.g. in the admin.
+
+    Args:
+        items (QuerySet): The order items to price.
+        promo (ActivePromo): The promo code of their order.
+    """
+    items.update(discount=Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('discount')[:1]))
+    apply_promo(items, promo)
+
+
+def apply_promo(items, promo=None):
+    """
+    Stores the discount of a promo code on the order items in its scope.
+
+    Args:
+        items (QuerySet): The order items.
+        promo (ActivePromo): The promo code, None to remove the promo code discount.
+    """
+    items.update(promo_discount=0)
+    if promo is None:
+        return
+    if promo.product_ids:
+        items = items.filter(product__in=promo.product_ids)
+    items.update(promo_discount=promo.discount_percent)
@@ -20,7 +20,8 @@ from .views import (index,
                     GroupDeleteView,
                     ProductSetView,
                     OrderSetView,
-                    ProductsDataExportView,)
+                    ProductsDataExportView,
+                    ExportDownloadView,)
 
 routers = DefaultRouter()
 
@@ -30,12 +31,13 @@ routers.register('orders', OrderSetView)
 
 urlpatterns = [
     path('', index, name='index'),
-    path('api', include(routers.urls)),
+    path('api/', include(routers.urls)),
     path('products/', ProductListView.as_view(), name='products'),
     path('orders/', OrderListView.as_view(), name='orders'),
     path('groups/', GroupListView.as_view(), name='groups'),
     path('product/<int:pk>/', ProductDetailsView.as_view(), name='product_details'),
     path('products/export/', ProductsDataExportView.as_view(), name='products-export'),
+    path('exports/<int:pk>/', ExportDownloadView.as_view(), name='export_download'),
     path('order/<int:pk>/', OrderDetailsView.as_view(), name='order_details'),
     path('group/<int:pk>/', GroupDetailsView.as_view(), name='group_details'),
     path('create-product/', ProductCreateView.as_view(), name='create_product'),
@@ -1,8 +1,11 @@
 import logging
 
 from django.contrib.auth.models import Group
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
-from django.shortcuts import render, reverse, redirect
+from django.core.exceptions import ValidationError
+from django.core.files.storage import storages
+from django.db.models import F, Prefetch
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
+from django.shortcuts import get_object_or_404, render, reverse, redirect
 from timeit import default_timer
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.urls import reverse_lazy
@@ -11,11 +14,29 @@ from django.views import View
 from django.views.generic import (ListView, DetailView, DeleteView, UpdateView, CreateView)
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from .models import Product, Order
-from .forms import GroupForm
-from .serializers import ProductSerializer, OrderSerializer
+from apiapp.fieldsets import SparseFieldsetsViewMixin, sparse_fieldsets_schema
+from apiapp.response_cache import CachedResponseMixin
+from core.db import retry_on_busy
+from jobs.models import Job
+from jobs.views import accepted
+from myauth.permissions import invalidate_group_permissions
+from .models import Product, Order, RelatedProduct
+from . import leaderboard
+from .checkout import OutOfStock, checkout
+from .filters import ProductFilterSet
+from .forms import GroupForm, OrderForm, OrderUpdateForm
+from .jobs import export_csv, export_products
+from .serializers import (ProductSerializer, ProductSuggestionSerializer, RelatedProductSerializer,
+                          TopSellerSerializer, OrderSerializer)
+from .suggest import get_index as get_suggest_index
+
+SUGGEST_MAX_LIMIT = 20
 
 logger = logging.getLogger(__name__)
 
@@ -42,22 +63,31 @@ def index(request: HttpRequest) -> HttpResponse:
     return render(request, 'shop/index.html', context)
 
 
-class ProductSetView(ModelViewSet):
+@sparse_fieldsets_schema()
+class ProductSetView(CachedResponseMixin, SparseFieldsetsViewMixin, ModelViewSet):
     """
     A view set for interacting with the product resource.
 
     This view set provides CRUD (Create, Retrieve, Update, Delete) operations
     for the product resource. It supports listing all products, creating a new product,
     retrieving a specific product by ID, updating an existing product, and deleting a product.
+    Reads accept `?fields=` and `?exclude=`, which also restrict the columns loaded from the database.
+    Products can be filtered by price ranges and sorted by the stored `effective_price`.
+    Rendered JSON lists and details are served from the response cache until a product changes.
+    `suggest/?q=` serves typeahead suggestions from memory, `<pk>/related/` the
+    products frequently bought together and `top-sellers/?window=` the best sellers.
 
     Attributes:
         queryset (QuerySet): The queryset representing all products in the database.
         serializer_class (Serializer): The serializer class used to serialize/deserialize
             product instances.
+        throttle_scope (str): The rate limit shared by the product routes.
+        filterset_class (FilterSet): The filters, including the effective price ranges.
     """
 
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
+    throttle_scope = 'products'
 
     filter_backends = [
         SearchFilter,
@@ -66,34 +96,92 @@ class ProductSetView(ModelViewSet):
     ]
 
     search_fields = ["name", "description", ]
-    filterset_fields = [
-        "name",
-        "description",
-        "price",
-        "discount",
-        "is_archived"
-    ]
+    filterset_class = ProductFilterSet
     ordering_fields = [
         "name",
         "price",
         "discount",
+        "effective_price",
     ]
 
-
-class OrderSetView(ModelViewSet):
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', str, description='The typed prefix of a word of the product name.'),
+            OpenApiParameter('limit', int, description=f'The number of suggestions, at most {SUGGEST_MAX_LIMIT}.'),
+        ],
+        responses=ProductSuggestionSerializer(many=True),
+    )
+    @action(detail=False, methods=['get'], authentication_classes=[], filter_backends=[], pagination_class=None,
+            throttle_scope='suggest')
+    def suggest(self, request):
+        """
+        Returns typeahead suggestions from the in-process prefix index, without a database query.
+        """
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), SUGGEST_MAX_LIMIT)
+        except ValueError:
+            limit = 10
+        return Response(get_suggest_index().search(request.query_params.get('q', ''), max(limit, 1)))
+
+    @extend_schema(responses=RelatedProductSerializer(many=True))
+    @action(detail=True, methods=['get'], filter_backends=[], pagination_class=None)
+    def related(self, request, pk=None):
+        """
+        Returns the products most often bought together with this product.
+
+        Served from the precomputed top neighbours with one indexed query.
+        """
+        related = (
+            RelatedProduct.objects
+            .filter(product_id=pk, related__is_archived=False)
+            .order_by('rank')
+            .values('score', pk=F('related_id'), name=F('related__name'),
+                    price=F('related__price'), effective_price=F('related__effective_price'))
+        )
+        return Response(RelatedProductSerializer(related, many=True).data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('window', str, enum=list(leaderboard.WINDOWS),
+                             description=f'The sales window, defaults to `{leaderboard.DEFAULT_WINDOW}`.'),
+            OpenApiParameter('limit', int, description='The number of products, at most `LEADERBOARD_MAX_LIMIT`.'),
+        ],
+        responses=TopSellerSerializer(many=True),
+    )
+    @action(detail=False, methods=['get'], url_path='top-sellers', filter_backends=[], pagination_class=None)
+    def top_sellers(self, request):
+        """
+        Returns the best-selling products of the last 24 hours, 7 days or 30 days.
+
+        Summed from the precomputed sales buckets and cached in-process.
+        """
+        window = request.query_params.get('window', leaderboard.DEFAULT_WINDOW)
+        if window not in leaderboard.WINDOWS:
+            raise DRFValidationError({'window': f'Choose one of {", ".join(leaderboard.WINDOWS)}.'})
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), leaderboard.max_limit())
+        except ValueError:
+            limit = 10
+        return Response(TopSellerSerializer(leaderboard.top_sellers(window, max(limit, 1)), many=True).data)
+
+
+@sparse_fieldsets_schema()
+class OrderSetView(SparseFieldsetsViewMixin, ModelViewSet):
     """
     A view set for interacting with the order resource.
 
     This view set provides CRUD (Create, Retrieve, Update, Delete) operations
     for the order resource. It supports listing all orders, creating a new order,
     retrieving a specific order by ID, updating an existing order, and deleting an order.
+    Reads accept `?fields=` and `?exclude=`; the products are only prefetched when rendered.
+    Orders can be filtered and sorted by the stored `total` and `item_count`.
 
     Attributes:
         queryset (QuerySet): The queryset representing all orders in the database.
         serializer_class (Serializer): The serializer class used to serialize/deserialize
             order instances.
     """
-    queryset = Order.objects.all()
+    queryset = Order.objects.prefetch_related(Prefetch('products', queryset=Product.objects.only('pk')), 'items')
     serializer_class = OrderSerializer
 
     filter_backends = [
@@ -105,17 +193,29 @@ class OrderSetView(ModelViewSet):
         "delivery_address", 'user'
     ]
 
-    filterset_fields = [
-        'delivery_address',
-        'promocode',
-        'user'
-    ]
+    filterset_fields = {
+        'delivery_address': ['exact'],
+        'promocode': ['exact'],
+        'user': ['exact'],
+        'total': ['exact', 'gte', 'lte'],
+        'item_count': ['exact', 'gte', 'lte'],
+    }
 
     ordering_fields = [
         'created_at',
-        'user'
+        'user',
+        'total',
+        'item_count',
     ]
 
+    @retry_on_busy
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+
+    @retry_on_busy
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+
 class ProductListView(LoginRequiredMixin, ListView):
     """
     View for listing all products.
@@ -139,11 +239,11 @@ class OrderListView(LoginRequiredMixin, ListView):
 
     Attributes:
         template_name (str): The name of the template used to render the view.
-        model (Model): The model associated with this view (Order).
+        queryset (QuerySet): The orders, with the users who placed them.
         context_object_name (str): The variable name used in the template to access the list of orders.
     """
     template_name = 'shop/order-list.html'
-    model = Order
+    queryset = Order.objects.select_related('user')
     context_object_name = 'orders'
 
 class GroupListView(LoginRequiredMixin, ListView):
@@ -166,6 +266,7 @@ class GroupListView(LoginRequiredMixin, ListView):
         form = GroupForm(request.POST)
         if form.is_valid():
             form.save()
+            invalidate_group_permissions()
 
             return redirect(request.path)
 
@@ -194,11 +295,11 @@ class OrderDetailsView(LoginRequiredMixin, DetailView):
 
     Attributes:
         template_name (str): The name of the template used to render the view.
-        model (Model): The model associated with this view (Order).
+        queryset (QuerySet): The orders with their user and items.
         context_object_name (str): The variable name used in the template to access the order object.
     """
     template_name = 'shop/order-details.html'
-    model = Order
+    queryset = Order.objects.select_related('user').prefetch_related('items__product')
     context_object_name = 'order'
 
 
@@ -236,28 +337,58 @@ class ProductCreateView(UserPassesTestMixin, LoginRequiredMixin, CreateView):
 
     template_name = 'shop/create-product.html'
     model = Product
-    fields = 'name', 'description', 'price', 'discount'
+    fields = 'name', 'description', 'price', 'discount', 'stock'
     success_url = reverse_lazy('products')
 
 
 
-class OrderCreateView(LoginRequiredMixin, CreateView):
+class OrderSaveMixin:
+    """
+    Mixin for the order form views saving the order in a retried transaction.
+
+    Products running out of stock and promo codes used up between validation and
+    saving are reported on the form.
+    """
+    def form_valid(self, form):
+        try:
+            return self.save_order(form)
+        except OutOfStock as error:
+            form.add_error('products', error)
+        except ValidationError as error:
+            form.add_error('promocode', error)
+        return self.form_invalid(form)
+
+    @retry_on_busy
+    def save_order(self, form):
+        return super().form_valid(form)
+
+
+class OrderCreateView(OrderSaveMixin, LoginRequiredMixin, CreateView):
     """
     View for creating a new order.
 
-    This view allows authenticated users to create new orders.
+    This view allows authenticated users to create new orders. The order is placed
+    with the checkout service, which reserves one unit of every selected product.
 
     Attributes:
         template_name (str): The name of the template used to render the view.
         model (Model): The model associated with this view (Order).
-        fields (tuple): The fields of the model to be included in the form.
+        form_class (Form): The form validating the order and its promo code.
         success_url (str): The URL to redirect to after successfully creating the order.
     """
     template_name = 'shop/create-order.html'
     model = Order
-    fields = 'delivery_address', 'promocode', 'user', 'products'
+    form_class = OrderForm
     success_url = reverse_lazy('orders')
 
+    def save_order(self, form):
+        self.object = checkout(
+            user=form.cleaned_data['user'],
+            delivery_address=form.cleaned_data['delivery_address'],
+            quantities={product.pk: 1 for product in form.cleaned_data['products']},
+            promo=form.promo,
+        )
+        return HttpResponseRedirect(self.get_success_url())
 
 
 class GroupCreateView(UserPassesTestMixin, LoginRequiredMixin, CreateView):
@@ -280,6 +411,11 @@ class GroupCreateView(UserPassesTestMixin, LoginRequiredMixin, CreateView):
     fields = 'name', 'permissions'
     success_url = reverse_lazy('groups')
 
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        invalidate_group_permissions()
+        return response
+
 
 class ProductUpdateView(UserPassesTestMixin, LoginRequiredMixin, UpdateView):
     """
@@ -296,11 +432,11 @@ class ProductUpdateView(UserPassesTestMixin, LoginRequiredMixin, UpdateView):
         return self.request.user.is_superuser
 
     model = Product
-    fields = 'name', 'description', 'price', 'discount'
+    fields = 'name', 'description', 'price', 'discount', 'stock'
     template_name_suffix = '_update_form'
 
 
-class OrderUpdateView(UserPassesTestMixin, LoginRequiredMixin, UpdateView):
+class OrderUpdateView(OrderSaveMixin, UserPassesTestMixin, LoginRequiredMixin, UpdateView):
     """
     View for updating an existing order.
 
@@ -308,14 +444,14 @@ class OrderUpdateView(UserPassesTestMixin, LoginRequiredMixin, UpdateView):
 
     Attributes:
         model (Model): The model associated with this view (Order).
-        fields (tuple): The fields of the model to be included in the form.
+        form_class (Form): The form validating the order and its promo code.
         template_name_suffix (str): The suffix to append to the template name.
     """
     def test_func(self):
         return self.request.user.is_superuser
 
     model = Order
-    fields = 'delivery_address', 'promocode', 'products'
+    form_class = OrderUpdateForm
     template_name_suffix = '_update_form'
 
 
@@ -338,6 +474,11 @@ class GroupUpdateView(UserPassesTestMixin, LoginRequiredMixin, UpdateView):
     fields = 'name', 'permissions'
     template_name = 'shop/group_update_form.html'
 
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        invalidate_group_permissions()
+        return response
+
 
 
 class ProductDeleteView(UserPassesTestMixin, LoginRequiredMixin, DeleteView):
@@ -418,19 +559,35 @@ class GroupDeleteView(UserPassesTestMixin, LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy('groups')
     template_name = 'shop/group_confirm_delete.html'
 
-class ProductsDataExportView(View):
-    def get(self, request: HttpRequest) -> JsonResponse:
-        products = Product.objects.order_by("pk").all()
-        products_data = [
-            {
-                "pk": product.pk,
-                "name": product.name,
-                "price": product.price,
-                "is_archived": product.is_archived,
-            }
-            for product in products
-        ]
-        elem = products_data[0]
-        name = elem['nafdsjfhime']
-        print(name)
-        return JsonResponse({"products": products_data})
\ No newline at end of file
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        invalidate_group_permissions()
+        return response
+
+class ProductsDataExportView(UserPassesTestMixin, LoginRequiredMixin, View):
+    """
+    View for exporting all products.
+
+    Staff users start the export with a POST. It runs in a background job; the 202
+    response points to the job, whose result holds the products once it succeeded.
+    """
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        return accepted(export_products.enqueue(user=request.user))
+
+
+class ExportDownloadView(LoginRequiredMixin, View):
+    """
+    View for downloading the CSV file of a finished export job.
+
+    The files are kept in the private `exports` storage. Only the user who started
+    the export and staff users may download it.
+    """
+    def get(self, request: HttpRequest, pk: int) -> FileResponse:
+        job = get_object_or_404(Job, pk=pk, name=export_csv.job_name, status=Job.STATUS_SUCCEEDED)
+        if not request.user.is_staff and job.created_by_id != request.user.pk:
+            raise Http404
+        name = job.result['file']
+        return FileResponse(storages['exports'].open(name), as_attachment=True, filename=name)
\ No newline at end of file